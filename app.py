@@ -1,7 +1,9 @@
 """Main Streamlit application for Power & Gas Trader Shift Handover."""
 import streamlit as st
 import os
+import logging
 from datetime import datetime
+from src.backend.database.backup import BackupScheduler
 from src.backend.database.db_manager import DatabaseManager
 from src.frontend.pages import (
     dashboard,
@@ -10,7 +12,10 @@ from src.frontend.pages import (
     operations,
     issues_alerts,
     market,
-    comments
+    comments,
+    export,
+    performance,
+    search
 )
 from src.utils.helpers import get_current_shift_time
 
@@ -23,15 +28,38 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
 # Initialize database
 @st.cache_resource
 def init_db():
     """Initialize database connection."""
     db_path = os.getenv('DB_PATH', 'shift_handover.db')
-    return DatabaseManager(db_path=db_path)
+    pool_size = int(os.getenv('DB_POOL_SIZE', '4'))
+    profile = os.getenv('DB_PROFILE', 'balanced')
+    cache_mb = int(os.getenv('DB_CACHE_MB', '64'))
+    group_commit_ms = os.getenv('DB_GROUP_COMMIT_MS')
+    slow_query_ms = os.getenv('DB_SLOW_QUERY_MS')
+    return DatabaseManager(db_path=db_path, pool_size=pool_size, profile=profile,
+                           cache_bytes=cache_mb * 1024 * 1024,
+                           group_commit_window=float(group_commit_ms) / 1000 if group_commit_ms else None,
+                           slow_query_ms=float(slow_query_ms) if slow_query_ms else None)
 
 db = init_db()
 
+
+@st.cache_resource
+def start_backups():
+    """Start scheduled online backups when DB_BACKUP_DIR is set."""
+    backup_dir = os.getenv('DB_BACKUP_DIR')
+    if not backup_dir:
+        return None
+    interval_hours = float(os.getenv('DB_BACKUP_INTERVAL_HOURS', '24'))
+    keep = int(os.getenv('DB_BACKUP_KEEP', '7'))
+    return BackupScheduler(db.db_path, backup_dir, interval_hours * 3600, keep=keep).start()
+
+backups = start_backups()
+
 # Custom CSS for better styling
 st.markdown("""
     <style>
@@ -58,6 +86,12 @@ with st.sidebar:
     st.markdown(f"**Current Time:** {get_current_shift_time()}")
     st.markdown("---")
     
+    search_query = st.text_input(
+        "🔍 Search everything",
+        placeholder="e.g. terminal outage",
+        help="Searches notes, messages, descriptions and comments in every section"
+    )
+    
     page = st.radio(
         "Navigation",
         [
@@ -67,7 +101,9 @@ with st.sidebar:
             "🏭 Operations",
             "🚨 Issues & Alerts",
             "📈 Market Activity",
-            "💬 Comments"
+            "💬 Comments",
+            "📦 Export",
+            "⏱️ Performance"
         ],
         label_visibility="collapsed"
     )
@@ -77,7 +113,9 @@ with st.sidebar:
     st.info("Power & Gas Trader Shift Handover System - Track and manage shift information efficiently.")
 
 # Main content area
-if page == "📊 Dashboard":
+if search_query.strip():
+    search.show(db, search_query)
+elif page == "📊 Dashboard":
     dashboard.show(db)
 elif page == "📝 Handover Log":
     handover_log.show(db)
@@ -91,3 +129,7 @@ elif page == "📈 Market Activity":
     market.show(db)
 elif page == "💬 Comments":
     comments.show(db)
+elif page == "📦 Export":
+    export.show(db)
+elif page == "⏱️ Performance":
+    performance.show(db)
@@ -0,0 +1,371 @@
+"""Hot/archive tiering for shift data.
+
+Rows whose shift is older than a horizon are moved out of the hot tables
+into one SQLite file per year. The files are listed in the ``archive_files``
+table of the hot database. Every read connection attaches them read-only
+(immutable once a year is sealed) and gets a temporary ``<table>_history``
+view that unions the hot table with every archive, so history queries see
+all rows while the tables the pages scan stay small.
+
+Archive passes usually run in a separate process. Every change of
+``archive_files`` bumps ``archive_state.generation``; read connections
+compare it on checkout and re-attach when it has moved. Archived rows keep
+their full-text search entries until their year is purged.
+
+Run an archive pass from the command line::
+
+    python -m src.backend.database.archive --db shift_handover.db --horizon-days 90
+"""
+import argparse
+import logging
+import os
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from src.backend.database.connection_pool import database_uri
+from src.backend.database.search import SEARCH_CODES, index_rowid
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HORIZON_DAYS = 90
+DEFAULT_RETENTION_YEARS = 7
+# SQLite attaches at most 10 databases by default
+MAX_ATTACHED = 10
+
+_WRITE_ALIAS = 'archive_write'
+
+
+def archive_alias(year: int) -> str:
+    """Schema name an archive year is attached under on read connections."""
+    return f"archive_{int(year)}"
+
+
+def history_view(table: str) -> str:
+    """Name of the view that unions a hot table with its archives."""
+    return f"{table}_history"
+
+
+def attach_archives(conn: sqlite3.Connection, tables: Dict[str, Sequence[str]]):
+    """Attach registered archive files and create the history views.
+
+    Used as the pool's reader initializer. Sealed years are attached as
+    immutable, which skips file locking; the current year read-only. The
+    registry generation attached is kept in the temp table
+    ``archive_attached`` for refresh_archives().
+
+    Args:
+        conn: New read connection
+        tables: Columns of each archived table
+    """
+    try:
+        # Read before the registry, so a change in between is seen later
+        generation = conn.execute("SELECT generation FROM archive_state WHERE id = 1").fetchone()[0]
+        archives = conn.execute(
+            "SELECT year, path, sealed FROM archive_files ORDER BY year DESC"
+        ).fetchall()
+    except sqlite3.OperationalError:
+        # Schema not migrated yet
+        generation, archives = None, []
+    if generation is not None:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS archive_attached (id INTEGER PRIMARY KEY, generation INTEGER)")
+        conn.execute("INSERT OR REPLACE INTO temp.archive_attached (id, generation) VALUES (1, ?)", (generation,))
+
+    aliases = []
+    for year, path, sealed in archives[:MAX_ATTACHED]:
+        options = {'mode': 'ro', 'immutable': '1'} if sealed else {'mode': 'ro'}
+        try:
+            conn.execute(f"ATTACH DATABASE ? AS {archive_alias(year)}", (database_uri(path, **options),))
+        except sqlite3.OperationalError as e:
+            logger.warning("Could not attach archive %s (%s): %s", year, path, e)
+            continue
+        aliases.append(archive_alias(year))
+    if len(archives) > MAX_ATTACHED:
+        logger.warning("Only the newest %s of %s archive years are attached", MAX_ATTACHED, len(archives))
+
+    for table, columns in tables.items():
+        column_list = ', '.join(columns)
+        selects = [f"SELECT {column_list} FROM main.{table}"]
+        selects += [f"SELECT {column_list} FROM {alias}.{table}" for alias in aliases]
+        conn.execute(f"CREATE TEMP VIEW IF NOT EXISTS {history_view(table)} AS {' UNION ALL '.join(selects)}")
+
+
+def refresh_archives(conn: sqlite3.Connection, tables: Dict[str, Sequence[str]]) -> bool:
+    """Re-attach archives if the registry changed since conn attached them.
+
+    Called on every read checkout; when nothing changed it costs one rowid
+    lookup.
+
+    Args:
+        conn: Read connection set up by attach_archives()
+        tables: Columns of each archived table
+
+    Returns:
+        Whether the archives were re-attached
+    """
+    try:
+        changed = conn.execute(
+            "SELECT 1 FROM main.archive_state "
+            "WHERE id = 1 AND generation != (SELECT generation FROM temp.archive_attached WHERE id = 1)"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # Opened before the schema was migrated
+        return False
+    if changed is None:
+        return False
+    for table in tables:
+        conn.execute(f"DROP VIEW IF EXISTS temp.{history_view(table)}")
+    for _, name, _ in conn.execute("PRAGMA database_list").fetchall():
+        if name.startswith('archive_'):
+            conn.execute(f"DETACH DATABASE {name}")
+    attach_archives(conn, tables)
+    logger.info("Re-attached archives after a registry change")
+    return True
+
+
+class Archiver:
+    """Moves old shifts from the hot tables into per-year archive files."""
+
+    def __init__(
+        self,
+        db,
+        archive_dir: Optional[str] = None,
+        horizon_days: int = DEFAULT_HORIZON_DAYS,
+        retention_years: int = DEFAULT_RETENTION_YEARS,
+        batch_size: int = 1000,
+        pause: float = 0.01,
+    ):
+        """Initialize archiver.
+
+        Args:
+            db: DatabaseManager of the hot database
+            archive_dir: Directory for archive files; defaults to an
+                ``archive`` directory next to the database
+            horizon_days: Shifts older than this many days are archived
+            retention_years: Archive years older than this are purged
+            batch_size: Rows moved per transaction
+            pause: Seconds to sleep between batches
+        """
+        from src.backend.database.db_manager import READ_COLUMNS
+
+        self.db = db
+        self.tables = READ_COLUMNS
+        self.archive_dir = archive_dir or os.path.join(os.path.dirname(os.path.abspath(db.db_path)), 'archive')
+        self.horizon_days = horizon_days
+        self.retention_years = retention_years
+        self.batch_size = batch_size
+        self.pause = pause
+
+    def archive_path(self, year: int) -> str:
+        """Path of the archive file for a year."""
+        stem = os.path.splitext(os.path.basename(self.db.db_path))[0]
+        return os.path.join(self.archive_dir, f"{stem}_{int(year)}.db")
+
+    def cutoff(self, today: Optional[date] = None) -> date:
+        """First shift date that stays in the hot tables."""
+        return (today or date.today()) - timedelta(days=self.horizon_days)
+
+    def registry(self) -> Dict[int, sqlite3.Row]:
+        """Get the registered archive files by year."""
+        with self.db.get_connection() as conn:
+            return {row['year']: row for row in conn.execute("SELECT * FROM archive_files")}
+
+    def run(self, today: Optional[date] = None) -> Dict[int, int]:
+        """Move every shift older than the horizon into its year's archive.
+
+        Years that end before the cutoff are sealed afterwards. A sealed
+        file is never written again, so rows later back-dated into a
+        sealed year stay in the hot tables.
+
+        Args:
+            today: Reference date, for tests
+
+        Returns:
+            Rows moved per year
+        """
+        cutoff = self.cutoff(today).isoformat()
+        registry = self.registry()
+        moved: Dict[int, int] = {}
+        for year in self._years_before(cutoff):
+            if year in registry and registry[year]['sealed']:
+                logger.warning("Archive %s is sealed; leaving its back-dated rows in the hot tables", year)
+                continue
+            end = min(cutoff, f"{year + 1:04d}-01-01")
+            count = self._move_year(year, f"{year:04d}-01-01", end)
+            sealed = end < cutoff
+            self._register(year, count, sealed)
+            moved[year] = count
+            logger.info("Archived %s rows from %s%s", count, year, " and sealed it" if sealed else "")
+        if moved:
+            # Read connections of this process re-attach at once; other
+            # processes see the registry generation change
+            self.db.pool.recycle()
+        return moved
+
+    def purge(self, today: Optional[date] = None) -> List[int]:
+        """Delete archive years that are past the retention period.
+
+        Returns:
+            Years removed
+        """
+        first_kept = (today or date.today()).year - self.retention_years
+        expired = [year for year in self.registry() if year < first_kept]
+        if not expired:
+            return []
+        with self.db.get_connection(write=True) as conn:
+            for year in expired:
+                if os.path.exists(self.archive_path(year)):
+                    with self._attached(conn, year):
+                        # The year's rows leave the search results with it
+                        for table in self.tables:
+                            if table in SEARCH_CODES:
+                                conn.execute(
+                                    f"DELETE FROM main.search_index WHERE rowid IN "
+                                    f"(SELECT {index_rowid(table, 'id')} FROM {_WRITE_ALIAS}.{table})"
+                                )
+                        conn.commit()
+            conn.executemany("DELETE FROM archive_files WHERE year = ?", [(year,) for year in expired])
+            conn.commit()
+        self.db.pool.recycle()
+        for year in expired:
+            path = self.archive_path(year)
+            if os.path.exists(path):
+                os.remove(path)
+            logger.info("Purged archive %s", year)
+        return expired
+
+    def _years_before(self, cutoff: str) -> List[int]:
+        """Years that have hot rows older than the cutoff."""
+        years = set()
+        with self.db.get_connection() as conn:
+            for table in self.tables:
+                years.update(int(row[0]) for row in conn.execute(
+                    f"SELECT DISTINCT substr(shift_date, 1, 4) FROM {table} WHERE shift_date < ?", (cutoff,)
+                ))
+        return sorted(years)
+
+    @contextmanager
+    def _attached(self, conn: sqlite3.Connection, year: int) -> Iterator[None]:
+        """Attach a year's archive file for writing on the write connection."""
+        conn.execute(f"ATTACH DATABASE ? AS {_WRITE_ALIAS}", (database_uri(self.archive_path(year)),))
+        try:
+            yield
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.execute(f"DETACH DATABASE {_WRITE_ALIAS}")
+
+    def _create_tables(self, conn: sqlite3.Connection):
+        """Create archive tables with the same definitions as the hot tables."""
+        for table in self.tables:
+            sql = conn.execute(
+                "SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()[0]
+            conn.execute(re.sub(
+                rf'^CREATE TABLE\s+"?{table}"?', f'CREATE TABLE IF NOT EXISTS {_WRITE_ALIAS}.{table}', sql
+            ))
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {_WRITE_ALIAS}.idx_{table}_shift_date_created "
+                f"ON {table}(shift_date, created_at)"
+            )
+
+    def _move_year(self, year: int, start: str, end: str) -> int:
+        """Move rows with start <= shift_date < end in small batches.
+
+        Each batch copies rows to the archive and deletes them from the
+        hot table in one transaction and releases the write connection,
+        so application writes can interleave. Copies use INSERT OR REPLACE
+        so a batch interrupted between the two files is safe to repeat.
+
+        The hot table's delete trigger drops the rows' search entries; they
+        are put back, so archived shifts can still be searched.
+        """
+        os.makedirs(self.archive_dir, exist_ok=True)
+        with self.db.get_connection(write=True) as conn:
+            with self._attached(conn, year):
+                self._create_tables(conn)
+                conn.commit()
+
+        moved = 0
+        for table, columns in self.tables.items():
+            column_list = ', '.join(columns)
+            while True:
+                with self.db.get_connection(write=True) as conn:
+                    with self._attached(conn, year):
+                        conn.execute("BEGIN IMMEDIATE")
+                        ids = [row[0] for row in conn.execute(
+                            f"SELECT id FROM main.{table} WHERE shift_date >= ? AND shift_date < ? LIMIT ?",
+                            (start, end, self.batch_size)
+                        )]
+                        if ids:
+                            marks = ', '.join('?' for _ in ids)
+                            conn.execute(
+                                f"""INSERT OR REPLACE INTO {_WRITE_ALIAS}.{table} ({column_list})
+                                    SELECT {column_list} FROM main.{table} WHERE id IN ({marks})""",
+                                ids
+                            )
+                            entries = []
+                            if table in SEARCH_CODES:
+                                entries = conn.execute(
+                                    f"""SELECT rowid, source, row_id, shift_date, title, body
+                                        FROM main.search_index WHERE rowid IN ({marks})""",
+                                    [index_rowid(table, row_id) for row_id in ids]
+                                ).fetchall()
+                            conn.execute(f"DELETE FROM main.{table} WHERE id IN ({marks})", ids)
+                            conn.executemany(
+                                """INSERT INTO main.search_index (rowid, source, row_id, shift_date, title, body)
+                                   VALUES (?, ?, ?, ?, ?, ?)""",
+                                [tuple(entry) for entry in entries]
+                            )
+                        conn.commit()
+                moved += len(ids)
+                if len(ids) < self.batch_size:
+                    break
+                time.sleep(self.pause)
+        return moved
+
+    def _register(self, year: int, count: int, sealed: bool):
+        """Record an archive file and the rows added to it."""
+        with self.db.get_connection(write=True) as conn:
+            conn.execute(
+                """INSERT INTO archive_files (year, path, sealed, row_count) VALUES (?, ?, ?, ?)
+                   ON CONFLICT(year) DO UPDATE SET
+                       path = excluded.path,
+                       sealed = excluded.sealed,
+                       row_count = row_count + excluded.row_count,
+                       updated_at = CURRENT_TIMESTAMP""",
+                (year, self.archive_path(year), sealed, count)
+            )
+            conn.commit()
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Run an archive pass and purge expired years."""
+    from src.backend.database.db_manager import DatabaseManager
+
+    parser = argparse.ArgumentParser(description="Move old shifts into per-year archive files.")
+    parser.add_argument('--db', default=os.getenv('DB_PATH', 'shift_handover.db'), help="Hot database path")
+    parser.add_argument('--archive-dir', default=os.getenv('DB_ARCHIVE_DIR'), help="Archive directory")
+    parser.add_argument('--horizon-days', type=int,
+                        default=int(os.getenv('DB_ARCHIVE_HORIZON_DAYS', DEFAULT_HORIZON_DAYS)),
+                        help="Keep shifts newer than this in the hot tables")
+    parser.add_argument('--retention-years', type=int, default=DEFAULT_RETENTION_YEARS,
+                        help="Delete archive years older than this")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    db = DatabaseManager(args.db, cache_bytes=0)
+    try:
+        archiver = Archiver(db, args.archive_dir, args.horizon_days, args.retention_years)
+        moved = archiver.run()
+        purged = archiver.purge()
+        print(f"Archived {sum(moved.values())} rows across {len(moved)} years; purged years: {purged or 'none'}")
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
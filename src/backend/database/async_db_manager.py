@@ -0,0 +1,119 @@
+"""Asyncio front end for DatabaseManager.
+
+sqlite3 calls block, so every method runs on a bounded thread pool whose
+workers check connections out of the DatabaseManager pool. Independent reads
+then run side by side and a caller waits only for the slowest of them::
+
+    adb = AsyncDatabaseManager.from_manager(db)
+    plants, systems = await asyncio.gather(
+        adb.get_all_plant_status(),
+        adb.get_all_power_system_status(),
+    )
+
+Synchronous code such as a Streamlit page can use ``run()`` to do the same
+without managing an event loop.
+"""
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, List, Optional
+
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.pragmas import DEFAULT_PROFILE
+from src.backend.database.query_cache import DEFAULT_MAX_BYTES
+
+# Methods that do not make sense as coroutines
+SYNC_ONLY_METHODS = {'get_connection', 'close'}
+
+
+class AsyncDatabaseManager:
+    """DatabaseManager whose methods are coroutines run on a bounded executor.
+
+    Every public DatabaseManager method except ``get_connection`` and
+    ``close`` is available under the same name and signature. Reads use
+    the pool's reader connections, so at most ``pool_size`` of them run at
+    once; writes queue for the single writer connection as usual.
+    """
+
+    def __init__(self, db_path: str = "shift_handover.db", pool_size: int = 4,
+                 profile: str = DEFAULT_PROFILE, cache_bytes: int = DEFAULT_MAX_BYTES,
+                 max_workers: Optional[int] = None):
+        """Initialize async database manager with its own connection pool.
+
+        Args:
+            db_path: Path to SQLite database file
+            pool_size: Maximum number of pooled read connections
+            profile: Name of the PRAGMA performance profile to apply
+            cache_bytes: Memory bound of the read cache; 0 disables it
+            max_workers: Executor threads; defaults to pool_size + 1 so a
+                write can run alongside a full set of reads
+        """
+        self._setup(DatabaseManager(db_path, pool_size, profile, cache_bytes), max_workers, owns_db=True)
+
+    @classmethod
+    def from_manager(cls, db: DatabaseManager, max_workers: Optional[int] = None) -> 'AsyncDatabaseManager':
+        """Create an async front end sharing an existing manager's pool and cache.
+
+        Args:
+            db: Database manager to run calls on
+            max_workers: Executor threads; defaults to the pool's reader count + 1
+        """
+        adb = cls.__new__(cls)
+        adb._setup(db, max_workers, owns_db=False)
+        return adb
+
+    def _setup(self, db: DatabaseManager, max_workers: Optional[int], owns_db: bool):
+        self.db = db
+        self._owns_db = owns_db
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or db.pool.max_readers + 1,
+            thread_name_prefix='db-async'
+        )
+
+    async def _call(self, method: Callable, *args, **kwargs) -> Any:
+        """Run a blocking DatabaseManager call on the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(method, *args, **kwargs))
+
+    def run(self, *calls: Awaitable) -> List[Any]:
+        """Run coroutines concurrently from synchronous code and wait for all.
+
+        Must not be called from a thread that is already running an event loop.
+
+        Args:
+            calls: Coroutines from this manager's methods
+
+        Returns:
+            Results in the order the calls were given
+        """
+        async def gather():
+            return await asyncio.gather(*calls)
+        return asyncio.run(gather())
+
+    def close(self):
+        """Stop the executor, and close the pool if this manager created it."""
+        self.executor.shutdown(wait=True)
+        if self._owns_db:
+            self.db.close()
+
+    async def __aenter__(self) -> 'AsyncDatabaseManager':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+def _make_coroutine(name: str) -> Callable:
+    """Wrap the DatabaseManager method ``name`` as a coroutine method."""
+    method = getattr(DatabaseManager, name)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await self._call(getattr(self.db, name), *args, **kwargs)
+    return wrapper
+
+
+for _name, _ in inspect.getmembers(DatabaseManager, inspect.isfunction):
+    if not _name.startswith('_') and _name not in SYNC_ONLY_METHODS:
+        setattr(AsyncDatabaseManager, _name, _make_coroutine(_name))
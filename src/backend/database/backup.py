@@ -0,0 +1,254 @@
+"""Online backups of the shift handover database.
+
+Backups use SQLite's backup API, copying a few hundred pages per step and
+sleeping between steps, so the app keeps reading and writing while a backup
+runs. Each backup is written to a temporary file, checked with
+``PRAGMA integrity_check``, optionally gzipped and then renamed into place,
+so a file with the final name is always a complete, verified backup. Only
+the newest ``keep`` backups are kept.
+
+Run a backup from the command line::
+
+    python -m src.backend.database.backup --db shift_handover.db --dest backups --compress
+
+or in the app process with ``BackupScheduler``.
+"""
+import argparse
+import gzip
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+from src.backend.database.connection_pool import database_uri
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STEP_PAGES = 256
+DEFAULT_STEP_SLEEP = 0.01
+DEFAULT_KEEP = 7
+
+# progress(copied_pages, total_pages)
+ProgressCallback = Callable[[int, int], None]
+
+
+class BackupError(Exception):
+    """Raised when a backup fails verification."""
+
+
+class BackupResult(NamedTuple):
+    """A completed backup.
+
+    Attributes:
+        path: Backup file
+        pages: Database pages copied
+        size: Size of the backup file in bytes
+        seconds: Time the backup took
+        compressed: Whether the file is gzipped
+    """
+    path: str
+    pages: int
+    size: int
+    seconds: float
+    compressed: bool
+
+
+def backup_name(db_path: str, when: datetime, compress: bool) -> str:
+    """File name of a backup taken at ``when``."""
+    stem = os.path.splitext(os.path.basename(db_path))[0]
+    return f"{stem}-{when:%Y%m%d-%H%M%S}.db" + ('.gz' if compress else '')
+
+
+def list_backups(db_path: str, backup_dir: str) -> List[str]:
+    """Backups of a database in a directory, oldest first."""
+    if not os.path.isdir(backup_dir):
+        return []
+    stem = re.escape(os.path.splitext(os.path.basename(db_path))[0])
+    pattern = re.compile(rf'^{stem}-\d{{8}}-\d{{6}}\.db(\.gz)?$')
+    # Names embed the timestamp, so name order is age order
+    return [os.path.join(backup_dir, name) for name in sorted(os.listdir(backup_dir)) if pattern.match(name)]
+
+
+def verify_backup(path: str):
+    """Check an uncompressed backup file with PRAGMA integrity_check.
+
+    Raises:
+        BackupError: If SQLite reports any problem
+    """
+    conn = sqlite3.connect(database_uri(path, mode='ro'), uri=True)
+    try:
+        problems = [row[0] for row in conn.execute("PRAGMA integrity_check")]
+    finally:
+        conn.close()
+    if problems != ['ok']:
+        raise BackupError(f"Backup {path} failed integrity check: {'; '.join(problems[:5])}")
+
+
+def rotate_backups(db_path: str, backup_dir: str, keep: int) -> List[str]:
+    """Delete all but the newest ``keep`` backups.
+
+    Returns:
+        Paths deleted
+    """
+    if keep < 1:
+        raise ValueError("keep must be at least 1")
+    expired = list_backups(db_path, backup_dir)[:-keep]
+    for path in expired:
+        os.remove(path)
+        logger.info("Deleted old backup %s", path)
+    return expired
+
+
+def run_backup(
+    db_path: str,
+    backup_dir: str,
+    compress: bool = False,
+    keep: Optional[int] = DEFAULT_KEEP,
+    step_pages: int = DEFAULT_STEP_PAGES,
+    step_sleep: float = DEFAULT_STEP_SLEEP,
+    progress: Optional[ProgressCallback] = None,
+) -> BackupResult:
+    """Back up a live database without blocking writers for long.
+
+    Args:
+        db_path: Database to back up
+        backup_dir: Directory for the backup files
+        compress: Gzip the backup
+        keep: Number of backups to keep; None keeps all
+        step_pages: Pages copied per step; the source is only locked
+            during a step
+        step_sleep: Seconds to sleep between steps
+        progress: Called after every step with (copied_pages, total_pages)
+
+    Returns:
+        The new backup
+
+    Raises:
+        BackupError: If the copy fails verification; nothing is kept
+    """
+    started = time.monotonic()
+    os.makedirs(backup_dir, exist_ok=True)
+    now = datetime.now()
+    final_path = os.path.join(backup_dir, backup_name(db_path, now, compress))
+    partial_path = final_path + '.partial'
+    copy_path = os.path.join(backup_dir, backup_name(db_path, now, False)) + '.partial'
+
+    def report(status, remaining, total):
+        if progress is not None:
+            progress(total - remaining, total)
+
+    try:
+        source = sqlite3.connect(database_uri(db_path, mode='ro'), uri=True)
+        target = sqlite3.connect(copy_path)
+        try:
+            source.backup(target, pages=step_pages, progress=report, sleep=step_sleep)
+            # A single self-contained file, even when the source uses WAL
+            target.execute("PRAGMA journal_mode = DELETE")
+            pages = target.execute("PRAGMA page_count").fetchone()[0]
+        finally:
+            target.close()
+            source.close()
+        verify_backup(copy_path)
+        if compress:
+            with open(copy_path, 'rb') as raw, gzip.open(partial_path, 'wb') as packed:
+                shutil.copyfileobj(raw, packed, 1024 * 1024)
+            os.remove(copy_path)
+        os.replace(partial_path, final_path)
+    except BaseException:
+        for path in {copy_path, partial_path}:
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+
+    result = BackupResult(final_path, pages, os.path.getsize(final_path), time.monotonic() - started, compress)
+    logger.info("Backed up %s to %s (%s pages, %s bytes) in %.1fs",
+                db_path, final_path, pages, result.size, result.seconds)
+    if keep is not None:
+        rotate_backups(db_path, backup_dir, keep)
+    return result
+
+
+class BackupScheduler:
+    """Background thread that backs up a database at a fixed interval."""
+
+    def __init__(self, db_path: str, backup_dir: str, interval: float, compress: bool = True,
+                 keep: int = DEFAULT_KEEP):
+        """Initialize scheduler; call start() to begin.
+
+        Args:
+            db_path: Database to back up
+            backup_dir: Directory for the backup files
+            interval: Seconds between backups
+            compress: Gzip the backups
+            keep: Number of backups to keep
+        """
+        self.db_path = db_path
+        self.backup_dir = backup_dir
+        self.interval = interval
+        self.compress = compress
+        self.keep = keep
+        self.last_result: Optional[BackupResult] = None
+        self.last_error: Optional[Exception] = None
+        self.progress = (0, 0)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='db-backup', daemon=True)
+
+    def start(self) -> 'BackupScheduler':
+        """Start the background thread; the first backup runs after one interval."""
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the thread, waiting for a running backup to finish."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def run_now(self) -> BackupResult:
+        """Run a backup on the calling thread and record its outcome."""
+        def track(copied, total):
+            self.progress = (copied, total)
+        try:
+            self.last_result = run_backup(self.db_path, self.backup_dir, self.compress, self.keep,
+                                          progress=track)
+            self.last_error = None
+            return self.last_result
+        except Exception as e:
+            self.last_error = e
+            raise
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_now()
+            except Exception:
+                logger.exception("Scheduled backup of %s failed", self.db_path)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Take one backup from the command line."""
+    parser = argparse.ArgumentParser(description="Back up the shift handover database while it is in use.")
+    parser.add_argument('--db', default=os.getenv('DB_PATH', 'shift_handover.db'), help="Database path")
+    parser.add_argument('--dest', default=os.getenv('DB_BACKUP_DIR', 'backups'), help="Backup directory")
+    parser.add_argument('--compress', action='store_true', help="Gzip the backup")
+    parser.add_argument('--keep', type=int, default=DEFAULT_KEEP, help="Number of backups to keep")
+    parser.add_argument('--step-pages', type=int, default=DEFAULT_STEP_PAGES, help="Pages copied per step")
+    parser.add_argument('--step-sleep', type=float, default=DEFAULT_STEP_SLEEP, help="Seconds between steps")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    def show(copied, total):
+        print(f"\r{copied}/{total} pages", end='', flush=True)
+
+    result = run_backup(args.db, args.dest, args.compress, args.keep, args.step_pages, args.step_sleep, show)
+    print(f"\nBackup written to {result.path} ({result.size} bytes, {result.seconds:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
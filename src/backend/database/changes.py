@@ -0,0 +1,87 @@
+"""Change-data capture for incremental reads, backed by the change_log table.
+
+Triggers append one change_log row per insert, update and delete on every
+application table (see migrations/0005_change_log.py). ``seq`` only ever
+grows, so a consumer remembers the last ``seq`` it has seen and asks for
+the changes after it instead of re-reading whole tables::
+
+    seq = db.get_latest_change_seq()
+    ...
+    for change in db.get_changes_since(seq):
+        seq = change.seq
+"""
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Tables whose changes are logged
+CHANGE_TABLES = (
+    'handover_logs',
+    'power_positions',
+    'gas_positions',
+    'plant_status',
+    'power_system_status',
+    'notifications',
+    'it_issues',
+    'competitor_activity',
+    'comments',
+)
+
+OPERATIONS = ('insert', 'update', 'delete')
+
+# Format of CURRENT_TIMESTAMP, which the updated_at columns hold (UTC)
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class Change(NamedTuple):
+    """One logged row change.
+
+    Attributes:
+        seq: Position in the change log; increases with every change
+        table: Table of the changed row
+        row_id: Id of the changed row
+        operation: 'insert', 'update' or 'delete'
+        changed_at: UTC time of the change
+    """
+    seq: int
+    table: str
+    row_id: int
+    operation: str
+    changed_at: str
+
+
+def format_timestamp(since: Union[str, datetime]) -> str:
+    """Convert a datetime to the stored timestamp format; strings pass through."""
+    if isinstance(since, datetime):
+        return since.strftime(TIMESTAMP_FORMAT)
+    return since
+
+
+def build_changes_query(seq: int, tables: Optional[Sequence[str]], limit: int) -> Tuple[str, List]:
+    """Build the query for changes after ``seq``, oldest first.
+
+    Args:
+        seq: Last sequence number already seen
+        tables: Restrict to these tables (default: all)
+        limit: Maximum number of changes
+
+    Returns:
+        Tuple of (sql, params)
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    sql = "SELECT seq, table_name, row_id, operation, changed_at FROM change_log WHERE seq > ?"
+    params: List = [seq]
+    if tables is not None:
+        unknown = set(tables) - set(CHANGE_TABLES)
+        if unknown:
+            raise ValueError(f"Unknown tables: {sorted(unknown)}")
+        sql += f" AND table_name IN ({', '.join('?' for _ in tables)})"
+        params.extend(tables)
+    sql += " ORDER BY seq LIMIT ?"
+    params.append(limit)
+    return sql, params
+
+
+def make_changes(rows) -> List[Change]:
+    """Convert change_log rows into Change objects."""
+    return [Change(*row) for row in rows]
@@ -0,0 +1,254 @@
+"""Thread-safe SQLite connection pool for the shift handover application."""
+import os
+import queue
+import sqlite3
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+def database_uri(path: str, **options: str) -> str:
+    """Build an SQLite URI filename for a database path.
+
+    Args:
+        path: Filesystem path, or ":memory:"
+        options: URI query parameters, e.g. mode="ro"
+    """
+    if path == ':memory:':
+        uri = 'file::memory:'
+    else:
+        uri = 'file:' + urllib.parse.quote(os.path.abspath(path))
+    if options:
+        uri += '?' + urllib.parse.urlencode(options)
+    return uri
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes available in time."""
+
+
+class ConnectionPool:
+    """Bounded pool of SQLite connections with separate read and write lanes.
+
+    SQLite allows a single writer at a time, so the write lane holds exactly
+    one connection that callers check out exclusively. The read lane holds up
+    to ``max_readers`` connections which are opened lazily and reused across
+    Streamlit script threads. A connection is only ever used by the thread
+    that checked it out.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_readers: int = 4,
+        timeout: float = 30.0,
+        health_check_interval: float = 60.0,
+        initializer: Optional[Callable[[sqlite3.Connection], None]] = None,
+        reader_initializer: Optional[Callable[[sqlite3.Connection], None]] = None,
+    ):
+        """Initialize connection pool.
+
+        Args:
+            db_path: Path to SQLite database file
+            max_readers: Maximum number of read connections kept open
+            timeout: Seconds to wait for a free connection before giving up
+            health_check_interval: Idle seconds after which a connection is
+                pinged before being handed out again
+            initializer: Optional callable run on every new connection
+            reader_initializer: Optional callable run after ``initializer``
+                on new read connections only
+        """
+        if max_readers < 1:
+            raise ValueError("max_readers must be at least 1")
+
+        self.db_path = db_path
+        self.max_readers = max_readers
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.initializer = initializer
+        self.reader_initializer = reader_initializer
+
+        self._lock = threading.Lock()
+        self._closed = False
+        self._idle_readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(max_readers)
+        self._writer_lock = threading.Lock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._last_used: Dict[int, float] = {}
+        self._generation = 0
+        self._born: Dict[int, int] = {}
+        self._all: List[sqlite3.Connection] = []
+        self._stats = {
+            'opened': 0,
+            'closed': 0,
+            'checkouts': 0,
+            'health_check_failures': 0,
+            'timeouts': 0,
+        }
+
+    def _open(self, reader: bool = False) -> sqlite3.Connection:
+        """Open a new connection configured for pooled use.
+
+        Connections are opened by URI so that ATTACH accepts URI filenames
+        with options such as ``mode=ro``.
+        """
+        conn = sqlite3.connect(database_uri(self.db_path), timeout=self.timeout,
+                               check_same_thread=False, uri=True)
+        conn.row_factory = sqlite3.Row
+        if self.initializer is not None:
+            self.initializer(conn)
+        if reader and self.reader_initializer is not None:
+            self.reader_initializer(conn)
+        with self._lock:
+            self._all.append(conn)
+            self._last_used[id(conn)] = time.monotonic()
+            self._born[id(conn)] = self._generation
+            self._stats['opened'] += 1
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection):
+        """Close a connection and forget about it."""
+        with self._lock:
+            if conn in self._all:
+                self._all.remove(conn)
+            self._last_used.pop(id(conn), None)
+            self._born.pop(id(conn), None)
+            self._stats['closed'] += 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        """Ping a connection if it has been idle for too long."""
+        idle = time.monotonic() - self._last_used.get(id(conn), 0.0)
+        if idle < self.health_check_interval:
+            return True
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            with self._lock:
+                self._stats['health_check_failures'] += 1
+            return False
+
+    def _is_current(self, conn: sqlite3.Connection) -> bool:
+        """Check that a connection was opened since the last recycle()."""
+        return self._born.get(id(conn)) == self._generation
+
+    def _release(self, conn: sqlite3.Connection) -> bool:
+        """Reset a connection after use; return False if it must be dropped."""
+        if not self._is_current(conn):
+            return False
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            return False
+        self._last_used[id(conn)] = time.monotonic()
+        return True
+
+    def _check_open(self):
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Check out a read connection for the duration of a ``with`` block."""
+        self._check_open()
+        if not self._reader_slots.acquire(timeout=self.timeout):
+            with self._lock:
+                self._stats['timeouts'] += 1
+            raise PoolTimeoutError(
+                f"No read connection available after {self.timeout}s "
+                f"(pool size {self.max_readers})"
+            )
+        conn = None
+        try:
+            while conn is None:
+                try:
+                    conn = self._idle_readers.get_nowait()
+                except queue.Empty:
+                    conn = self._open(reader=True)
+                    break
+                if not self._is_current(conn) or not self._is_healthy(conn):
+                    self._discard(conn)
+                    conn = None
+            with self._lock:
+                self._stats['checkouts'] += 1
+            yield conn
+        finally:
+            if conn is not None:
+                if self._release(conn) and not self._closed:
+                    self._idle_readers.put(conn)
+                else:
+                    self._discard(conn)
+            self._reader_slots.release()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Check out the exclusive write connection.
+
+        Uncommitted work is rolled back when the block exits, so callers
+        must commit explicitly.
+        """
+        self._check_open()
+        if not self._writer_lock.acquire(timeout=self.timeout):
+            with self._lock:
+                self._stats['timeouts'] += 1
+            raise PoolTimeoutError(f"Write connection busy for more than {self.timeout}s")
+        try:
+            if self._writer is not None and not (
+                self._is_current(self._writer) and self._is_healthy(self._writer)
+            ):
+                self._discard(self._writer)
+                self._writer = None
+            if self._writer is None:
+                self._writer = self._open()
+            with self._lock:
+                self._stats['checkouts'] += 1
+            yield self._writer
+        finally:
+            if self._writer is not None and not self._release(self._writer):
+                self._discard(self._writer)
+                self._writer = None
+            self._writer_lock.release()
+
+    def recycle(self):
+        """Replace every connection the next time it is checked out.
+
+        Connections in use finish their work first. Use this after changing
+        something the initializers set up, such as attached databases.
+        """
+        with self._lock:
+            self._generation += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return pool counters and current sizes."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['open'] = len(self._all)
+        stats['idle_readers'] = self._idle_readers.qsize()
+        stats['max_readers'] = self.max_readers
+        return stats
+
+    def close(self):
+        """Close every connection owned by the pool."""
+        self._closed = True
+        with self._lock:
+            connections = list(self._all)
+            self._all.clear()
+            self._last_used.clear()
+            self._writer = None
+        while True:
+            try:
+                self._idle_readers.get_nowait()
+            except queue.Empty:
+                break
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
@@ -1,44 +1,555 @@
 """Database manager for SQLite operations."""
+import inspect
 import sqlite3
 import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional, Any
-import pandas as pd
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Dict, Optional, Any, Sequence, Tuple, Union
+from src.backend.database.archive import attach_archives, history_view, refresh_archives
+from src.backend.database.changes import CHANGE_TABLES, Change, build_changes_query, format_timestamp, make_changes
+from src.backend.database.connection_pool import ConnectionPool
+from src.backend.database.edits import ChangeResult, ChangeSet, EditConflict, build_conflict_query
+from src.backend.database.filters import ListFilter, compile_filter
+from src.backend.database.instrumentation import QueryMetrics, capturing_statements, instrument, trace_statement
+from src.backend.database.migrator import Migrator
+from src.backend.database.pagination import PAGE_KEY, Page, build_page_query, make_page
+from src.backend.database.projection import build_select_list
+from src.backend.database.rows import fetch
+from src.backend.database.query_cache import DEFAULT_MAX_BYTES, QueryCache, cached, invalidates
+from src.backend.database.retry import READ, WRITE, ContentionMetrics, RetryPolicy, retry_on_lock
+from src.backend.database.search import SEARCHABLE_TABLES, SearchHit, build_match_query, build_search_query, make_hits
+from src.backend.database.snapshot import DashboardSnapshot, freeze_row
+from src.backend.database.pragmas import DEFAULT_PROFILE, apply_profile, get_effective_settings, get_profile
+from src.backend.database.write_pipeline import WritePipeline, pipelined
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from src.backend.database.async_db_manager import AsyncDatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# Writable columns per table, in the argument order of the create_* methods.
+# The update_* methods take the row id followed by the same columns.
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'handover_logs': ('trader_name', 'shift_date', 'notes'),
+    'power_positions': ('shift_date', 'position_details', 'portfolio_status'),
+    'gas_positions': ('shift_date', 'position_details', 'portfolio_status'),
+    'plant_status': ('plant_name', 'status', 'notes', 'shift_date'),
+    'power_system_status': ('system_name', 'status', 'notes', 'shift_date'),
+    'notifications': ('title', 'message', 'priority', 'shift_date'),
+    'it_issues': ('title', 'description', 'status', 'shift_date'),
+    'competitor_activity': ('competitor_name', 'activity_details', 'shift_date'),
+    'comments': ('comment_text', 'shift_date'),
+}
+
+UPDATE_COLUMNS: Dict[str, Tuple[str, ...]] = dict(
+    TABLE_COLUMNS,
+    notifications=TABLE_COLUMNS['notifications'] + ('is_resolved',),
+)
+
+# Every readable column per table, for column projections
+READ_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    table: ('id',) + columns + ('created_at', 'updated_at')
+    for table, columns in UPDATE_COLUMNS.items()
+}
+
+# List reads return a DataFrame, or a list of row tuples with as_frame=False
+ListResult = Union['pd.DataFrame', List[Any]]
+
+# A row for the bulk methods: a tuple in create_*/update_* argument order,
+# or a dict keyed by column name.
+BulkRow = Union[Sequence[Any], Dict[str, Any]]
 
 
 class DatabaseManager:
     """Manages all database operations for the shift handover application."""
     
-    def __init__(self, db_path: str = "shift_handover.db"):
+    def __init__(self, db_path: str = "shift_handover.db", pool_size: int = 4,
+                 profile: str = DEFAULT_PROFILE, cache_bytes: int = DEFAULT_MAX_BYTES,
+                 group_commit_window: Optional[float] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 slow_query_ms: Optional[float] = None):
         """Initialize database manager.
         
         Args:
             db_path: Path to SQLite database file
+            pool_size: Maximum number of pooled read connections
+            profile: Name of the PRAGMA performance profile to apply
+            cache_bytes: Memory bound of the read cache; 0 disables it
+            group_commit_window: Seconds a writer thread waits to batch
+                concurrent writes into one transaction; None writes on the
+                calling thread
+            retry_policy: Backoff for operations that hit a locked database
+            slow_query_ms: Log calls slower than this with their SQL and
+                query plans; None disables the slow-query log
         """
+        get_profile(profile)
         self.db_path = db_path
+        self.profile = profile
+        self.cache = QueryCache(cache_bytes, external_check=self._archives_changed) if cache_bytes else None
+        self._aio = None
+        self._aio_lock = threading.Lock()
+        self.write_pipeline: Optional[WritePipeline] = None
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.contention = ContentionMetrics()
+        self.metrics = QueryMetrics(slow_query_ms)
+        self.pool = ConnectionPool(
+            db_path,
+            max_readers=pool_size,
+            initializer=lambda conn: apply_profile(conn, profile),
+            reader_initializer=lambda conn: attach_archives(conn, READ_COLUMNS)
+        )
         self.init_database()
+        if group_commit_window is not None:
+            self.write_pipeline = WritePipeline(self, group_commit_window)
+        self.pragma_settings = self.get_pragma_settings()
+        logger.info("Database %s opened with profile '%s': %s", db_path, profile, self.pragma_settings)
+    
+    @contextmanager
+    def get_connection(self, write: bool = False) -> Iterator[sqlite3.Connection]:
+        """Check out a pooled database connection.
+        
+        Args:
+            write: Use the exclusive write connection instead of a reader
+        """
+        if write and self.write_pipeline is not None:
+            batch_conn = self.write_pipeline.batch_connection()
+            if batch_conn is not None:
+                # Inside a group commit the batch already holds the writer
+                yield batch_conn
+                return
+        lane = self.pool.writer() if write else self.pool.reader()
+        requested = time.monotonic()
+        try:
+            with lane as conn:
+                self.contention.record_checkout(WRITE if write else READ, time.monotonic() - requested)
+                if not write and refresh_archives(conn, READ_COLUMNS) and self.cache is not None:
+                    # Another process archived rows; cached reads may miss them
+                    self.cache.invalidate()
+                if not capturing_statements():
+                    yield conn
+                    return
+                # Collect the SQL of a timed call for the slow-query log
+                conn.set_trace_callback(trace_statement)
+                try:
+                    yield conn
+                finally:
+                    conn.set_trace_callback(None)
+        finally:
+            # Writes made outside the create/update/delete methods may touch
+            # any table, so they invalidate every cached read.
+            if write and self.cache is not None and not self.cache.in_tracked_write:
+                self.cache.invalidate()
     
-    def get_connection(self) -> sqlite3.Connection:
-        """Create and return a database connection."""
-        conn = sqlite3.Connection(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _archives_changed(self) -> bool:
+        """Re-attach archives changed by another process; True if they were."""
+        with self.pool.reader() as conn:
+            return refresh_archives(conn, READ_COLUMNS)
+    
+    def get_pragma_settings(self) -> Dict[str, Any]:
+        """Get the PRAGMA settings actually in effect on pooled connections."""
+        with self.get_connection() as conn:
+            return get_effective_settings(conn)
+    
+    @property
+    def aio(self) -> 'AsyncDatabaseManager':
+        """Async front end sharing this manager's pool and cache, created on first use."""
+        with self._aio_lock:
+            if self._aio is None:
+                from src.backend.database.async_db_manager import AsyncDatabaseManager
+                self._aio = AsyncDatabaseManager.from_manager(self)
+            return self._aio
+    
+    def close(self):
+        """Finish queued writes and close all pooled connections."""
+        if self._aio is not None:
+            self._aio.close()
+        if self.write_pipeline is not None:
+            self.write_pipeline.close()
+        self.pool.close()
     
     def init_database(self):
-        """Initialize database with schema."""
-        schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
+        """Bring the database schema up to date.
         
-        with open(schema_path, 'r') as f:
-            schema = f.read()
+        Returns immediately when the recorded schema hash already matches
+        the migrations shipped with the code.
+        """
+        applied = Migrator(self.get_connection).migrate()
+        if applied:
+            logger.info("Applied schema migrations: %s", applied)
+            # Readers opened before the migration attached an older schema
+            self.pool.recycle()
+    
+    # Query Helpers
+    DEFAULT_PAGE_SIZE = 50
+    
+    def _select(self, table: str, order_by: str, filters: Optional[ListFilter],
+                columns: Optional[Sequence[str]] = None, preview: Optional[int] = None,
+                as_frame: bool = True, history: bool = False) -> ListResult:
+        """Read a whole table, with filters and projection applied in SQL.
         
+        With history=True the table's history view is read instead, which
+        includes rows moved to archive files.
+        """
+        where, params = compile_filter(table, filters)
+        select_list = build_select_list(table, READ_COLUMNS[table], columns, preview)
+        sql = f"SELECT {select_list} FROM {history_view(table) if history else table}"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" ORDER BY {order_by}"
         with self.get_connection() as conn:
-            conn.executescript(schema)
+            return fetch(conn, table, sql, params, as_frame)
+    
+    def _get_page(self, table: str, limit: Optional[int], cursor: Optional[str], with_total: bool,
+                  filters: Optional[ListFilter], columns: Optional[Sequence[str]] = None,
+                  preview: Optional[int] = None, as_frame: bool = True) -> Page:
+        """Read one keyset page of a table, newest first."""
+        limit = limit or self.DEFAULT_PAGE_SIZE
+        where, where_params = compile_filter(table, filters)
+        select_list = build_select_list(table, READ_COLUMNS[table], columns, preview, PAGE_KEY)
+        sql, params, direction = build_page_query(
+            table, limit, cursor, columns=select_list, where=where, params=where_params
+        )
+        with self.get_connection() as conn:
+            rows = fetch(conn, table, sql, params, as_frame)
+            total = None
+            if with_total:
+                count_sql = f"SELECT COUNT(*) FROM {table}" + (f" WHERE {where}" if where else "")
+                total = conn.execute(count_sql, where_params).fetchone()[0]
+        return make_page(rows, limit, cursor, direction, total)
+    
+    def _get_updated_since(self, table: str, since: Union[str, datetime], columns: Optional[Sequence[str]] = None,
+                           preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Read rows with updated_at >= since through the updated_at index.
+        
+        updated_at has one-second resolution, so the bound is inclusive:
+        a caller that remembers the last updated_at it saw gets the rows
+        of that second again rather than missing later ones.
+        """
+        select_list = build_select_list(table, READ_COLUMNS[table], columns, preview, ('id', 'updated_at'))
+        sql = f"SELECT {select_list} FROM {table} WHERE updated_at >= ? ORDER BY updated_at, id"
+        with self.get_connection() as conn:
+            return fetch(conn, table, sql, (format_timestamp(since),), as_frame)
+    
+    def _get_by_id(self, table: str, row_id: int) -> Optional[Dict]:
+        """Read one full row by id."""
+        with self.get_connection() as conn:
+            row = conn.execute(f"SELECT * FROM {table} WHERE id = ?", (row_id,)).fetchone()
+        return dict(row) if row else None
+    
+    # Dashboard Methods
+    @cached('handover_logs', 'notifications', 'it_issues', 'power_positions', 'gas_positions')
+    def get_dashboard_snapshot(self, recent_logs: int = 5, top_n: int = 3, preview: int = 100) -> DashboardSnapshot:
+        """Get every number and list the dashboard shows in one read transaction.
+        
+        All lists are limited in SQL, so the cost does not grow with table size.
+        Long text is cut to ``preview`` characters with a <column>_length
+        column alongside, as for the get_all_* methods.
+        
+        Args:
+            recent_logs: Number of recent handover logs to include
+            top_n: Number of critical notifications and open IT issues to include
+            preview: Characters of long text to include
+        """
+        def columns(table: str, *names: str) -> str:
+            return build_select_list(table, READ_COLUMNS[table], names or None, preview)
+        
+        with self.get_connection() as conn:
+            # An explicit transaction makes every read see the same snapshot
+            conn.execute("BEGIN")
+            try:
+                critical_count = conn.execute(
+                    "SELECT COUNT(*) FROM notifications WHERE priority = 'critical' AND is_resolved = 0"
+                ).fetchone()[0]
+                open_it_issues_count = conn.execute(
+                    "SELECT COUNT(*) FROM it_issues WHERE status IN ('open', 'in_progress')"
+                ).fetchone()[0]
+                # The "Recent Handovers" metric counts the latest ten logs
+                recent_handovers = conn.execute(
+                    f"""SELECT {columns('handover_logs')} FROM handover_logs
+                        ORDER BY shift_date DESC, created_at DESC LIMIT ?""",
+                    (max(recent_logs, 10),)
+                ).fetchall()
+                has_unresolved = conn.execute(
+                    "SELECT EXISTS (SELECT 1 FROM notifications WHERE is_resolved = 0)"
+                ).fetchone()[0]
+                critical_notifications = conn.execute(
+                    f"""SELECT {columns('notifications')} FROM notifications
+                        WHERE is_resolved = 0 AND priority = 'critical'
+                        ORDER BY shift_date DESC LIMIT ?""",
+                    (top_n,)
+                ).fetchall()
+                has_it_issues = conn.execute(
+                    "SELECT EXISTS (SELECT 1 FROM it_issues)"
+                ).fetchone()[0]
+                # One indexed query per status, merged here, avoids sorting
+                # every open issue to find the latest few.
+                open_it_issues = []
+                for status in ('open', 'in_progress'):
+                    open_it_issues.extend(conn.execute(
+                        f"""SELECT {columns('it_issues', 'title', 'status', 'shift_date')} FROM it_issues
+                            WHERE status = ? ORDER BY shift_date DESC LIMIT ?""",
+                        (status, top_n)
+                    ).fetchall())
+                open_it_issues.sort(key=lambda row: row['shift_date'], reverse=True)
+                latest_power = conn.execute(
+                    f"SELECT {columns('power_positions')} FROM power_positions ORDER BY shift_date DESC LIMIT 1"
+                ).fetchone()
+                latest_gas = conn.execute(
+                    f"SELECT {columns('gas_positions')} FROM gas_positions ORDER BY shift_date DESC LIMIT 1"
+                ).fetchone()
+            finally:
+                conn.rollback()
+        
+        return DashboardSnapshot(
+            critical_count=critical_count,
+            open_it_issues_count=open_it_issues_count,
+            recent_handover_count=min(len(recent_handovers), 10),
+            recent_handover_logs=tuple(freeze_row(row) for row in recent_handovers[:recent_logs]),
+            has_unresolved_notifications=bool(has_unresolved),
+            critical_notifications=tuple(freeze_row(row) for row in critical_notifications),
+            has_it_issues=bool(has_it_issues),
+            open_it_issues=tuple(freeze_row(row) for row in open_it_issues[:top_n]),
+            latest_power_position=freeze_row(latest_power) if latest_power else None,
+            latest_gas_position=freeze_row(latest_gas) if latest_gas else None,
+        )
+    
+    # Search Methods
+    @cached(*SEARCHABLE_TABLES)
+    def search(self, query: str, tables: Optional[Sequence[str]] = None,
+               date_range: Optional[Tuple[Optional[str], Optional[str]]] = None,
+               limit: int = 20) -> List[SearchHit]:
+        """Full-text search across every section.
+        
+        Args:
+            query: Words to look for; all must match, the last as a prefix
+            tables: Restrict hits to these tables (default: all)
+            date_range: (from, to) shift_date bounds; either may be None
+            limit: Maximum number of hits
+            
+        Returns:
+            Hits ordered best match first
+        """
+        match = build_match_query(query)
+        if match is None:
+            return []
+        sql, params = build_search_query(match, tables, date_range, limit)
+        with self.get_connection() as conn:
+            return make_hits(conn.execute(sql, params).fetchall())
+    
+    # Change Methods
+    @cached(*CHANGE_TABLES)
+    def get_latest_change_seq(self) -> int:
+        """Get the sequence number of the newest change, or 0 if none.
+        
+        Take it before a full read; get_changes_since() with it then
+        returns everything that changed afterwards.
+        """
+        with self.get_connection() as conn:
+            return conn.execute("SELECT coalesce(MAX(seq), 0) FROM change_log").fetchone()[0]
+    
+    @cached(*CHANGE_TABLES)
+    def get_changes_since(self, seq: int = 0, tables: Optional[Sequence[str]] = None,
+                          limit: int = 1000) -> List[Change]:
+        """Get the changes logged after a sequence number, oldest first.
+        
+        Rows moved to archive files show up as deletes.
+        
+        Args:
+            seq: Sequence number of the last change already processed
+            tables: Restrict to changes of these tables (default: all)
+            limit: Maximum number of changes; call again from the last
+                seq returned to read the rest
+            
+        Returns:
+            Changes ordered by seq
+        """
+        sql, params = build_changes_query(seq, tables, limit)
+        with self.get_connection() as conn:
+            return make_changes(conn.execute(sql, params).fetchall())
+    
+    # History Methods
+    @cached(*TABLE_COLUMNS)
+    def get_history(self, table: str, filters: Optional[ListFilter] = None,
+                    columns: Optional[Sequence[str]] = None, preview: Optional[int] = None,
+                    as_frame: bool = True) -> ListResult:
+        """Get rows of a table including those moved to archive files.
+        
+        Narrow the read with a shift_date filter; archived years are only
+        scanned through their (shift_date, created_at) index.
+        
+        Args:
+            table: Table to read
+            filters: Filters applied in SQL
+            columns: Columns to return (default: all)
+            preview: Cut long text to this many characters
+            as_frame: Return a DataFrame instead of row tuples
+        """
+        if table not in TABLE_COLUMNS:
+            raise ValueError(f"Unknown table: {table}")
+        return self._select(table, "shift_date DESC, created_at DESC", filters,
+                            columns, preview, as_frame, history=True)
+
+    # Grid Edit Methods
+    @pipelined
+    @invalidates(*TABLE_COLUMNS)
+    def apply_changes(self, table: str, changes: ChangeSet, seq: int) -> ChangeResult:
+        """Apply a grid edit in one transaction.
+
+        The edit is refused as a whole if any updated or deleted row has
+        changed since the change log stood at seq.
+
+        Args:
+            table: Table the rows belong to
+            changes: Change set from diff_rows()
+            seq: get_latest_change_seq() taken before the rows were read
+
+        Returns:
+            Inserted ids and the numbers of rows updated and deleted
+
+        Raises:
+            EditConflict: Rows changed after seq; nothing was written
+        """
+        if table not in TABLE_COLUMNS:
+            raise ValueError(f"Unknown table: {table}")
+        columns = UPDATE_COLUMNS[table]
+        for row in changes.inserted + changes.updated:
+            unknown = set(row) - set(columns) - {'id'}
+            if unknown:
+                raise ValueError(f"Unknown columns for {table}: {sorted(unknown)}")
+
+        touched = [row['id'] for row in changes.updated] + list(changes.deleted)
+        inserted_ids, updated, deleted = [], 0, 0
+        with self.get_connection(write=True) as conn:
+            if not conn.in_transaction:
+                # Hold the write lock from the conflict check to the commit
+                conn.execute("BEGIN IMMEDIATE")
+            if touched:
+                sql, params = build_conflict_query(table, seq, touched)
+                conflicts = sorted({row[0] for row in conn.execute(sql, params)})
+                if conflicts:
+                    raise EditConflict(table, conflicts)
+            for row in changes.updated:
+                names = [column for column in columns if column in row]
+                updated += conn.execute(
+                    f"UPDATE {table} SET {', '.join(f'{name} = ?' for name in names)}, "
+                    f"updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    [row[name] for name in names] + [row['id']]
+                ).rowcount
+            if changes.deleted:
+                deleted = conn.executemany(
+                    f"DELETE FROM {table} WHERE id = ?", [(row_id,) for row_id in changes.deleted]
+                ).rowcount
+            for row in changes.inserted:
+                # Missing values are left to the column defaults
+                names = [column for column in columns if row.get(column) is not None]
+                inserted_ids.append(conn.execute(
+                    f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' for _ in names)})",
+                    [row[name] for name in names]
+                ).lastrowid)
+            conn.commit()
+        return ChangeResult(inserted_ids, updated, deleted)
+
+    # Bulk Write Helpers
+    BULK_CHUNK_SIZE = 500
+    
+    @staticmethod
+    def _chunks(rows: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+        """Yield lists of at most chunk_size items."""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        iterator = iter(rows)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    
+    @staticmethod
+    def _row_values(row: BulkRow, columns: Tuple[str, ...]) -> tuple:
+        """Normalize a bulk row into a tuple ordered like columns."""
+        if isinstance(row, dict):
+            return tuple(row.get(column) for column in columns)
+        if len(row) != len(columns):
+            raise ValueError(f"Expected {len(columns)} values {columns}, got {len(row)}")
+        return tuple(row)
+    
+    def _insert_many(self, table: str, rows: Iterable[BulkRow], chunk_size: Optional[int]) -> List[int]:
+        """Insert rows with executemany in one transaction and return their ids."""
+        columns = TABLE_COLUMNS[table]
+        sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        ids = []
+        with self.get_connection(write=True) as conn:
+            for chunk in self._chunks(rows, chunk_size or self.BULK_CHUNK_SIZE):
+                conn.executemany(sql, [self._row_values(row, columns) for row in chunk])
+                # The write connection is exclusive for the whole transaction,
+                # so the AUTOINCREMENT ids of a chunk are consecutive.
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                ids.extend(range(last_id - len(chunk) + 1, last_id + 1))
             conn.commit()
+        return ids
+    
+    def _update_many(self, table: str, rows: Iterable[BulkRow], chunk_size: Optional[int]) -> int:
+        """Update rows by id with executemany in one transaction.
+        
+        A dict row only sets the columns it has; the others keep their values.
+        """
+        columns = UPDATE_COLUMNS[table]
+        statements: Dict[Tuple[str, ...], str] = {}
+        updated = 0
+        with self.get_connection(write=True) as conn:
+            for chunk in self._chunks(rows, chunk_size or self.BULK_CHUNK_SIZE):
+                # Consecutive rows setting the same columns share one executemany
+                batches: List[Tuple[Tuple[str, ...], List[tuple]]] = []
+                for row in chunk:
+                    if isinstance(row, dict):
+                        unknown = set(row) - set(columns) - {'id'}
+                        if unknown:
+                            raise ValueError(f"Unknown columns for {table}: {sorted(unknown)}")
+                        names = tuple(column for column in columns if column in row)
+                        if not names:
+                            raise ValueError(f"Row {row.get('id')} has no columns to update")
+                        params = tuple(row[name] for name in names) + (row['id'],)
+                    else:
+                        names = columns
+                        params = self._row_values(row[1:], columns) + (row[0],)
+                    if not batches or batches[-1][0] != names:
+                        batches.append((names, []))
+                    batches[-1][1].append(params)
+                for names, params in batches:
+                    if names not in statements:
+                        statements[names] = (
+                            f"UPDATE {table} SET {', '.join(f'{name} = ?' for name in names)}, "
+                            f"updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+                        )
+                    updated += conn.executemany(statements[names], params).rowcount
+            conn.commit()
+        return updated
+    
+    def _delete_many(self, table: str, ids: Iterable[int], chunk_size: Optional[int]) -> int:
+        """Delete rows by id with executemany in one transaction."""
+        deleted = 0
+        with self.get_connection(write=True) as conn:
+            for chunk in self._chunks(ids, chunk_size or self.BULK_CHUNK_SIZE):
+                deleted += conn.executemany(
+                    f"DELETE FROM {table} WHERE id = ?", [(row_id,) for row_id in chunk]
+                ).rowcount
+            conn.commit()
+        return deleted
     
     # Handover Logs Methods
+    @pipelined
+    @invalidates('handover_logs')
     def create_handover_log(self, trader_name: str, shift_date: str, notes: str) -> int:
         """Create a new handover log entry."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """INSERT INTO handover_logs (trader_name, shift_date, notes)
@@ -48,25 +559,67 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
-    def get_all_handover_logs(self) -> pd.DataFrame:
-        """Get all handover logs."""
-        with self.get_connection() as conn:
-            return pd.read_sql_query(
-                "SELECT * FROM handover_logs ORDER BY shift_date DESC, created_at DESC",
-                conn
-            )
+    @cached('handover_logs')
+    def get_all_handover_logs(self, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get all handover logs, optionally filtered in SQL.
+        
+        Args:
+            filters: Restrict the result to matching rows
+            columns: Columns to return (id is always included); None for all
+            preview: Cut long text to this many characters and add a
+                <column>_length column; load full rows with get_handover_log
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._select('handover_logs', "shift_date DESC, created_at DESC", filters, columns, preview, as_frame)
+    
+    @cached('handover_logs')
+    def get_handover_log(self, log_id: int) -> Optional[Dict]:
+        """Get a single handover log with its full text, or None if it does not exist."""
+        return self._get_by_id('handover_logs', log_id)
+    
+    @cached('handover_logs')
+    def get_handover_logs_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, with_total: bool = False, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> Page:
+        """Get one page of handover logs, newest first.
+        
+        Args:
+            limit: Page size (defaults to DEFAULT_PAGE_SIZE)
+            cursor: next_cursor or prev_cursor from a previous page
+            with_total: Also count all matching rows
+            filters: Restrict the page to matching rows
+            columns: Columns to return (the page key is always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return rows as a DataFrame; False for a list of row tuples
+        """
+        return self._get_page('handover_logs', limit, cursor, with_total, filters, columns, preview, as_frame)
     
-    def get_recent_handover_logs(self, limit: int = 5) -> pd.DataFrame:
+    @cached('handover_logs')
+    def get_handover_logs_updated_since(self, since: Union[str, datetime], columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get handover logs created or updated at or after a UTC timestamp, oldest change first.
+        
+        Args:
+            since: updated_at of the last row already seen; rows updated in
+                that same second are returned again
+            columns: Columns to return (id and updated_at are always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._get_updated_since('handover_logs', since, columns, preview, as_frame)
+    
+    @cached('handover_logs')
+    def get_recent_handover_logs(self, limit: int = 5, as_frame: bool = True) -> ListResult:
         """Get recent handover logs."""
         with self.get_connection() as conn:
-            return pd.read_sql_query(
+            return fetch(
+                conn, 'handover_logs',
                 f"SELECT * FROM handover_logs ORDER BY shift_date DESC, created_at DESC LIMIT {limit}",
-                conn
+                as_frame=as_frame
             )
     
+    @pipelined
+    @invalidates('handover_logs')
     def update_handover_log(self, log_id: int, trader_name: str, shift_date: str, notes: str):
         """Update an existing handover log."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute(
                 """UPDATE handover_logs 
                    SET trader_name = ?, shift_date = ?, notes = ?, updated_at = CURRENT_TIMESTAMP
@@ -75,16 +628,62 @@ class DatabaseManager:
             )
             conn.commit()
     
+    @pipelined
+    @invalidates('handover_logs')
     def delete_handover_log(self, log_id: int):
         """Delete a handover log."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute("DELETE FROM handover_logs WHERE id = ?", (log_id,))
             conn.commit()
     
+    @pipelined
+    @invalidates('handover_logs')
+    def create_handover_log_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> List[int]:
+        """Create many handover logs in a single transaction.
+        
+        Args:
+            rows: Tuples in create_handover_log argument order, or dicts
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Ids of the created rows, in input order
+        """
+        return self._insert_many('handover_logs', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('handover_logs')
+    def update_handover_log_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> int:
+        """Update many handover logs in a single transaction.
+        
+        Args:
+            rows: Tuples in update_handover_log argument order, or dicts with an 'id' key and the columns to change
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Number of rows updated
+        """
+        return self._update_many('handover_logs', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('handover_logs')
+    def delete_handover_log_many(self, ids: Iterable[int], chunk_size: Optional[int] = None) -> int:
+        """Delete many handover logs in a single transaction.
+        
+        Args:
+            ids: Ids of rows to delete
+            chunk_size: Ids per executemany call
+            
+        Returns:
+            Number of rows deleted
+        """
+        return self._delete_many('handover_logs', ids, chunk_size)
+    
     # Power Positions Methods
+    @pipelined
+    @invalidates('power_positions')
     def create_power_position(self, shift_date: str, position_details: str, portfolio_status: str) -> int:
         """Create a new power position entry."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """INSERT INTO power_positions (shift_date, position_details, portfolio_status)
@@ -94,14 +693,53 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
-    def get_all_power_positions(self) -> pd.DataFrame:
-        """Get all power positions."""
-        with self.get_connection() as conn:
-            return pd.read_sql_query(
-                "SELECT * FROM power_positions ORDER BY shift_date DESC",
-                conn
-            )
+    @cached('power_positions')
+    def get_all_power_positions(self, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get all power positions, optionally filtered in SQL.
+        
+        Args:
+            filters: Restrict the result to matching rows
+            columns: Columns to return (id is always included); None for all
+            preview: Cut long text to this many characters and add a
+                <column>_length column; load full rows with get_power_position
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._select('power_positions', "shift_date DESC", filters, columns, preview, as_frame)
+    
+    @cached('power_positions')
+    def get_power_position(self, position_id: int) -> Optional[Dict]:
+        """Get a single power position with its full text, or None if it does not exist."""
+        return self._get_by_id('power_positions', position_id)
+    
+    @cached('power_positions')
+    def get_power_positions_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, with_total: bool = False, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> Page:
+        """Get one page of power positions, newest first.
+        
+        Args:
+            limit: Page size (defaults to DEFAULT_PAGE_SIZE)
+            cursor: next_cursor or prev_cursor from a previous page
+            with_total: Also count all matching rows
+            filters: Restrict the page to matching rows
+            columns: Columns to return (the page key is always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return rows as a DataFrame; False for a list of row tuples
+        """
+        return self._get_page('power_positions', limit, cursor, with_total, filters, columns, preview, as_frame)
+    
+    @cached('power_positions')
+    def get_power_positions_updated_since(self, since: Union[str, datetime], columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get power positions created or updated at or after a UTC timestamp, oldest change first.
+        
+        Args:
+            since: updated_at of the last row already seen; rows updated in
+                that same second are returned again
+            columns: Columns to return (id and updated_at are always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._get_updated_since('power_positions', since, columns, preview, as_frame)
     
+    @cached('power_positions')
     def get_latest_power_position(self) -> Optional[Dict]:
         """Get the most recent power position."""
         with self.get_connection() as conn:
@@ -111,9 +749,11 @@ class DatabaseManager:
             row = cursor.fetchone()
             return dict(row) if row else None
     
+    @pipelined
+    @invalidates('power_positions')
     def update_power_position(self, position_id: int, shift_date: str, position_details: str, portfolio_status: str):
         """Update an existing power position."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute(
                 """UPDATE power_positions 
                    SET shift_date = ?, position_details = ?, portfolio_status = ?, updated_at = CURRENT_TIMESTAMP
@@ -122,16 +762,62 @@ class DatabaseManager:
             )
             conn.commit()
     
+    @pipelined
+    @invalidates('power_positions')
     def delete_power_position(self, position_id: int):
         """Delete a power position."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute("DELETE FROM power_positions WHERE id = ?", (position_id,))
             conn.commit()
     
+    @pipelined
+    @invalidates('power_positions')
+    def create_power_position_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> List[int]:
+        """Create many power positions in a single transaction.
+        
+        Args:
+            rows: Tuples in create_power_position argument order, or dicts
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Ids of the created rows, in input order
+        """
+        return self._insert_many('power_positions', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('power_positions')
+    def update_power_position_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> int:
+        """Update many power positions in a single transaction.
+        
+        Args:
+            rows: Tuples in update_power_position argument order, or dicts with an 'id' key and the columns to change
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Number of rows updated
+        """
+        return self._update_many('power_positions', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('power_positions')
+    def delete_power_position_many(self, ids: Iterable[int], chunk_size: Optional[int] = None) -> int:
+        """Delete many power positions in a single transaction.
+        
+        Args:
+            ids: Ids of rows to delete
+            chunk_size: Ids per executemany call
+            
+        Returns:
+            Number of rows deleted
+        """
+        return self._delete_many('power_positions', ids, chunk_size)
+    
     # Gas Positions Methods
+    @pipelined
+    @invalidates('gas_positions')
     def create_gas_position(self, shift_date: str, position_details: str, portfolio_status: str) -> int:
         """Create a new gas position entry."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """INSERT INTO gas_positions (shift_date, position_details, portfolio_status)
@@ -141,14 +827,53 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
-    def get_all_gas_positions(self) -> pd.DataFrame:
-        """Get all gas positions."""
-        with self.get_connection() as conn:
-            return pd.read_sql_query(
-                "SELECT * FROM gas_positions ORDER BY shift_date DESC",
-                conn
-            )
+    @cached('gas_positions')
+    def get_all_gas_positions(self, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get all gas positions, optionally filtered in SQL.
+        
+        Args:
+            filters: Restrict the result to matching rows
+            columns: Columns to return (id is always included); None for all
+            preview: Cut long text to this many characters and add a
+                <column>_length column; load full rows with get_gas_position
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._select('gas_positions', "shift_date DESC", filters, columns, preview, as_frame)
+    
+    @cached('gas_positions')
+    def get_gas_position(self, position_id: int) -> Optional[Dict]:
+        """Get a single gas position with its full text, or None if it does not exist."""
+        return self._get_by_id('gas_positions', position_id)
     
+    @cached('gas_positions')
+    def get_gas_positions_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, with_total: bool = False, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> Page:
+        """Get one page of gas positions, newest first.
+        
+        Args:
+            limit: Page size (defaults to DEFAULT_PAGE_SIZE)
+            cursor: next_cursor or prev_cursor from a previous page
+            with_total: Also count all matching rows
+            filters: Restrict the page to matching rows
+            columns: Columns to return (the page key is always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return rows as a DataFrame; False for a list of row tuples
+        """
+        return self._get_page('gas_positions', limit, cursor, with_total, filters, columns, preview, as_frame)
+    
+    @cached('gas_positions')
+    def get_gas_positions_updated_since(self, since: Union[str, datetime], columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get gas positions created or updated at or after a UTC timestamp, oldest change first.
+        
+        Args:
+            since: updated_at of the last row already seen; rows updated in
+                that same second are returned again
+            columns: Columns to return (id and updated_at are always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._get_updated_since('gas_positions', since, columns, preview, as_frame)
+    
+    @cached('gas_positions')
     def get_latest_gas_position(self) -> Optional[Dict]:
         """Get the most recent gas position."""
         with self.get_connection() as conn:
@@ -158,9 +883,11 @@ class DatabaseManager:
             row = cursor.fetchone()
             return dict(row) if row else None
     
+    @pipelined
+    @invalidates('gas_positions')
     def update_gas_position(self, position_id: int, shift_date: str, position_details: str, portfolio_status: str):
         """Update an existing gas position."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute(
                 """UPDATE gas_positions 
                    SET shift_date = ?, position_details = ?, portfolio_status = ?, updated_at = CURRENT_TIMESTAMP
@@ -169,16 +896,62 @@ class DatabaseManager:
             )
             conn.commit()
     
+    @pipelined
+    @invalidates('gas_positions')
     def delete_gas_position(self, position_id: int):
         """Delete a gas position."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute("DELETE FROM gas_positions WHERE id = ?", (position_id,))
             conn.commit()
     
+    @pipelined
+    @invalidates('gas_positions')
+    def create_gas_position_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> List[int]:
+        """Create many gas positions in a single transaction.
+        
+        Args:
+            rows: Tuples in create_gas_position argument order, or dicts
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Ids of the created rows, in input order
+        """
+        return self._insert_many('gas_positions', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('gas_positions')
+    def update_gas_position_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> int:
+        """Update many gas positions in a single transaction.
+        
+        Args:
+            rows: Tuples in update_gas_position argument order, or dicts with an 'id' key and the columns to change
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Number of rows updated
+        """
+        return self._update_many('gas_positions', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('gas_positions')
+    def delete_gas_position_many(self, ids: Iterable[int], chunk_size: Optional[int] = None) -> int:
+        """Delete many gas positions in a single transaction.
+        
+        Args:
+            ids: Ids of rows to delete
+            chunk_size: Ids per executemany call
+            
+        Returns:
+            Number of rows deleted
+        """
+        return self._delete_many('gas_positions', ids, chunk_size)
+    
     # Plant Status Methods
+    @pipelined
+    @invalidates('plant_status')
     def create_plant_status(self, plant_name: str, status: str, notes: str, shift_date: str) -> int:
         """Create a new plant status entry."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """INSERT INTO plant_status (plant_name, status, notes, shift_date)
@@ -188,17 +961,57 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
-    def get_all_plant_status(self) -> pd.DataFrame:
-        """Get all plant status entries."""
-        with self.get_connection() as conn:
-            return pd.read_sql_query(
-                "SELECT * FROM plant_status ORDER BY shift_date DESC",
-                conn
-            )
+    @cached('plant_status')
+    def get_all_plant_status(self, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get all plant status entries, optionally filtered in SQL.
+        
+        Args:
+            filters: Restrict the result to matching rows
+            columns: Columns to return (id is always included); None for all
+            preview: Cut long text to this many characters and add a
+                <column>_length column; load full rows with get_plant_status
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._select('plant_status', "shift_date DESC", filters, columns, preview, as_frame)
+    
+    @cached('plant_status')
+    def get_plant_status(self, status_id: int) -> Optional[Dict]:
+        """Get a single plant status entry with its full text, or None if it does not exist."""
+        return self._get_by_id('plant_status', status_id)
     
+    @cached('plant_status')
+    def get_plant_status_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, with_total: bool = False, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> Page:
+        """Get one page of plant status entries, newest first.
+        
+        Args:
+            limit: Page size (defaults to DEFAULT_PAGE_SIZE)
+            cursor: next_cursor or prev_cursor from a previous page
+            with_total: Also count all matching rows
+            filters: Restrict the page to matching rows
+            columns: Columns to return (the page key is always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return rows as a DataFrame; False for a list of row tuples
+        """
+        return self._get_page('plant_status', limit, cursor, with_total, filters, columns, preview, as_frame)
+    
+    @cached('plant_status')
+    def get_plant_status_updated_since(self, since: Union[str, datetime], columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get plant statuses created or updated at or after a UTC timestamp, oldest change first.
+        
+        Args:
+            since: updated_at of the last row already seen; rows updated in
+                that same second are returned again
+            columns: Columns to return (id and updated_at are always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._get_updated_since('plant_status', since, columns, preview, as_frame)
+    
+    @pipelined
+    @invalidates('plant_status')
     def update_plant_status(self, status_id: int, plant_name: str, status: str, notes: str, shift_date: str):
         """Update an existing plant status."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute(
                 """UPDATE plant_status 
                    SET plant_name = ?, status = ?, notes = ?, shift_date = ?, updated_at = CURRENT_TIMESTAMP
@@ -207,16 +1020,62 @@ class DatabaseManager:
             )
             conn.commit()
     
+    @pipelined
+    @invalidates('plant_status')
     def delete_plant_status(self, status_id: int):
         """Delete a plant status."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute("DELETE FROM plant_status WHERE id = ?", (status_id,))
             conn.commit()
     
+    @pipelined
+    @invalidates('plant_status')
+    def create_plant_status_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> List[int]:
+        """Create many plant status entries in a single transaction.
+        
+        Args:
+            rows: Tuples in create_plant_status argument order, or dicts
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Ids of the created rows, in input order
+        """
+        return self._insert_many('plant_status', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('plant_status')
+    def update_plant_status_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> int:
+        """Update many plant status entries in a single transaction.
+        
+        Args:
+            rows: Tuples in update_plant_status argument order, or dicts with an 'id' key and the columns to change
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Number of rows updated
+        """
+        return self._update_many('plant_status', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('plant_status')
+    def delete_plant_status_many(self, ids: Iterable[int], chunk_size: Optional[int] = None) -> int:
+        """Delete many plant status entries in a single transaction.
+        
+        Args:
+            ids: Ids of rows to delete
+            chunk_size: Ids per executemany call
+            
+        Returns:
+            Number of rows deleted
+        """
+        return self._delete_many('plant_status', ids, chunk_size)
+    
     # Power System Status Methods
+    @pipelined
+    @invalidates('power_system_status')
     def create_power_system_status(self, system_name: str, status: str, notes: str, shift_date: str) -> int:
         """Create a new power system status entry."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """INSERT INTO power_system_status (system_name, status, notes, shift_date)
@@ -226,17 +1085,57 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
-    def get_all_power_system_status(self) -> pd.DataFrame:
-        """Get all power system status entries."""
-        with self.get_connection() as conn:
-            return pd.read_sql_query(
-                "SELECT * FROM power_system_status ORDER BY shift_date DESC",
-                conn
-            )
+    @cached('power_system_status')
+    def get_all_power_system_status(self, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get all power system status entries, optionally filtered in SQL.
+        
+        Args:
+            filters: Restrict the result to matching rows
+            columns: Columns to return (id is always included); None for all
+            preview: Cut long text to this many characters and add a
+                <column>_length column; load full rows with get_power_system_status
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._select('power_system_status', "shift_date DESC", filters, columns, preview, as_frame)
+    
+    @cached('power_system_status')
+    def get_power_system_status(self, status_id: int) -> Optional[Dict]:
+        """Get a single power system status entry with its full text, or None if it does not exist."""
+        return self._get_by_id('power_system_status', status_id)
     
+    @cached('power_system_status')
+    def get_power_system_status_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, with_total: bool = False, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> Page:
+        """Get one page of power system status entries, newest first.
+        
+        Args:
+            limit: Page size (defaults to DEFAULT_PAGE_SIZE)
+            cursor: next_cursor or prev_cursor from a previous page
+            with_total: Also count all matching rows
+            filters: Restrict the page to matching rows
+            columns: Columns to return (the page key is always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return rows as a DataFrame; False for a list of row tuples
+        """
+        return self._get_page('power_system_status', limit, cursor, with_total, filters, columns, preview, as_frame)
+    
+    @cached('power_system_status')
+    def get_power_system_status_updated_since(self, since: Union[str, datetime], columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get power system statuses created or updated at or after a UTC timestamp, oldest change first.
+        
+        Args:
+            since: updated_at of the last row already seen; rows updated in
+                that same second are returned again
+            columns: Columns to return (id and updated_at are always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._get_updated_since('power_system_status', since, columns, preview, as_frame)
+    
+    @pipelined
+    @invalidates('power_system_status')
     def update_power_system_status(self, status_id: int, system_name: str, status: str, notes: str, shift_date: str):
         """Update an existing power system status."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute(
                 """UPDATE power_system_status 
                    SET system_name = ?, status = ?, notes = ?, shift_date = ?, updated_at = CURRENT_TIMESTAMP
@@ -245,16 +1144,62 @@ class DatabaseManager:
             )
             conn.commit()
     
+    @pipelined
+    @invalidates('power_system_status')
     def delete_power_system_status(self, status_id: int):
         """Delete a power system status."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute("DELETE FROM power_system_status WHERE id = ?", (status_id,))
             conn.commit()
     
+    @pipelined
+    @invalidates('power_system_status')
+    def create_power_system_status_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> List[int]:
+        """Create many power system status entries in a single transaction.
+        
+        Args:
+            rows: Tuples in create_power_system_status argument order, or dicts
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Ids of the created rows, in input order
+        """
+        return self._insert_many('power_system_status', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('power_system_status')
+    def update_power_system_status_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> int:
+        """Update many power system status entries in a single transaction.
+        
+        Args:
+            rows: Tuples in update_power_system_status argument order, or dicts with an 'id' key and the columns to change
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Number of rows updated
+        """
+        return self._update_many('power_system_status', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('power_system_status')
+    def delete_power_system_status_many(self, ids: Iterable[int], chunk_size: Optional[int] = None) -> int:
+        """Delete many power system status entries in a single transaction.
+        
+        Args:
+            ids: Ids of rows to delete
+            chunk_size: Ids per executemany call
+            
+        Returns:
+            Number of rows deleted
+        """
+        return self._delete_many('power_system_status', ids, chunk_size)
+    
     # Notifications Methods
+    @pipelined
+    @invalidates('notifications')
     def create_notification(self, title: str, message: str, priority: str, shift_date: str) -> int:
         """Create a new notification."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """INSERT INTO notifications (title, message, priority, shift_date)
@@ -264,22 +1209,63 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
-    def get_all_notifications(self) -> pd.DataFrame:
-        """Get all notifications."""
-        with self.get_connection() as conn:
-            return pd.read_sql_query(
-                "SELECT * FROM notifications ORDER BY shift_date DESC, priority DESC",
-                conn
-            )
+    @cached('notifications')
+    def get_all_notifications(self, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get all notifications, optionally filtered in SQL.
+        
+        Args:
+            filters: Restrict the result to matching rows
+            columns: Columns to return (id is always included); None for all
+            preview: Cut long text to this many characters and add a
+                <column>_length column; load full rows with get_notification
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._select('notifications', "shift_date DESC, priority DESC", filters, columns, preview, as_frame)
+    
+    @cached('notifications')
+    def get_notification(self, notif_id: int) -> Optional[Dict]:
+        """Get a single notification with its full text, or None if it does not exist."""
+        return self._get_by_id('notifications', notif_id)
+    
+    @cached('notifications')
+    def get_notifications_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, with_total: bool = False, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> Page:
+        """Get one page of notifications, newest first.
+        
+        Args:
+            limit: Page size (defaults to DEFAULT_PAGE_SIZE)
+            cursor: next_cursor or prev_cursor from a previous page
+            with_total: Also count all matching rows
+            filters: Restrict the page to matching rows
+            columns: Columns to return (the page key is always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return rows as a DataFrame; False for a list of row tuples
+        """
+        return self._get_page('notifications', limit, cursor, with_total, filters, columns, preview, as_frame)
+    
+    @cached('notifications')
+    def get_notifications_updated_since(self, since: Union[str, datetime], columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get notifications created or updated at or after a UTC timestamp, oldest change first.
+        
+        Args:
+            since: updated_at of the last row already seen; rows updated in
+                that same second are returned again
+            columns: Columns to return (id and updated_at are always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._get_updated_since('notifications', since, columns, preview, as_frame)
     
-    def get_unresolved_notifications(self) -> pd.DataFrame:
+    @cached('notifications')
+    def get_unresolved_notifications(self, as_frame: bool = True) -> ListResult:
         """Get unresolved notifications."""
         with self.get_connection() as conn:
-            return pd.read_sql_query(
+            return fetch(
+                conn, 'notifications',
                 "SELECT * FROM notifications WHERE is_resolved = 0 ORDER BY shift_date DESC, priority DESC",
-                conn
+                as_frame=as_frame
             )
     
+    @cached('notifications')
     def get_critical_notifications_count(self) -> int:
         """Get count of critical unresolved notifications."""
         with self.get_connection() as conn:
@@ -288,9 +1274,11 @@ class DatabaseManager:
             )
             return cursor.fetchone()[0]
     
+    @pipelined
+    @invalidates('notifications')
     def update_notification(self, notif_id: int, title: str, message: str, priority: str, shift_date: str, is_resolved: bool):
         """Update an existing notification."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute(
                 """UPDATE notifications 
                    SET title = ?, message = ?, priority = ?, shift_date = ?, is_resolved = ?, updated_at = CURRENT_TIMESTAMP
@@ -299,25 +1287,73 @@ class DatabaseManager:
             )
             conn.commit()
     
+    @pipelined
+    @invalidates('notifications')
     def resolve_notification(self, notif_id: int):
         """Mark a notification as resolved."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute(
                 "UPDATE notifications SET is_resolved = 1, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
                 (notif_id,)
             )
             conn.commit()
     
+    @pipelined
+    @invalidates('notifications')
     def delete_notification(self, notif_id: int):
         """Delete a notification."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute("DELETE FROM notifications WHERE id = ?", (notif_id,))
             conn.commit()
     
+    @pipelined
+    @invalidates('notifications')
+    def create_notification_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> List[int]:
+        """Create many notifications in a single transaction.
+        
+        Args:
+            rows: Tuples in create_notification argument order, or dicts
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Ids of the created rows, in input order
+        """
+        return self._insert_many('notifications', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('notifications')
+    def update_notification_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> int:
+        """Update many notifications in a single transaction.
+        
+        Args:
+            rows: Tuples in update_notification argument order, or dicts with an 'id' key and the columns to change
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Number of rows updated
+        """
+        return self._update_many('notifications', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('notifications')
+    def delete_notification_many(self, ids: Iterable[int], chunk_size: Optional[int] = None) -> int:
+        """Delete many notifications in a single transaction.
+        
+        Args:
+            ids: Ids of rows to delete
+            chunk_size: Ids per executemany call
+            
+        Returns:
+            Number of rows deleted
+        """
+        return self._delete_many('notifications', ids, chunk_size)
+    
     # IT Issues Methods
+    @pipelined
+    @invalidates('it_issues')
     def create_it_issue(self, title: str, description: str, status: str, shift_date: str) -> int:
         """Create a new IT issue."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """INSERT INTO it_issues (title, description, status, shift_date)
@@ -327,14 +1363,53 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
-    def get_all_it_issues(self) -> pd.DataFrame:
-        """Get all IT issues."""
-        with self.get_connection() as conn:
-            return pd.read_sql_query(
-                "SELECT * FROM it_issues ORDER BY shift_date DESC",
-                conn
-            )
+    @cached('it_issues')
+    def get_all_it_issues(self, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get all IT issues, optionally filtered in SQL.
+        
+        Args:
+            filters: Restrict the result to matching rows
+            columns: Columns to return (id is always included); None for all
+            preview: Cut long text to this many characters and add a
+                <column>_length column; load full rows with get_it_issue
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._select('it_issues', "shift_date DESC", filters, columns, preview, as_frame)
     
+    @cached('it_issues')
+    def get_it_issue(self, issue_id: int) -> Optional[Dict]:
+        """Get a single IT issue with its full text, or None if it does not exist."""
+        return self._get_by_id('it_issues', issue_id)
+    
+    @cached('it_issues')
+    def get_it_issues_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, with_total: bool = False, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> Page:
+        """Get one page of IT issues, newest first.
+        
+        Args:
+            limit: Page size (defaults to DEFAULT_PAGE_SIZE)
+            cursor: next_cursor or prev_cursor from a previous page
+            with_total: Also count all matching rows
+            filters: Restrict the page to matching rows
+            columns: Columns to return (the page key is always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return rows as a DataFrame; False for a list of row tuples
+        """
+        return self._get_page('it_issues', limit, cursor, with_total, filters, columns, preview, as_frame)
+    
+    @cached('it_issues')
+    def get_it_issues_updated_since(self, since: Union[str, datetime], columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get IT issues created or updated at or after a UTC timestamp, oldest change first.
+        
+        Args:
+            since: updated_at of the last row already seen; rows updated in
+                that same second are returned again
+            columns: Columns to return (id and updated_at are always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._get_updated_since('it_issues', since, columns, preview, as_frame)
+    
+    @cached('it_issues')
     def get_open_it_issues_count(self) -> int:
         """Get count of open IT issues."""
         with self.get_connection() as conn:
@@ -343,9 +1418,11 @@ class DatabaseManager:
             )
             return cursor.fetchone()[0]
     
+    @pipelined
+    @invalidates('it_issues')
     def update_it_issue(self, issue_id: int, title: str, description: str, status: str, shift_date: str):
         """Update an existing IT issue."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute(
                 """UPDATE it_issues 
                    SET title = ?, description = ?, status = ?, shift_date = ?, updated_at = CURRENT_TIMESTAMP
@@ -354,16 +1431,62 @@ class DatabaseManager:
             )
             conn.commit()
     
+    @pipelined
+    @invalidates('it_issues')
     def delete_it_issue(self, issue_id: int):
         """Delete an IT issue."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute("DELETE FROM it_issues WHERE id = ?", (issue_id,))
             conn.commit()
     
+    @pipelined
+    @invalidates('it_issues')
+    def create_it_issue_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> List[int]:
+        """Create many IT issues in a single transaction.
+        
+        Args:
+            rows: Tuples in create_it_issue argument order, or dicts
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Ids of the created rows, in input order
+        """
+        return self._insert_many('it_issues', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('it_issues')
+    def update_it_issue_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> int:
+        """Update many IT issues in a single transaction.
+        
+        Args:
+            rows: Tuples in update_it_issue argument order, or dicts with an 'id' key and the columns to change
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Number of rows updated
+        """
+        return self._update_many('it_issues', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('it_issues')
+    def delete_it_issue_many(self, ids: Iterable[int], chunk_size: Optional[int] = None) -> int:
+        """Delete many IT issues in a single transaction.
+        
+        Args:
+            ids: Ids of rows to delete
+            chunk_size: Ids per executemany call
+            
+        Returns:
+            Number of rows deleted
+        """
+        return self._delete_many('it_issues', ids, chunk_size)
+    
     # Competitor Activity Methods
+    @pipelined
+    @invalidates('competitor_activity')
     def create_competitor_activity(self, competitor_name: str, activity_details: str, shift_date: str) -> int:
         """Create a new competitor activity entry."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """INSERT INTO competitor_activity (competitor_name, activity_details, shift_date)
@@ -373,17 +1496,57 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
-    def get_all_competitor_activity(self) -> pd.DataFrame:
-        """Get all competitor activity entries."""
-        with self.get_connection() as conn:
-            return pd.read_sql_query(
-                "SELECT * FROM competitor_activity ORDER BY shift_date DESC",
-                conn
-            )
+    @cached('competitor_activity')
+    def get_all_competitor_activity(self, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get all competitor activity entries, optionally filtered in SQL.
+        
+        Args:
+            filters: Restrict the result to matching rows
+            columns: Columns to return (id is always included); None for all
+            preview: Cut long text to this many characters and add a
+                <column>_length column; load full rows with get_competitor_activity
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._select('competitor_activity', "shift_date DESC", filters, columns, preview, as_frame)
+    
+    @cached('competitor_activity')
+    def get_competitor_activity(self, activity_id: int) -> Optional[Dict]:
+        """Get a single competitor activity entry with its full text, or None if it does not exist."""
+        return self._get_by_id('competitor_activity', activity_id)
     
+    @cached('competitor_activity')
+    def get_competitor_activity_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, with_total: bool = False, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> Page:
+        """Get one page of competitor activity entries, newest first.
+        
+        Args:
+            limit: Page size (defaults to DEFAULT_PAGE_SIZE)
+            cursor: next_cursor or prev_cursor from a previous page
+            with_total: Also count all matching rows
+            filters: Restrict the page to matching rows
+            columns: Columns to return (the page key is always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return rows as a DataFrame; False for a list of row tuples
+        """
+        return self._get_page('competitor_activity', limit, cursor, with_total, filters, columns, preview, as_frame)
+    
+    @cached('competitor_activity')
+    def get_competitor_activity_updated_since(self, since: Union[str, datetime], columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get competitor activities created or updated at or after a UTC timestamp, oldest change first.
+        
+        Args:
+            since: updated_at of the last row already seen; rows updated in
+                that same second are returned again
+            columns: Columns to return (id and updated_at are always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._get_updated_since('competitor_activity', since, columns, preview, as_frame)
+    
+    @pipelined
+    @invalidates('competitor_activity')
     def update_competitor_activity(self, activity_id: int, competitor_name: str, activity_details: str, shift_date: str):
         """Update an existing competitor activity."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute(
                 """UPDATE competitor_activity 
                    SET competitor_name = ?, activity_details = ?, shift_date = ?, updated_at = CURRENT_TIMESTAMP
@@ -392,16 +1555,62 @@ class DatabaseManager:
             )
             conn.commit()
     
+    @pipelined
+    @invalidates('competitor_activity')
     def delete_competitor_activity(self, activity_id: int):
         """Delete a competitor activity."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute("DELETE FROM competitor_activity WHERE id = ?", (activity_id,))
             conn.commit()
     
+    @pipelined
+    @invalidates('competitor_activity')
+    def create_competitor_activity_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> List[int]:
+        """Create many competitor activity entries in a single transaction.
+        
+        Args:
+            rows: Tuples in create_competitor_activity argument order, or dicts
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Ids of the created rows, in input order
+        """
+        return self._insert_many('competitor_activity', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('competitor_activity')
+    def update_competitor_activity_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> int:
+        """Update many competitor activity entries in a single transaction.
+        
+        Args:
+            rows: Tuples in update_competitor_activity argument order, or dicts with an 'id' key and the columns to change
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Number of rows updated
+        """
+        return self._update_many('competitor_activity', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('competitor_activity')
+    def delete_competitor_activity_many(self, ids: Iterable[int], chunk_size: Optional[int] = None) -> int:
+        """Delete many competitor activity entries in a single transaction.
+        
+        Args:
+            ids: Ids of rows to delete
+            chunk_size: Ids per executemany call
+            
+        Returns:
+            Number of rows deleted
+        """
+        return self._delete_many('competitor_activity', ids, chunk_size)
+    
     # Comments Methods
+    @pipelined
+    @invalidates('comments')
     def create_comment(self, comment_text: str, shift_date: str) -> int:
         """Create a new comment."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """INSERT INTO comments (comment_text, shift_date)
@@ -411,17 +1620,57 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
-    def get_all_comments(self) -> pd.DataFrame:
-        """Get all comments."""
-        with self.get_connection() as conn:
-            return pd.read_sql_query(
-                "SELECT * FROM comments ORDER BY shift_date DESC, created_at DESC",
-                conn
-            )
+    @cached('comments')
+    def get_all_comments(self, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get all comments, optionally filtered in SQL.
+        
+        Args:
+            filters: Restrict the result to matching rows
+            columns: Columns to return (id is always included); None for all
+            preview: Cut long text to this many characters and add a
+                <column>_length column; load full rows with get_comment
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._select('comments', "shift_date DESC, created_at DESC", filters, columns, preview, as_frame)
+    
+    @cached('comments')
+    def get_comment(self, comment_id: int) -> Optional[Dict]:
+        """Get a single comment with its full text, or None if it does not exist."""
+        return self._get_by_id('comments', comment_id)
+    
+    @cached('comments')
+    def get_comments_page(self, limit: Optional[int] = None, cursor: Optional[str] = None, with_total: bool = False, filters: Optional[ListFilter] = None, columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> Page:
+        """Get one page of comments, newest first.
+        
+        Args:
+            limit: Page size (defaults to DEFAULT_PAGE_SIZE)
+            cursor: next_cursor or prev_cursor from a previous page
+            with_total: Also count all matching rows
+            filters: Restrict the page to matching rows
+            columns: Columns to return (the page key is always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return rows as a DataFrame; False for a list of row tuples
+        """
+        return self._get_page('comments', limit, cursor, with_total, filters, columns, preview, as_frame)
     
+    @cached('comments')
+    def get_comments_updated_since(self, since: Union[str, datetime], columns: Optional[Sequence[str]] = None, preview: Optional[int] = None, as_frame: bool = True) -> ListResult:
+        """Get comments created or updated at or after a UTC timestamp, oldest change first.
+        
+        Args:
+            since: updated_at of the last row already seen; rows updated in
+                that same second are returned again
+            columns: Columns to return (id and updated_at are always included)
+            preview: Cut long text to this many characters, as for get_all_*
+            as_frame: Return a DataFrame; False returns a list of row tuples
+        """
+        return self._get_updated_since('comments', since, columns, preview, as_frame)
+    
+    @pipelined
+    @invalidates('comments')
     def update_comment(self, comment_id: int, comment_text: str, shift_date: str):
         """Update an existing comment."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute(
                 """UPDATE comments 
                    SET comment_text = ?, shift_date = ?, updated_at = CURRENT_TIMESTAMP
@@ -430,8 +1679,63 @@ class DatabaseManager:
             )
             conn.commit()
     
+    @pipelined
+    @invalidates('comments')
     def delete_comment(self, comment_id: int):
         """Delete a comment."""
-        with self.get_connection() as conn:
+        with self.get_connection(write=True) as conn:
             conn.execute("DELETE FROM comments WHERE id = ?", (comment_id,))
             conn.commit()
+    
+    @pipelined
+    @invalidates('comments')
+    def create_comment_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> List[int]:
+        """Create many comments in a single transaction.
+        
+        Args:
+            rows: Tuples in create_comment argument order, or dicts
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Ids of the created rows, in input order
+        """
+        return self._insert_many('comments', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('comments')
+    def update_comment_many(self, rows: Iterable[BulkRow], chunk_size: Optional[int] = None) -> int:
+        """Update many comments in a single transaction.
+        
+        Args:
+            rows: Tuples in update_comment argument order, or dicts with an 'id' key and the columns to change
+            chunk_size: Rows per executemany call
+            
+        Returns:
+            Number of rows updated
+        """
+        return self._update_many('comments', rows, chunk_size)
+    
+    @pipelined
+    @invalidates('comments')
+    def delete_comment_many(self, ids: Iterable[int], chunk_size: Optional[int] = None) -> int:
+        """Delete many comments in a single transaction.
+        
+        Args:
+            ids: Ids of rows to delete
+            chunk_size: Ids per executemany call
+            
+        Returns:
+            Number of rows deleted
+        """
+        return self._delete_many('comments', ids, chunk_size)
+
+
+# Operations that are neither retried on lock errors nor timed
+UNRETRIED_METHODS = {'get_connection', 'init_database', 'close'}
+
+# Retry and time every other public operation; pipelined methods are writes.
+# Timing is outermost, so it includes lock waits and retries.
+for _name, _method in inspect.getmembers(DatabaseManager, inspect.isfunction):
+    if not _name.startswith('_') and _name not in UNRETRIED_METHODS:
+        _kind = WRITE if getattr(_method, 'pipelined', False) else READ
+        setattr(DatabaseManager, _name, instrument(retry_on_lock(_method, _kind)))
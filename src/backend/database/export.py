@@ -0,0 +1,229 @@
+"""Streaming CSV/JSONL export of application tables.
+
+Rows are read with ``fetchmany`` in fixed-size chunks and formatted chunk by
+chunk, so memory use does not depend on how many rows are exported. Exports
+can be limited to a shift_date range and can include rows moved to archive
+files.
+
+Export from the command line::
+
+    python -m src.backend.database.export --out exports --format jsonl --from 2020-01-01 --parallel
+"""
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from src.backend.database.archive import history_view
+from src.backend.database.db_manager import READ_COLUMNS, DatabaseManager
+from src.backend.database.filters import ListFilter, compile_filter
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ('csv', 'jsonl')
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class ExportResult(NamedTuple):
+    """A finished table export.
+
+    Attributes:
+        table: Exported table
+        path: File written
+        rows: Number of rows written
+    """
+    table: str
+    path: str
+    rows: int
+
+
+def _check(table: str, fmt: str):
+    if table not in READ_COLUMNS:
+        raise ValueError(f"Unknown table: {table}")
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+
+def iter_chunks(db, table: str, date_from: Optional[str] = None, date_to: Optional[str] = None,
+                include_archive: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[tuple]]:
+    """Read a table in chunks of rows with the columns of READ_COLUMNS.
+
+    Hot tables are read in (shift_date, created_at, id) order through
+    their index. With include_archive the history view is read in storage
+    order instead, as sorting every archive year would need a temporary
+    B-tree as large as the export.
+
+    Args:
+        db: DatabaseManager to read from
+        table: Table to read
+        date_from: Earliest shift_date to include
+        date_to: Latest shift_date to include
+        include_archive: Also read rows moved to archive files
+        chunk_size: Rows per chunk
+
+    Yields:
+        Lists of row tuples
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    where, params = compile_filter(table, ListFilter(date_from=date_from, date_to=date_to))
+    sql = f"SELECT {', '.join(READ_COLUMNS[table])} FROM {history_view(table) if include_archive else table}"
+    if where:
+        sql += f" WHERE {where}"
+    if not include_archive:
+        sql += " ORDER BY shift_date, created_at, id"
+    with db.get_connection() as conn:
+        cursor = conn.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield [tuple(row) for row in rows]
+
+
+def format_chunk(fmt: str, columns: Sequence[str], rows: List[tuple], header: bool = False) -> str:
+    """Format rows as CSV lines or JSON lines.
+
+    Args:
+        fmt: 'csv' or 'jsonl'
+        columns: Column names of the rows
+        rows: Rows to format
+        header: Start with the CSV header line
+    """
+    if fmt == 'jsonl':
+        return ''.join(json.dumps(dict(zip(columns, row)), default=str) + '\n' for row in rows)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    if header:
+        writer.writerow(columns)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def write_table(db, table: str, out: IO[str], fmt: str = 'csv', **options) -> int:
+    """Stream one table into a text file object.
+
+    Args:
+        db: DatabaseManager to read from
+        table: Table to export
+        out: Text stream to write to
+        fmt: 'csv' or 'jsonl'
+        options: date_from, date_to, include_archive and chunk_size, as
+            for iter_chunks
+
+    Returns:
+        Number of rows written
+    """
+    _check(table, fmt)
+    columns = READ_COLUMNS[table]
+    if fmt == 'csv':
+        out.write(format_chunk(fmt, columns, [], header=True))
+    count = 0
+    for rows in iter_chunks(db, table, **options):
+        out.write(format_chunk(fmt, columns, rows))
+        count += len(rows)
+    return count
+
+
+def export_file_name(table: str, fmt: str) -> str:
+    """File name of a table export."""
+    return f"{table}.{fmt}"
+
+
+def export_tables(db, out_dir: str, tables: Optional[Sequence[str]] = None, fmt: str = 'csv',
+                  parallel: bool = False, max_workers: Optional[int] = None,
+                  **options) -> List[ExportResult]:
+    """Export tables to one file each.
+
+    Args:
+        db: DatabaseManager to read from
+        out_dir: Directory for the export files
+        tables: Tables to export (default: all)
+        fmt: 'csv' or 'jsonl'
+        parallel: Export tables at the same time, each on its own read
+            connection
+        max_workers: Threads for a parallel export; defaults to the
+            pool's reader count
+        options: date_from, date_to, include_archive and chunk_size
+
+    Returns:
+        One result per table, in the order given
+    """
+    tables = list(tables or READ_COLUMNS)
+    for table in tables:
+        _check(table, fmt)
+    os.makedirs(out_dir, exist_ok=True)
+
+    def export(table: str) -> ExportResult:
+        path = os.path.join(out_dir, export_file_name(table, fmt))
+        with open(path, 'w', encoding='utf-8', newline='') as out:
+            rows = write_table(db, table, out, fmt, **options)
+        logger.info("Exported %s rows of %s to %s", rows, table, path)
+        return ExportResult(table, path, rows)
+
+    if not parallel:
+        return [export(table) for table in tables]
+    with ThreadPoolExecutor(max_workers=max_workers or db.pool.max_readers,
+                            thread_name_prefix='db-export') as executor:
+        return list(executor.map(export, tables))
+
+
+def export_zip(db, out: IO[bytes], tables: Optional[Sequence[str]] = None, fmt: str = 'csv',
+               **options) -> Dict[str, int]:
+    """Export tables into a zip archive with one deflated file per table.
+
+    Args:
+        db: DatabaseManager to read from
+        out: Binary file object to write the archive to
+        tables: Tables to export (default: all)
+        fmt: 'csv' or 'jsonl'
+        options: date_from, date_to, include_archive and chunk_size
+
+    Returns:
+        Rows written per table
+    """
+    counts = {}
+    with zipfile.ZipFile(out, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for table in tables or READ_COLUMNS:
+            _check(table, fmt)
+            with archive.open(export_file_name(table, fmt), 'w', force_zip64=True) as member:
+                with io.TextIOWrapper(member, encoding='utf-8', newline='') as text:
+                    counts[table] = write_table(db, table, text, fmt, **options)
+    return counts
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Export tables from the command line."""
+    parser = argparse.ArgumentParser(description="Export shift handover tables to CSV or JSONL.")
+    parser.add_argument('--db', default=os.getenv('DB_PATH', 'shift_handover.db'), help="Database path")
+    parser.add_argument('--out', default='exports', help="Output directory")
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default='csv', help="Output format")
+    parser.add_argument('--tables', nargs='+', choices=sorted(READ_COLUMNS), help="Tables to export (default: all)")
+    parser.add_argument('--from', dest='date_from', help="Earliest shift date (YYYY-MM-DD)")
+    parser.add_argument('--to', dest='date_to', help="Latest shift date (YYYY-MM-DD)")
+    parser.add_argument('--include-archive', action='store_true', help="Include rows in archive files")
+    parser.add_argument('--parallel', action='store_true', help="Export tables concurrently")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Rows fetched per chunk")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    db = DatabaseManager(args.db, cache_bytes=0)
+    try:
+        results = export_tables(
+            db, args.out, args.tables, args.format, parallel=args.parallel,
+            date_from=args.date_from, date_to=args.date_to,
+            include_archive=args.include_archive, chunk_size=args.chunk_size,
+        )
+    finally:
+        db.close()
+    for result in results:
+        print(f"{result.table}: {result.rows} rows -> {result.path}")
+
+
+if __name__ == '__main__':
+    main()
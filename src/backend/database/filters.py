@@ -0,0 +1,104 @@
+"""Typed list filters compiled to parameterized SQL predicates."""
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Free-text columns searched by ListFilter.text, per table
+TEXT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'handover_logs': ('trader_name', 'notes'),
+    'power_positions': ('position_details', 'portfolio_status'),
+    'gas_positions': ('position_details', 'portfolio_status'),
+    'plant_status': ('plant_name', 'notes'),
+    'power_system_status': ('system_name', 'status', 'notes'),
+    'notifications': ('title', 'message'),
+    'it_issues': ('title', 'description'),
+    'competitor_activity': ('competitor_name', 'activity_details'),
+    'comments': ('comment_text',),
+}
+
+# Tables that carry the columns behind the enum and flag filters
+PRIORITY_TABLES = {'notifications'}
+STATUS_TABLES = {'plant_status', 'power_system_status', 'it_issues'}
+RESOLVED_TABLES = {'notifications'}
+
+
+class ListFilter(NamedTuple):
+    """Filter for list queries. Unset fields do not restrict the result.
+
+    Attributes:
+        text: Case-insensitive substring matched against the table's text columns
+        date_from: Earliest shift_date to include (YYYY-MM-DD)
+        date_to: Latest shift_date to include (YYYY-MM-DD)
+        priorities: Notification priorities to include
+        statuses: Status values to include
+        resolved: Only resolved (True) or unresolved (False) notifications
+    """
+    text: Optional[str] = None
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+    priorities: Optional[Tuple[str, ...]] = None
+    statuses: Optional[Tuple[str, ...]] = None
+    resolved: Optional[bool] = None
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally."""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def compile_filter(table: str, filters: Optional[ListFilter]) -> Tuple[str, tuple]:
+    """Compile a ListFilter into a WHERE predicate for a table.
+
+    Args:
+        table: Table the predicate applies to
+        filters: Filter to compile, or None
+
+    Returns:
+        Tuple of (predicate without the WHERE keyword, parameters). The
+        predicate is an empty string when nothing is filtered.
+    """
+    if filters is None:
+        return '', ()
+
+    predicates: List[str] = []
+    params: List = []
+
+    if filters.text and filters.text.strip():
+        pattern = f"%{escape_like(filters.text.strip())}%"
+        columns = TEXT_COLUMNS[table]
+        predicates.append(
+            '(' + ' OR '.join(f"{column} LIKE ? ESCAPE '\\'" for column in columns) + ')'
+        )
+        params.extend([pattern] * len(columns))
+
+    if filters.date_from:
+        predicates.append("shift_date >= ?")
+        params.append(str(filters.date_from))
+    if filters.date_to:
+        predicates.append("shift_date <= ?")
+        params.append(str(filters.date_to))
+
+    if filters.priorities is not None:
+        _check_supported(table, 'priorities', PRIORITY_TABLES)
+        predicates.append(_in_clause('priority', filters.priorities, params))
+    if filters.statuses is not None:
+        _check_supported(table, 'statuses', STATUS_TABLES)
+        predicates.append(_in_clause('status', filters.statuses, params))
+    if filters.resolved is not None:
+        _check_supported(table, 'resolved', RESOLVED_TABLES)
+        predicates.append("is_resolved = ?")
+        params.append(1 if filters.resolved else 0)
+
+    return ' AND '.join(predicates), tuple(params)
+
+
+def _check_supported(table: str, field: str, tables: set):
+    if table not in tables:
+        raise ValueError(f"ListFilter.{field} is not supported for table '{table}'")
+
+
+def _in_clause(column: str, values: Tuple[str, ...], params: List) -> str:
+    """Build an IN predicate; an empty selection matches nothing."""
+    values = tuple(values)
+    if not values:
+        return '0'
+    params.extend(values)
+    return f"{column} IN ({', '.join('?' for _ in values)})"
@@ -0,0 +1,338 @@
+"""Bulk import of CSV/JSONL files into application tables.
+
+The input is parsed as a stream and handled in chunks. Each chunk is
+validated column by column against the constraints of the live schema
+(NOT NULL columns and ``CHECK (column IN (...))`` enums) plus a YYYY-MM-DD
+check on shift_date. The valid rows are inserted with one executemany, and
+the invalid ones are written to a rejects file as JSON lines with their
+line number and errors.
+
+Every chunk is committed in the same transaction as the job's progress in
+``import_jobs``. An interrupted import therefore resumes after its last
+committed chunk, without duplicating rows or rejects::
+
+    python -m src.backend.database.importer --table handover_logs legacy_logs.csv
+"""
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+from datetime import date
+from itertools import islice
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.backend.database.db_manager import UPDATE_COLUMNS, DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ('csv', 'jsonl')
+DEFAULT_CHUNK_SIZE = 5000
+
+# Columns accepted per table. These include the resolved flag of
+# notifications, so old notifications are not imported as open alerts.
+IMPORT_COLUMNS: Dict[str, Tuple[str, ...]] = UPDATE_COLUMNS
+
+_ENUM_CHECK = re.compile(r'(\w+)\s+TEXT[^,]*?CHECK\s*\(\s*\1\s+IN\s*\(([^)]*)\)\s*\)', re.IGNORECASE)
+_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_TRUE = {'1', 'true', 'yes', 'y', 't'}
+_FALSE = {'0', 'false', 'no', 'n', 'f', ''}
+
+
+class TableRules(NamedTuple):
+    """Constraints an imported row must meet.
+
+    Attributes:
+        required: Columns declared NOT NULL
+        enums: Allowed values of columns with a CHECK (... IN (...)) constraint
+    """
+    required: FrozenSet[str]
+    enums: Dict[str, FrozenSet[str]]
+
+
+class ImportResult(NamedTuple):
+    """Outcome of an import.
+
+    Attributes:
+        job_id: Key of the job in import_jobs
+        table: Table imported into
+        records: Input records processed, including earlier runs
+        inserted: Rows inserted, including earlier runs
+        rejected: Records rejected, including earlier runs
+        rejects_path: File holding the rejected records
+        resumed_from: Records already done when this run started
+    """
+    job_id: str
+    table: str
+    records: int
+    inserted: int
+    rejected: int
+    rejects_path: str
+    resumed_from: int
+
+
+def load_rules(conn: sqlite3.Connection, table: str) -> TableRules:
+    """Read a table's NOT NULL and enum constraints from the schema."""
+    required = frozenset(
+        row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+        if row[3] and not row[5]
+    )
+    sql = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()[0]
+    enums = {
+        column: frozenset(value.strip().strip("'") for value in values.split(','))
+        for column, values in _ENUM_CHECK.findall(sql)
+    }
+    return TableRules(required, enums)
+
+
+def detect_format(path: str) -> str:
+    """Guess the input format from the file extension."""
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    if extension in ('jsonl', 'ndjson', 'json'):
+        return 'jsonl'
+    if extension == 'csv':
+        return 'csv'
+    raise ValueError(f"Cannot tell the format of {path}; pass fmt='csv' or fmt='jsonl'")
+
+
+def read_records(path: str, fmt: str) -> Iterator[Tuple[int, Any]]:
+    """Stream (line number, record) pairs from a CSV or JSONL file.
+
+    CSV records are dicts keyed by the header. A JSONL line that does not
+    parse yields its raw text, which validation rejects.
+    """
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        if fmt == 'csv':
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, record
+        else:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield number, json.loads(line)
+                except ValueError:
+                    yield number, line.rstrip('\n')
+
+
+def _clean(value: Any) -> Any:
+    """Trim text and treat blank text as missing."""
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+
+def validate_chunk(table: str, rules: TableRules,
+                   records: Sequence[Tuple[int, Any]]) -> Tuple[List[tuple], List[Dict[str, Any]]]:
+    """Validate a chunk of records one column at a time.
+
+    Args:
+        table: Target table
+        rules: Constraints of the table
+        records: (line number, record) pairs
+
+    Returns:
+        Tuple of (valid rows ordered like IMPORT_COLUMNS[table], rejects).
+        A reject is a dict with the line, the errors and the record.
+    """
+    columns = IMPORT_COLUMNS[table]
+    errors: List[List[str]] = [[] for _ in records]
+    values: Dict[str, List[Any]] = {column: [] for column in columns}
+    for i, (_, record) in enumerate(records):
+        if not isinstance(record, dict):
+            errors[i].append("not a JSON object")
+            record = {}
+        for column in columns:
+            values[column].append(_clean(record.get(column)))
+
+    for column in columns:
+        column_values = values[column]
+        if column in rules.required:
+            for i, value in enumerate(column_values):
+                if value is None:
+                    errors[i].append(f"{column} is required")
+        allowed = rules.enums.get(column)
+        if allowed is not None:
+            for i, value in enumerate(column_values):
+                if value is not None and value not in allowed:
+                    errors[i].append(f"{column} must be one of {sorted(allowed)}, got {value!r}")
+        if column == 'shift_date':
+            for i, value in enumerate(column_values):
+                if value is not None and not _is_date(value):
+                    errors[i].append(f"shift_date must be YYYY-MM-DD, got {value!r}")
+        if column == 'is_resolved':
+            for i, value in enumerate(column_values):
+                flag = str(value).lower() if value is not None else ''
+                if flag in _TRUE:
+                    column_values[i] = 1
+                elif flag in _FALSE:
+                    column_values[i] = 0
+                else:
+                    errors[i].append(f"is_resolved must be true or false, got {value!r}")
+
+    valid, rejects = [], []
+    for i, (line, record) in enumerate(records):
+        if errors[i]:
+            rejects.append({'line': line, 'errors': errors[i], 'record': record})
+        else:
+            valid.append(tuple(values[column][i] for column in columns))
+    return valid, rejects
+
+
+def _is_date(value: Any) -> bool:
+    if not isinstance(value, str) or not _DATE.match(value):
+        return False
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def default_job_id(table: str, path: str) -> str:
+    """Job key for a file: the table, its absolute path and its size."""
+    source = f"{table}:{os.path.abspath(path)}:{os.path.getsize(path)}"
+    return hashlib.sha1(source.encode()).hexdigest()[:16]
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def import_file(
+    db: DatabaseManager,
+    table: str,
+    path: str,
+    fmt: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rejects_path: Optional[str] = None,
+    job_id: Optional[str] = None,
+    restart: bool = False,
+) -> ImportResult:
+    """Import a CSV or JSONL file into a table, resuming an earlier run.
+
+    Args:
+        db: DatabaseManager of the target database
+        table: Table to import into
+        path: Input file
+        fmt: 'csv' or 'jsonl'; guessed from the extension by default
+        chunk_size: Records per transaction
+        rejects_path: File for rejected records; defaults to
+            ``<path>.rejects.jsonl``
+        job_id: Key of the job; defaults to one derived from the file
+        restart: Ignore the progress of an earlier run
+
+    Returns:
+        Totals of the job
+
+    Raises:
+        ValueError: For an unknown table or format, or a CSV header
+            without the table's required columns
+    """
+    if table not in IMPORT_COLUMNS:
+        raise ValueError(f"Unknown table: {table}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    fmt = fmt or detect_format(path)
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"Unknown import format: {fmt}")
+    rejects_path = rejects_path or f"{path}.rejects.jsonl"
+    job_id = job_id or default_job_id(table, path)
+    columns = IMPORT_COLUMNS[table]
+
+    with db.get_connection() as conn:
+        rules = load_rules(conn, table)
+    if fmt == 'csv':
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            header = next(csv.reader(f), [])
+        missing = rules.required.intersection(columns) - set(header)
+        if missing:
+            raise ValueError(f"{path} has no column for required {sorted(missing)}")
+
+    with db.get_connection(write=True) as conn:
+        if restart:
+            conn.execute("DELETE FROM import_jobs WHERE job_id = ?", (job_id,))
+        conn.execute(
+            "INSERT OR IGNORE INTO import_jobs (job_id, table_name, source) VALUES (?, ?, ?)",
+            (job_id, table, os.path.abspath(path))
+        )
+        conn.commit()
+        job = conn.execute("SELECT * FROM import_jobs WHERE job_id = ?", (job_id,)).fetchone()
+    if job['table_name'] != table:
+        raise ValueError(f"Job {job_id} imports into {job['table_name']}, not {table}")
+    done, inserted, rejected = job['records_done'], job['rows_inserted'], job['rows_rejected']
+    resumed_from = done
+    if done:
+        logger.info("Resuming import %s of %s after %s records", job_id, path, done)
+
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+    mode = 'r+' if os.path.exists(rejects_path) and not restart else 'w'
+    with open(rejects_path, mode, encoding='utf-8') as rejects_file:
+        # Drop rejects written for a chunk that never committed
+        rejects_file.truncate(job['rejects_offset'])
+        rejects_file.seek(job['rejects_offset'])
+        records = islice(read_records(path, fmt), done, None)
+        for chunk in _chunks(records, chunk_size):
+            valid, rejects = validate_chunk(table, rules, chunk)
+            for reject in rejects:
+                rejects_file.write(json.dumps(reject, default=str) + '\n')
+            rejects_file.flush()
+            with db.get_connection(write=True) as conn:
+                conn.executemany(sql, valid)
+                conn.execute(
+                    """UPDATE import_jobs
+                       SET records_done = records_done + ?, rows_inserted = rows_inserted + ?,
+                           rows_rejected = rows_rejected + ?, rejects_offset = ?,
+                           updated_at = CURRENT_TIMESTAMP
+                       WHERE job_id = ?""",
+                    (len(chunk), len(valid), len(rejects), rejects_file.tell(), job_id)
+                )
+                conn.commit()
+            done += len(chunk)
+            inserted += len(valid)
+            rejected += len(rejects)
+            logger.info("Imported %s records into %s (%s rejected)", done, table, rejected)
+
+    with db.get_connection(write=True) as conn:
+        conn.execute(
+            "UPDATE import_jobs SET finished = 1, updated_at = CURRENT_TIMESTAMP WHERE job_id = ?", (job_id,)
+        )
+        conn.commit()
+    return ImportResult(job_id, table, done, inserted, rejected, rejects_path, resumed_from)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Import a file from the command line."""
+    parser = argparse.ArgumentParser(description="Bulk import CSV or JSONL files into shift handover tables.")
+    parser.add_argument('path', help="CSV or JSONL file")
+    parser.add_argument('--table', required=True, choices=sorted(IMPORT_COLUMNS), help="Target table")
+    parser.add_argument('--db', default=os.getenv('DB_PATH', 'shift_handover.db'), help="Database path")
+    parser.add_argument('--format', choices=IMPORT_FORMATS, help="Input format (default: from the extension)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Records per transaction")
+    parser.add_argument('--rejects', help="File for rejected records")
+    parser.add_argument('--restart', action='store_true', help="Start over instead of resuming")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    db = DatabaseManager(args.db, cache_bytes=0)
+    try:
+        result = import_file(db, args.table, args.path, args.format, args.chunk_size,
+                             args.rejects, restart=args.restart)
+    finally:
+        db.close()
+    print(f"{result.inserted} rows imported into {result.table}, {result.rejected} rejected"
+          + (f" -> {result.rejects_path}" if result.rejected else ""))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""Per-method timing, result sizes and a slow-query log for DatabaseManager.
+
+Every public DatabaseManager method is wrapped by ``instrument``, which
+records the following per method in a ``QueryMetrics`` registry:
+
+- the call count and errors;
+- a latency histogram;
+- the rows returned;
+- an estimate of the bytes materialized.
+
+The registry can be dumped as JSON or shown on the Performance page.
+
+When a slow-query threshold is set, the SQL statements of each top-level
+call are captured through SQLite's trace callback, with their parameters
+bound. A call slower than the threshold is logged with its statements and
+the query plan of each SELECT.
+"""
+import functools
+import json
+import logging
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.backend.database.metrics import Histogram
+from src.backend.database.query_cache import estimate_size
+
+logger = logging.getLogger(__name__)
+
+# Results larger than this many rows are sized from a sample
+SIZE_SAMPLE_ROWS = 100
+# Longest SQL text kept per statement in the slow-query log
+MAX_LOGGED_SQL = 2000
+
+_active = threading.local()
+
+
+def _is_frame(value: Any) -> bool:
+    pd = sys.modules.get('pandas')
+    return pd is not None and isinstance(value, pd.DataFrame)
+
+
+def measure_result(value: Any) -> Tuple[int, int]:
+    """Count the rows in a method result and estimate its size in bytes.
+
+    Lists and DataFrames longer than SIZE_SAMPLE_ROWS are sized from their
+    first rows, so measuring stays cheap for large results.
+
+    Returns:
+        Tuple of (rows, bytes)
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return 0, 0
+    if hasattr(value, 'rows') and hasattr(value, 'next_cursor'):
+        # A Page: measure its rows
+        return measure_result(value.rows)
+    if _is_frame(value):
+        rows = len(value)
+        if rows > SIZE_SAMPLE_ROWS:
+            sample = int(value.head(SIZE_SAMPLE_ROWS).memory_usage(index=True, deep=True).sum())
+            return rows, sample * rows // SIZE_SAMPLE_ROWS
+        return rows, estimate_size(value)
+    if isinstance(value, list):
+        rows = len(value)
+        if rows > SIZE_SAMPLE_ROWS:
+            sample = sum(estimate_size(item) for item in value[:SIZE_SAMPLE_ROWS])
+            return rows, sys.getsizeof(value) + sample * rows // SIZE_SAMPLE_ROWS
+        return rows, estimate_size(value)
+    return 1, estimate_size(value)
+
+
+class MethodStats:
+    """Counters and a latency histogram for one method."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.bytes = 0
+        self.slow_calls = 0
+        self.latency = Histogram()
+
+
+class QueryMetrics:
+    """Thread-safe registry of per-method statistics."""
+
+    def __init__(self, slow_query_ms: Optional[float] = None):
+        """Initialize registry.
+
+        Args:
+            slow_query_ms: Calls taking longer are logged with their SQL and
+                query plans; None disables the slow-query log
+        """
+        self.slow_query_ms = slow_query_ms
+        self._methods: Dict[str, MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, seconds: float, rows: int = 0, size: int = 0,
+               error: bool = False, slow: bool = False):
+        """Record one call of a method."""
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = MethodStats()
+            stats.calls += 1
+            stats.errors += error
+            stats.slow_calls += slow
+            stats.rows += rows
+            stats.bytes += size
+        stats.latency.observe(seconds)
+
+    def reset(self):
+        """Forget all recorded calls."""
+        with self._lock:
+            self._methods.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get the statistics of every called method, by method name."""
+        with self._lock:
+            methods = sorted(self._methods.items())
+        snapshot = {}
+        for name, stats in methods:
+            latency = stats.latency.snapshot()
+            snapshot[name] = {
+                'calls': stats.calls,
+                'errors': stats.errors,
+                'slow_calls': stats.slow_calls,
+                'rows': stats.rows,
+                'bytes': stats.bytes,
+                'total_ms': latency['mean_ms'] * latency['count'],
+                'latency': latency,
+            }
+        return snapshot
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Dump the statistics as JSON."""
+        return json.dumps({'slow_query_ms': self.slow_query_ms, 'methods': self.snapshot()}, indent=indent)
+
+
+def capturing_statements() -> bool:
+    """Whether the current thread is collecting SQL for the slow-query log."""
+    return getattr(_active, 'statements', None) is not None
+
+
+def trace_statement(sql: str):
+    """SQLite trace callback that collects statements for the current call."""
+    statements = getattr(_active, 'statements', None)
+    if statements is not None:
+        statements.append(sql)
+
+
+def _log_slow_call(db, name: str, seconds: float, statements: List[str]):
+    lines = [f"Slow call {name} took {seconds * 1000:.1f}ms"]
+    for sql in statements:
+        lines.append(f"  SQL: {sql[:MAX_LOGGED_SQL]}")
+        if not sql.lstrip().upper().startswith(('SELECT', 'WITH')):
+            continue
+        try:
+            with db.get_connection() as conn:
+                plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        except Exception as e:
+            lines.append(f"    plan unavailable: {e}")
+            continue
+        lines.extend(f"    {row[3]}" for row in plan)
+    if not statements:
+        lines.append("  (no statements captured on this thread)")
+    logger.warning('\n'.join(lines))
+
+
+def instrument(method: Callable) -> Callable:
+    """Wrap a DatabaseManager method to record its calls in ``self.metrics``.
+
+    Calls run by the group-commit writer on behalf of another thread are
+    not recorded again; the caller's call already covers them.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        pipeline = self.write_pipeline
+        if pipeline is not None and pipeline.on_writer_thread:
+            return method(self, *args, **kwargs)
+        metrics: QueryMetrics = self.metrics
+        top_level = not getattr(_active, 'depth', 0)
+        if top_level and metrics.slow_query_ms is not None:
+            _active.statements = []
+        _active.depth = getattr(_active, 'depth', 0) + 1
+        started = time.perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException:
+            metrics.record(name, time.perf_counter() - started, error=True)
+            raise
+        finally:
+            _active.depth -= 1
+            if top_level:
+                statements, _active.statements = getattr(_active, 'statements', None), None
+        seconds = time.perf_counter() - started
+        slow = top_level and metrics.slow_query_ms is not None and seconds * 1000 >= metrics.slow_query_ms
+        rows, size = measure_result(result)
+        metrics.record(name, seconds, rows, size, slow=slow)
+        if slow:
+            _log_slow_call(self, name, seconds, statements or [])
+        return result
+    return wrapper
@@ -0,0 +1,68 @@
+"""Fixed-bucket histograms for timing database operations."""
+import bisect
+import threading
+from typing import Any, Dict, Sequence
+
+# Upper bounds of the histogram buckets, in milliseconds
+DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Thread-safe histogram of durations with fixed millisecond buckets."""
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        """Initialize histogram.
+
+        Args:
+            buckets_ms: Increasing bucket upper bounds; a final unbounded
+                bucket catches everything slower
+        """
+        self.buckets_ms = tuple(buckets_ms)
+        self._counts = [0] * (len(self.buckets_ms) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        """Record one duration."""
+        ms = seconds * 1000
+        index = bisect.bisect_left(self.buckets_ms, ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum_ms += ms
+            self._max_ms = max(self._max_ms, ms)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile in milliseconds as the upper bound of its bucket.
+
+        Returns the largest duration seen for the unbounded bucket, and
+        0.0 for an empty histogram.
+        """
+        with self._lock:
+            counts, count, max_ms = list(self._counts), self._count, self._max_ms
+        if not count:
+            return 0.0
+        rank = q * count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets_ms, counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(float(bound), max_ms)
+        return max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get counts per bucket and summary figures."""
+        with self._lock:
+            counts, count, sum_ms, max_ms = list(self._counts), self._count, self._sum_ms, self._max_ms
+        labels = [f"<={bound}ms" for bound in self.buckets_ms] + [f">{self.buckets_ms[-1]}ms"]
+        return {
+            'count': count,
+            'mean_ms': sum_ms / count if count else 0.0,
+            'max_ms': max_ms,
+            'p50_ms': self.quantile(0.5),
+            'p95_ms': self.quantile(0.95),
+            'p99_ms': self.quantile(0.99),
+            'buckets': dict(zip(labels, counts)),
+        }
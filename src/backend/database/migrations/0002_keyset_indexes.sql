@@ -0,0 +1,31 @@
+-- Keyset pagination orders every table by (shift_date, created_at, id).
+-- SQLite appends the rowid to each index entry, so an index on
+-- (shift_date, created_at) covers the full key and also serves the older
+-- shift_date-only orderings. It replaces the single-column indexes.
+
+DROP INDEX IF EXISTS idx_power_positions_shift_date;
+CREATE INDEX IF NOT EXISTS idx_power_positions_shift_date_created
+    ON power_positions(shift_date, created_at);
+
+DROP INDEX IF EXISTS idx_gas_positions_shift_date;
+CREATE INDEX IF NOT EXISTS idx_gas_positions_shift_date_created
+    ON gas_positions(shift_date, created_at);
+
+DROP INDEX IF EXISTS idx_plant_status_shift_date;
+CREATE INDEX IF NOT EXISTS idx_plant_status_shift_date_created
+    ON plant_status(shift_date, created_at);
+
+DROP INDEX IF EXISTS idx_power_system_status_shift_date;
+CREATE INDEX IF NOT EXISTS idx_power_system_status_shift_date_created
+    ON power_system_status(shift_date, created_at);
+
+CREATE INDEX IF NOT EXISTS idx_notifications_shift_date_created
+    ON notifications(shift_date, created_at);
+
+DROP INDEX IF EXISTS idx_it_issues_shift_date;
+CREATE INDEX IF NOT EXISTS idx_it_issues_shift_date_created
+    ON it_issues(shift_date, created_at);
+
+DROP INDEX IF EXISTS idx_competitor_activity_shift_date;
+CREATE INDEX IF NOT EXISTS idx_competitor_activity_shift_date_created
+    ON competitor_activity(shift_date, created_at);
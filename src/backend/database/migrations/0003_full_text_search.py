@@ -0,0 +1,73 @@
+"""Add the search_index FTS5 table, its sync triggers and an initial build.
+
+Every free-text row of every table is mirrored into one FTS5 table so that
+a single MATCH searches all sections. The FTS rowid is ``id * 16 + code``,
+which lets the triggers find a row's entry by rowid instead of scanning.
+"""
+
+# (table, code, title expression, body expression); {r} is the row alias
+SOURCES = (
+    ('handover_logs', 1, "{r}.trader_name", "coalesce({r}.notes, '')"),
+    ('power_positions', 2, "coalesce({r}.portfolio_status, '')", "{r}.position_details"),
+    ('gas_positions', 3, "coalesce({r}.portfolio_status, '')", "{r}.position_details"),
+    ('plant_status', 4, "{r}.plant_name", "{r}.status || ' ' || coalesce({r}.notes, '')"),
+    ('power_system_status', 5, "{r}.system_name", "{r}.status || ' ' || coalesce({r}.notes, '')"),
+    ('notifications', 6, "{r}.title", "{r}.message"),
+    ('it_issues', 7, "{r}.title", "{r}.description"),
+    ('competitor_activity', 8, "{r}.competitor_name", "{r}.activity_details"),
+    ('comments', 9, "''", "{r}.comment_text"),
+)
+
+
+def _values(alias, table, code, title, body):
+    """search_index column values for the row called alias."""
+    return (
+        f"{alias}.id * 16 + {code}, '{table}', {alias}.id, {alias}.shift_date, "
+        f"{title.format(r=alias)}, {body.format(r=alias)}"
+    )
+
+
+def upgrade(conn):
+    conn.execute(
+        """CREATE VIRTUAL TABLE search_index USING fts5(
+               source UNINDEXED,
+               row_id UNINDEXED,
+               shift_date UNINDEXED,
+               title,
+               body,
+               tokenize = 'porter unicode61 remove_diacritics 2'
+           )"""
+    )
+    for table, code, title, body in SOURCES:
+        insert = (
+            "INSERT INTO search_index (rowid, source, row_id, shift_date, title, body) "
+            f"VALUES ({_values('NEW', table, code, title, body)});"
+        )
+        conn.execute(
+            f"""CREATE TRIGGER {table}_search_insert AFTER INSERT ON {table} BEGIN
+                    {insert}
+                END"""
+        )
+        conn.execute(
+            f"""CREATE TRIGGER {table}_search_update AFTER UPDATE ON {table} BEGIN
+                    DELETE FROM search_index WHERE rowid = OLD.id * 16 + {code};
+                    {insert}
+                END"""
+        )
+        conn.execute(
+            f"""CREATE TRIGGER {table}_search_delete AFTER DELETE ON {table} BEGIN
+                    DELETE FROM search_index WHERE rowid = OLD.id * 16 + {code};
+                END"""
+        )
+
+
+def backfill(migrator):
+    for table, code, title, body in SOURCES:
+        migrator.backfill_by_id(
+            table,
+            f"""INSERT INTO search_index (rowid, source, row_id, shift_date, title, body)
+                SELECT {_values('t', table, code, title, body)}
+                FROM {table} t
+                WHERE t.id > ? AND t.id <= ?
+                  AND NOT EXISTS (SELECT 1 FROM search_index WHERE rowid = t.id * 16 + {code})"""
+        )
@@ -0,0 +1,10 @@
+-- Registry of per-year archive files holding shifts moved out of the hot
+-- tables (see archive.py). Read connections attach every file listed here;
+-- sealed files no longer change and are attached as immutable.
+CREATE TABLE archive_files (
+    year INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    sealed BOOLEAN NOT NULL DEFAULT 0,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
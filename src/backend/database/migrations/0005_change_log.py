@@ -0,0 +1,41 @@
+"""Add the change_log table, its capture triggers and updated_at indexes.
+
+Every insert, update and delete on an application table appends a row to
+change_log. ``seq`` is AUTOINCREMENT so numbers are never reused, even
+after old entries are pruned. The updated_at indexes serve the
+get_*_updated_since methods.
+"""
+
+TABLES = (
+    'handover_logs',
+    'power_positions',
+    'gas_positions',
+    'plant_status',
+    'power_system_status',
+    'notifications',
+    'it_issues',
+    'competitor_activity',
+    'comments',
+)
+
+
+def upgrade(conn):
+    conn.execute(
+        """CREATE TABLE change_log (
+               seq INTEGER PRIMARY KEY AUTOINCREMENT,
+               table_name TEXT NOT NULL,
+               row_id INTEGER NOT NULL,
+               operation TEXT NOT NULL CHECK (operation IN ('insert', 'update', 'delete')),
+               changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+           )"""
+    )
+    for table in TABLES:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_updated_at ON {table}(updated_at)")
+        for event, operation, alias in (('INSERT', 'insert', 'NEW'), ('UPDATE', 'update', 'NEW'),
+                                         ('DELETE', 'delete', 'OLD')):
+            conn.execute(
+                f"""CREATE TRIGGER {table}_change_{operation} AFTER {event} ON {table} BEGIN
+                        INSERT INTO change_log (table_name, row_id, operation)
+                        VALUES ('{table}', {alias}.id, '{operation}');
+                    END"""
+            )
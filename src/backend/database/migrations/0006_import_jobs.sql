@@ -0,0 +1,14 @@
+-- Progress of bulk imports (see importer.py). Each chunk of rows is
+-- committed together with the job's progress, so an interrupted import
+-- resumes after its last committed chunk.
+CREATE TABLE import_jobs (
+    job_id TEXT PRIMARY KEY,
+    table_name TEXT NOT NULL,
+    source TEXT NOT NULL,
+    records_done INTEGER NOT NULL DEFAULT 0,
+    rows_inserted INTEGER NOT NULL DEFAULT 0,
+    rows_rejected INTEGER NOT NULL DEFAULT 0,
+    rejects_offset INTEGER NOT NULL DEFAULT 0,
+    finished BOOLEAN NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,24 @@
+"""Add archive_state, whose generation changes with every archive_files change.
+
+Read connections attach the archives listed in archive_files. An archive
+pass may run in another process, so readers compare this generation on
+checkout and re-attach when it has moved (see archive.refresh_archives).
+The single row is read by rowid, which is cheaper than reading the
+registry itself.
+"""
+
+
+def upgrade(conn):
+    conn.execute(
+        """CREATE TABLE archive_state (
+               id INTEGER PRIMARY KEY CHECK (id = 1),
+               generation INTEGER NOT NULL DEFAULT 0
+           )"""
+    )
+    conn.execute("INSERT INTO archive_state (id) VALUES (1)")
+    for event in ('INSERT', 'UPDATE', 'DELETE'):
+        conn.execute(
+            f"""CREATE TRIGGER archive_files_{event.lower()}_generation AFTER {event} ON archive_files BEGIN
+                    UPDATE archive_state SET generation = generation + 1 WHERE id = 1;
+                END"""
+        )
@@ -0,0 +1 @@
+"""Numbered schema migrations applied on top of schema.sql (see migrator.py)."""
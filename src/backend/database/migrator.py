@@ -0,0 +1,326 @@
+"""Versioned schema migrations for the shift handover database.
+
+Version 1 is the baseline schema in ``schema.sql``. Later changes live in the
+``migrations`` directory as numbered files, either ``NNNN_name.sql`` or
+``NNNN_name.py``. A Python migration defines ``upgrade(conn)``, which runs in
+the same transaction that records the new version, and may define
+``backfill(migrator)`` for data changes that are too large for one
+transaction. Backfills run afterwards in small committed batches and are
+resumed on the next start if they were interrupted.
+"""
+import hashlib
+import importlib.util
+import logging
+import os
+import re
+import sqlite3
+import time
+from contextlib import AbstractContextManager
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(__file__)
+BASELINE_SCHEMA = os.path.join(BASE_DIR, 'schema.sql')
+MIGRATIONS_DIR = os.path.join(BASE_DIR, 'migrations')
+
+_MIGRATION_FILE = re.compile(r'^(\d{4})_(\w+)\.(sql|py)$')
+
+SCHEMA_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    schema_hash TEXT NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP
+)
+"""
+
+
+class MigrationError(Exception):
+    """Raised when the database schema cannot be brought up to date."""
+
+
+class Migration:
+    """A single numbered schema migration."""
+
+    def __init__(self, version: int, name: str, path: str):
+        """Initialize migration.
+
+        Args:
+            version: Migration number
+            name: Descriptive name taken from the file name
+            path: Path to the .sql or .py migration file
+        """
+        self.version = version
+        self.name = name
+        self.path = path
+        with open(path, 'rb') as f:
+            self.checksum = hashlib.sha256(f.read()).hexdigest()
+        self._module = None
+
+    @property
+    def is_python(self) -> bool:
+        return self.path.endswith('.py')
+
+    @property
+    def module(self):
+        """Import a Python migration module on first use."""
+        if self._module is None:
+            spec = importlib.util.spec_from_file_location(
+                f"_migration_{self.version:04d}_{self.name}", self.path
+            )
+            self._module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(self._module)
+        return self._module
+
+    @property
+    def has_backfill(self) -> bool:
+        return self.is_python and hasattr(self.module, 'backfill')
+
+    def upgrade(self, conn: sqlite3.Connection):
+        """Apply the schema change on a connection inside a transaction."""
+        if self.is_python:
+            self.module.upgrade(conn)
+            return
+        with open(self.path, 'r') as f:
+            for statement in split_statements(f.read()):
+                conn.execute(statement)
+
+
+def split_statements(script: str) -> List[str]:
+    """Split a SQL script into complete statements.
+
+    executescript() commits before it runs, so migrations execute statements
+    one at a time to keep the schema change and its version row atomic.
+    """
+    statements = []
+    pending = ''
+    for line in script.splitlines(keepends=True):
+        pending += line
+        if sqlite3.complete_statement(pending):
+            statements.append(pending.strip())
+            pending = ''
+    leftover = [
+        line for line in pending.splitlines()
+        if line.strip() and not line.strip().startswith('--')
+    ]
+    if leftover:
+        raise MigrationError(f"Incomplete SQL statement: {pending.strip()}")
+    return statements
+
+
+@lru_cache(maxsize=None)
+def load_migrations(migrations_dir: str = MIGRATIONS_DIR) -> Tuple[Migration, ...]:
+    """Load the baseline schema and every numbered migration, in order.
+
+    Args:
+        migrations_dir: Directory holding numbered migration files
+
+    Returns:
+        Migrations sorted by version
+    """
+    migrations = [Migration(1, 'baseline', BASELINE_SCHEMA)]
+    if os.path.isdir(migrations_dir):
+        for filename in sorted(os.listdir(migrations_dir)):
+            match = _MIGRATION_FILE.match(filename)
+            if not match:
+                continue
+            version = int(match.group(1))
+            if version <= migrations[-1].version:
+                raise MigrationError(f"Duplicate or out-of-order migration number in {filename}")
+            migrations.append(Migration(version, match.group(2), os.path.join(migrations_dir, filename)))
+    return tuple(migrations)
+
+
+def schema_hashes(migrations: Tuple[Migration, ...]) -> List[str]:
+    """Return the cumulative schema hash after each migration."""
+    hashes = []
+    digest = hashlib.sha256()
+    for migration in migrations:
+        digest.update(f"{migration.version}:{migration.checksum}\n".encode())
+        hashes.append(digest.hexdigest())
+    return hashes
+
+
+class Migrator:
+    """Applies pending migrations through a DatabaseManager connection factory."""
+
+    def __init__(
+        self,
+        get_connection: Callable[..., AbstractContextManager],
+        migrations_dir: str = MIGRATIONS_DIR,
+    ):
+        """Initialize migrator.
+
+        Args:
+            get_connection: Factory such as DatabaseManager.get_connection,
+                accepting ``write=True`` for the write connection
+            migrations_dir: Directory holding numbered migration files
+        """
+        self.get_connection = get_connection
+        self.migrations = load_migrations(migrations_dir)
+        self.target_hash = schema_hashes(self.migrations)[-1]
+
+    def is_current(self) -> bool:
+        """Check the recorded schema hash without taking the write lock."""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute(
+                    """SELECT schema_hash,
+                              (SELECT COUNT(*) FROM schema_version WHERE completed_at IS NULL)
+                       FROM schema_version ORDER BY version DESC LIMIT 1"""
+                ).fetchone()
+        except sqlite3.OperationalError:
+            return False
+        return row is not None and row[0] == self.target_hash and row[1] == 0
+
+    def current_version(self) -> int:
+        """Get the highest applied migration version (0 for a new database)."""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+        except sqlite3.OperationalError:
+            return 0
+        return row[0] or 0
+
+    def migrate(self) -> List[int]:
+        """Apply pending migrations and finish interrupted backfills.
+
+        Returns:
+            Versions that were applied or completed by this call
+        """
+        if self.is_current():
+            return []
+
+        hashes = schema_hashes(self.migrations)
+        with self.get_connection(write=True) as conn:
+            conn.execute(SCHEMA_VERSION_TABLE)
+            conn.commit()
+            applied = {
+                row['version']: row
+                for row in conn.execute("SELECT version, checksum, completed_at FROM schema_version")
+            }
+
+        known = {m.version for m in self.migrations}
+        unknown = sorted(set(applied) - known)
+        if unknown:
+            raise MigrationError(f"Database has migrations this code does not know about: {unknown}")
+
+        done = []
+        for migration, schema_hash in zip(self.migrations, hashes):
+            row = applied.get(migration.version)
+            if row is not None and row['checksum'] != migration.checksum:
+                raise MigrationError(
+                    f"Migration {migration.version} ({migration.name}) changed after it was applied"
+                )
+            if row is None:
+                self._apply(migration, schema_hash)
+            elif row['completed_at'] is not None:
+                continue
+            if migration.has_backfill:
+                logger.info("Running backfill for migration %s (%s)", migration.version, migration.name)
+                migration.module.backfill(self)
+            with self.get_connection(write=True) as conn:
+                conn.execute(
+                    "UPDATE schema_version SET completed_at = CURRENT_TIMESTAMP WHERE version = ?",
+                    (migration.version,)
+                )
+                conn.commit()
+            done.append(migration.version)
+        return done
+
+    def _apply(self, migration: Migration, schema_hash: str):
+        """Run one migration and record it in a single transaction."""
+        logger.info("Applying migration %s (%s)", migration.version, migration.name)
+        with self.get_connection(write=True) as conn:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                migration.upgrade(conn)
+                conn.execute(
+                    """INSERT INTO schema_version (version, name, checksum, schema_hash)
+                       VALUES (?, ?, ?, ?)""",
+                    (migration.version, migration.name, migration.checksum, schema_hash)
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def backfill(
+        self,
+        table: str,
+        assignments: str,
+        where: str,
+        params: tuple = (),
+        batch_size: int = 1000,
+        pause: float = 0.01,
+    ) -> int:
+        """Update rows in small committed batches.
+
+        Each batch takes and releases the write connection, so application
+        writes can interleave with a long backfill. ``where`` must stop
+        matching a row once it has been updated, which also makes an
+        interrupted backfill safe to resume.
+
+        Args:
+            table: Table to update
+            assignments: SET clause, e.g. "notes_length = length(notes)"
+            where: Condition selecting rows that still need updating
+            params: Parameters for the SET and WHERE clauses, in that order
+            batch_size: Rows updated per transaction
+            pause: Seconds to sleep between batches
+
+        Returns:
+            Number of rows updated
+        """
+        total = 0
+        while True:
+            with self.get_connection(write=True) as conn:
+                cursor = conn.execute(
+                    f"""UPDATE {table} SET {assignments}
+                        WHERE rowid IN (SELECT rowid FROM {table} WHERE {where} LIMIT ?)""",
+                    (*params, batch_size)
+                )
+                conn.commit()
+                updated = cursor.rowcount
+            total += updated
+            if updated < batch_size:
+                return total
+            time.sleep(pause)
+
+    def backfill_by_id(
+        self,
+        table: str,
+        statement: str,
+        batch_size: int = 1000,
+        pause: float = 0.01,
+    ):
+        """Run a statement over consecutive id ranges of a table.
+
+        Suited to copying rows into derived tables. ``statement`` receives
+        the parameters ``(low, high)`` and should restrict itself to
+        ``id > low AND id <= high``; it must skip rows that were already
+        copied so an interrupted backfill can be resumed.
+
+        Args:
+            table: Table whose ids drive the batches
+            statement: SQL with two placeholders for the id range
+            batch_size: Ids covered per transaction
+            pause: Seconds to sleep between batches
+        """
+        low = 0
+        while True:
+            with self.get_connection(write=True) as conn:
+                high = conn.execute(
+                    f"SELECT MAX(id) FROM (SELECT id FROM {table} WHERE id > ? ORDER BY id LIMIT ?)",
+                    (low, batch_size)
+                ).fetchone()[0]
+                if high is None:
+                    return
+                conn.execute(statement, (low, high))
+                conn.commit()
+            low = high
+            time.sleep(pause)
@@ -0,0 +1,180 @@
+"""Keyset (cursor) pagination helpers for list queries."""
+import base64
+import json
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Every table is paged newest first on this key. id breaks ties between
+# rows created in the same second.
+PAGE_KEY = ('shift_date', 'created_at', 'id')
+
+NEXT = 'next'
+PREV = 'prev'
+
+
+class Page(NamedTuple):
+    """One page of a list query.
+
+    Attributes:
+        rows: Rows on this page, newest first, as a DataFrame or a list
+            of row tuples
+        next_cursor: Cursor for the following (older) page, or None at the end
+        prev_cursor: Cursor for the preceding (newer) page, or None at the start
+        total: Total row count, only when requested
+    """
+    rows: Union['pd.DataFrame', List[Any]]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+    total: Optional[int] = None
+
+
+def encode_cursor(key: Tuple[Any, ...], direction: str) -> str:
+    """Encode a page key and direction as an opaque cursor string.
+
+    Args:
+        key: Values of PAGE_KEY for the boundary row
+        direction: NEXT to read older rows, PREV to read newer rows
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({'k': list(key), 'd': direction}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[Tuple[Any, ...], str]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (key, direction)
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key, direction = tuple(payload['k']), payload['d']
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid page cursor") from None
+    if len(key) != len(PAGE_KEY) or direction not in (NEXT, PREV):
+        raise ValueError("Invalid page cursor")
+    return key, direction
+
+
+def date_cursor(day: date) -> str:
+    """Cursor for the page whose newest rows are those of a shift date.
+
+    The cursor points just past the last row of the day, so the page read
+    with it starts at the day's newest row and its prev_cursor leads to
+    newer days.
+
+    Args:
+        day: Shift date to jump to
+    """
+    # Every row of the day sorts below the first key of the next day
+    return encode_cursor(((day + timedelta(days=1)).isoformat(), '', 0), NEXT)
+
+
+def build_page_query(
+    table: str,
+    limit: int,
+    cursor: Optional[str],
+    columns: str = '*',
+    where: str = '',
+    params: tuple = (),
+) -> Tuple[str, tuple, str]:
+    """Build the SQL for one keyset page.
+
+    One extra row is fetched so the caller can tell whether another page
+    exists in the reading direction.
+
+    Args:
+        table: Table to read
+        limit: Page size
+        cursor: Cursor from a previous Page, or None for the first page
+        columns: Column list for the SELECT
+        where: Optional extra predicate, without the WHERE keyword
+        params: Parameters for the extra predicate
+
+    Returns:
+        Tuple of (sql, params, direction)
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    key_columns = ', '.join(PAGE_KEY)
+    predicates = [f"({where})"] if where else []
+    params = tuple(params)
+    direction = NEXT
+    if cursor is not None:
+        key, direction = decode_cursor(cursor)
+        operator = '<' if direction == NEXT else '>'
+        predicates.append(f"({key_columns}) {operator} ({', '.join('?' for _ in key)})")
+        params += key
+    order = 'DESC' if direction == NEXT else 'ASC'
+    sql = f"SELECT {columns} FROM {table}"
+    if predicates:
+        sql += f" WHERE {' AND '.join(predicates)}"
+    sql += f" ORDER BY {', '.join(f'{column} {order}' for column in PAGE_KEY)} LIMIT ?"
+    return sql, params + (limit + 1,), direction
+
+
+def make_page(
+    rows: Union['pd.DataFrame', List[Any]],
+    limit: int,
+    cursor: Optional[str],
+    direction: str,
+    total: Optional[int] = None,
+) -> Page:
+    """Turn the rows fetched by build_page_query into a Page.
+
+    Args:
+        rows: Rows fetched with one extra row beyond limit, as a DataFrame
+            or a list of row tuples
+        limit: Page size
+        cursor: Cursor the page was requested with
+        direction: Direction returned by build_page_query
+        total: Optional total row count
+
+    Returns:
+        Page with rows ordered newest first
+    """
+    has_more = len(rows) > limit
+    if isinstance(rows, list):
+        rows = rows[:limit]
+        if direction == PREV:
+            rows.reverse()
+    else:
+        rows = rows.iloc[:limit]
+        if direction == PREV:
+            rows = rows.iloc[::-1]
+        rows = rows.reset_index(drop=True)
+
+    if len(rows) == 0:
+        return Page(rows, None, None, total)
+
+    first = _row_key(rows, 0)
+    last = _row_key(rows, len(rows) - 1)
+    if direction == NEXT:
+        has_next, has_prev = has_more, cursor is not None
+    else:
+        has_next, has_prev = True, has_more
+    return Page(
+        rows,
+        encode_cursor(last, NEXT) if has_next else None,
+        encode_cursor(first, PREV) if has_prev else None,
+        total,
+    )
+
+
+def _row_key(rows: Union['pd.DataFrame', List[Any]], index: int) -> List[Any]:
+    """Extract PAGE_KEY values from a row as plain Python values."""
+    if isinstance(rows, list):
+        return [rows[index][column] for column in PAGE_KEY]
+    return [
+        value.item() if hasattr(value, 'item') else value
+        for value in (rows.iloc[index][column] for column in PAGE_KEY)
+    ]
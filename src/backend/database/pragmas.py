@@ -0,0 +1,89 @@
+"""SQLite PRAGMA performance profiles for the shift handover application."""
+import sqlite3
+from typing import Any, Dict
+
+# Named PRAGMA profiles, selected with the DB_PROFILE environment variable.
+# cache_size is negative so SQLite reads it as KiB rather than pages.
+PRAGMA_PROFILES: Dict[str, Dict[str, Any]] = {
+    'durable': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'mmap_size': 0,
+        'cache_size': -16000,
+        'temp_store': 'DEFAULT',
+        'busy_timeout': 5000,
+    },
+    'balanced': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 64 * 1024 * 1024,
+        'cache_size': -32000,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,
+    },
+    'read-heavy': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -128000,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 10000,
+    },
+}
+
+DEFAULT_PROFILE = 'balanced'
+
+_SYNCHRONOUS_NAMES = {0: 'OFF', 1: 'NORMAL', 2: 'FULL', 3: 'EXTRA'}
+_TEMP_STORE_NAMES = {0: 'DEFAULT', 1: 'FILE', 2: 'MEMORY'}
+
+
+def get_profile(name: str) -> Dict[str, Any]:
+    """Look up a PRAGMA profile by name.
+
+    Args:
+        name: Profile name (durable, balanced or read-heavy)
+
+    Returns:
+        Mapping of PRAGMA name to value
+    """
+    try:
+        return PRAGMA_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown database profile '{name}'. "
+            f"Expected one of: {', '.join(sorted(PRAGMA_PROFILES))}"
+        ) from None
+
+
+def apply_profile(conn: sqlite3.Connection, name: str):
+    """Apply a PRAGMA profile to a connection.
+
+    Args:
+        conn: Open SQLite connection
+        name: Profile name
+    """
+    for pragma, value in get_profile(name).items():
+        conn.execute(f"PRAGMA {pragma} = {value}").fetchall()
+
+
+def get_effective_settings(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """Read back the PRAGMA values SQLite actually applied.
+
+    SQLite silently clamps or ignores some settings (for example mmap_size
+    above the compile-time limit, or WAL on filesystems that lack shared
+    memory), so this reports what is really in effect.
+
+    Args:
+        conn: Open SQLite connection
+
+    Returns:
+        Mapping of PRAGMA name to effective value
+    """
+    settings = {}
+    for pragma in PRAGMA_PROFILES[DEFAULT_PROFILE]:
+        row = conn.execute(f"PRAGMA {pragma}").fetchone()
+        settings[pragma] = row[0] if row else None
+    settings['journal_mode'] = str(settings['journal_mode']).upper()
+    settings['synchronous'] = _SYNCHRONOUS_NAMES.get(settings['synchronous'], settings['synchronous'])
+    settings['temp_store'] = _TEMP_STORE_NAMES.get(settings['temp_store'], settings['temp_store'])
+    return settings
@@ -0,0 +1,66 @@
+"""Column projection and preview reads for list views.
+
+List pages show a line or two of each long text column, so they can ask for
+a preview instead: the column is cut with ``substr()`` in SQL and a
+``<column>_length`` column carries its full length, which tells the page
+whether there is more to load by id.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Long free-text columns per table
+BODY_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'handover_logs': ('notes',),
+    'power_positions': ('position_details',),
+    'gas_positions': ('position_details',),
+    'plant_status': ('notes',),
+    'power_system_status': ('notes',),
+    'notifications': ('message',),
+    'it_issues': ('description',),
+    'competitor_activity': ('activity_details',),
+    'comments': ('comment_text',),
+}
+
+LENGTH_SUFFIX = '_length'
+
+
+def build_select_list(
+    table: str,
+    available: Sequence[str],
+    columns: Optional[Iterable[str]] = None,
+    preview: Optional[int] = None,
+    required: Iterable[str] = ('id',),
+) -> str:
+    """Build the column list of a SELECT.
+
+    Args:
+        table: Table being read
+        available: Every column of the table, in schema order
+        columns: Columns to return; None returns all of them
+        preview: Cut body columns to this many characters and add a
+            ``<column>_length`` column with the full length
+        required: Columns always returned, e.g. the id or a page key
+
+    Returns:
+        Comma-separated column list
+    """
+    if columns is None and preview is None:
+        return '*'
+    if preview is not None and preview < 1:
+        raise ValueError("preview must be at least 1 character")
+    selected: List[str] = list(available if columns is None else columns)
+    unknown = set(selected) - set(available)
+    if unknown:
+        raise ValueError(f"Unknown columns for {table}: {sorted(unknown)}")
+    for column in required:
+        if column not in selected:
+            selected.append(column)
+
+    bodies = BODY_COLUMNS.get(table, ()) if preview is not None else ()
+    expressions = []
+    for column in selected:
+        if column in bodies:
+            expressions.append(f"substr({column}, 1, {int(preview)}) AS {column}")
+            expressions.append(f"length({column}) AS {column}{LENGTH_SUFFIX}")
+        else:
+            expressions.append(column)
+    return ', '.join(expressions)
@@ -0,0 +1,252 @@
+"""In-process cache for DatabaseManager read methods.
+
+Results are keyed by method name and arguments. Every table has a generation
+counter; a cached result remembers the generations of the tables it was read
+from and is only served while none of them has changed. Write methods bump
+the counters of the tables they touch, so Streamlit reruns that change no
+data are answered from memory without touching SQLite.
+
+The cache only sees writes made through the DatabaseManager that owns it.
+Changes made by another process are picked up after ``invalidate()``, or
+through an ``external_check`` that the cache runs at most once per
+``check_interval`` seconds and that reports whether it saw such a change.
+"""
+import functools
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Mapping, Optional, Tuple
+
+from src.backend.database.pagination import Page
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _is_frame(value: Any) -> bool:
+    """Check for a DataFrame without importing pandas."""
+    pd = sys.modules.get('pandas')
+    return pd is not None and isinstance(value, pd.DataFrame)
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory held by a cached result, in bytes."""
+    if _is_frame(value):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def detach(value: Any) -> Any:
+    """Return a copy of a cached result that callers may modify freely.
+
+    DataFrames are copied shallowly, which is cheap; adding or replacing
+    columns on the copy leaves the cached frame untouched.
+    """
+    if _is_frame(value):
+        return value.copy(deep=False)
+    if isinstance(value, Page):
+        return value._replace(rows=detach(value.rows))
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+class QueryCache:
+    """Memory-bounded LRU cache invalidated by per-table generation counters."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES,
+                 external_check: Optional[Callable[[], bool]] = None, check_interval: float = 1.0):
+        """Initialize query cache.
+
+        Args:
+            max_bytes: Approximate upper bound on the memory held by results
+            external_check: Returns True when another process changed the
+                database; everything is invalidated then
+            check_interval: Minimum seconds between external checks
+        """
+        self.max_bytes = max_bytes
+        self.external_check = external_check
+        self.check_interval = check_interval
+        self._next_check = 0.0
+        self._entries: 'OrderedDict[Hashable, Tuple[Tuple[str, ...], Tuple[int, ...], Any, int]]' = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def poll(self):
+        """Run the external check if it is due."""
+        if self.external_check is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_check:
+                return
+            self._next_check = now + self.check_interval
+        if self.external_check():
+            self.invalidate()
+
+    def generations(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        """Get the current generation of each table."""
+        with self._lock:
+            return tuple(self._generations.get(table, 0) for table in tables)
+
+    def get(self, key: Hashable, generations: Tuple[int, ...]) -> Tuple[bool, Any]:
+        """Look up a result read at the given table generations.
+
+        Returns:
+            Tuple of (found, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != generations:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[2]
+
+    def put(self, key: Hashable, tables: Tuple[str, ...], generations: Tuple[int, ...], value: Any):
+        """Store a result, evicting least recently used entries to stay in bounds.
+
+        Args:
+            key: Method name and arguments
+            tables: Tables the result was read from
+            generations: Generations of those tables before the read started
+            value: Result to cache
+        """
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generations != tuple(self._generations.get(table, 0) for table in tables):
+                # A write finished while the query ran; the result may be stale
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[3]
+            self._entries[key] = (tables, generations, value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, _, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self, tables: Optional[Iterable[str]] = None):
+        """Bump table generations and drop the results read from them.
+
+        Args:
+            tables: Tables that changed; None invalidates everything
+        """
+        with self._lock:
+            self.invalidations += 1
+            if tables is None:
+                # Every cached read also depends on the '*' generation
+                self._generations['*'] = self._generations.get('*', 0) + 1
+                self._entries.clear()
+                self._bytes = 0
+                return
+            changed = set(tables)
+            for table in changed:
+                self._generations[table] = self._generations.get(table, 0) + 1
+            for key in [key for key, entry in self._entries.items() if changed.intersection(entry[0])]:
+                self._bytes -= self._entries.pop(key)[3]
+
+    def clear(self):
+        """Drop every cached result and reset the statistics."""
+        self.invalidate()
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    @contextmanager
+    def tracked_write(self, tables: Tuple[str, ...]) -> Iterator[None]:
+        """Mark the current thread as writing to known tables.
+
+        The tables are invalidated when the block exits, whether or not the
+        write succeeded.
+        """
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            self.invalidate(tables)
+
+    @property
+    def in_tracked_write(self) -> bool:
+        """Whether the current thread is inside a tracked write method."""
+        return getattr(self._local, 'depth', 0) > 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and memory use."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'generations': {k: v for k, v in self._generations.items() if k != '*'},
+            }
+
+
+def cached(*tables: str) -> Callable:
+    """Cache a DatabaseManager read method that reads from ``tables``."""
+    read_tables = tables + ('*',)
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = self.cache
+            if cache is None:
+                return method(self, *args, **kwargs)
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable arguments such as lists are not cached
+                return method(self, *args, **kwargs)
+            cache.poll()
+            generations = cache.generations(read_tables)
+            found, value = cache.get(key, generations)
+            if not found:
+                value = method(self, *args, **kwargs)
+                cache.put(key, read_tables, generations, value)
+            return detach(value)
+        return wrapper
+    return decorator
+
+
+def invalidates(*tables: str) -> Callable:
+    """Invalidate cached reads of ``tables`` after a DatabaseManager write method."""
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = self.cache
+            if cache is None:
+                return method(self, *args, **kwargs)
+            with cache.tracked_write(tables):
+                return method(self, *args, **kwargs)
+        wrapper.invalidates = tables
+        return wrapper
+    return decorator
@@ -0,0 +1,171 @@
+"""Retry DatabaseManager operations that fail on a locked database.
+
+SQLite's busy timeout covers most lock waits, but some conflicts return
+SQLITE_BUSY at once (a read transaction upgrading to a write while another
+connection commits, or a checkpoint), and another process can hold the
+write lock for longer than the timeout. Instead of raising ``database is
+locked`` into the page, operations are retried with jittered exponential
+backoff until a deadline, and the waits are recorded so operators can see
+how much contention there is.
+"""
+import functools
+import logging
+import random
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, Callable, Dict
+
+from src.backend.database.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+READ = 'read'
+WRITE = 'write'
+
+# Primary result codes of SQLite lock errors
+_SQLITE_BUSY = 5
+_SQLITE_LOCKED = 6
+
+_active = threading.local()
+
+
+def is_lock_error(error: BaseException) -> bool:
+    """Check whether an exception is an SQLite busy/locked error."""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    code = getattr(error, 'sqlite_errorcode', None)
+    if code is not None:
+        return code & 0xff in (_SQLITE_BUSY, _SQLITE_LOCKED)
+    return 'locked' in str(error) or 'busy' in str(error)
+
+
+class RetryPolicy:
+    """Backoff settings for operations that hit a locked database."""
+
+    def __init__(self, base_delay: float = 0.005, max_delay: float = 0.25,
+                 read_deadline: float = 2.0, write_deadline: float = 10.0):
+        """Initialize retry policy.
+
+        Args:
+            base_delay: Backoff before the first retry, in seconds; doubled
+                for each further retry
+            max_delay: Upper bound of a single backoff
+            read_deadline: Give up reads this many seconds after the first attempt
+            write_deadline: Give up writes this many seconds after the first attempt
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.read_deadline = read_deadline
+        self.write_deadline = write_deadline
+
+    def deadline(self, kind: str) -> float:
+        """Total seconds an operation of this kind may spend retrying."""
+        return self.write_deadline if kind == WRITE else self.read_deadline
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to sleep before retry number ``attempt`` (from 0), with full jitter."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class ContentionMetrics:
+    """Lock-wait histograms and lock-failure counters per operation kind."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkout_wait = {READ: Histogram(), WRITE: Histogram()}
+        self.lock_wait = {READ: Histogram(), WRITE: Histogram()}
+        self._counters = {
+            kind: {'lock_errors': 0, 'retried_calls': 0, 'recovered_calls': 0, 'failed_calls': 0}
+            for kind in (READ, WRITE)
+        }
+
+    def record_checkout(self, kind: str, seconds: float):
+        """Record the time spent waiting for a pooled connection."""
+        self.checkout_wait[kind].observe(seconds)
+
+    def record_lock_error(self, kind: str):
+        """Count one attempt that failed on a lock."""
+        with self._lock:
+            self._counters[kind]['lock_errors'] += 1
+
+    def record_outcome(self, kind: str, waited: float, recovered: bool):
+        """Record a call that hit lock errors, and whether a retry succeeded."""
+        self.lock_wait[kind].observe(waited)
+        with self._lock:
+            counters = self._counters[kind]
+            counters['retried_calls'] += 1
+            counters['recovered_calls' if recovered else 'failed_calls'] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters and wait histograms for reads and writes."""
+        with self._lock:
+            counters = {kind: dict(values) for kind, values in self._counters.items()}
+        return {
+            kind: dict(
+                counters[kind],
+                checkout_wait=self.checkout_wait[kind].snapshot(),
+                lock_wait=self.lock_wait[kind].snapshot(),
+            )
+            for kind in (READ, WRITE)
+        }
+
+
+def _replayable(value: Any) -> Any:
+    """Turn a one-shot iterator into a list, so a retry sees every item again."""
+    return list(value) if isinstance(value, Iterator) else value
+
+
+def retry_on_lock(method: Callable, kind: str) -> Callable:
+    """Wrap a DatabaseManager method to retry it on lock errors.
+
+    Only the outermost operation on a thread retries, so nested calls do
+    not multiply the waits. Calls run inside a group-commit batch are not
+    retried on their own; a batch that fails on a lock fails all its
+    calls, and each caller retries.
+
+    Iterator arguments, such as a generator of rows for a ``*_many``
+    method, are read into lists before the first attempt; otherwise a
+    retry would only see the rows the failed attempt had not consumed.
+
+    Args:
+        method: Method to wrap
+        kind: READ or WRITE, which selects the deadline and the metrics
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        pipeline = self.write_pipeline
+        if getattr(_active, 'depth', 0) or (pipeline is not None and pipeline.on_writer_thread):
+            return method(self, *args, **kwargs)
+        args = tuple(_replayable(arg) for arg in args)
+        kwargs = {name: _replayable(value) for name, value in kwargs.items()}
+        policy: RetryPolicy = self.retry_policy
+        metrics: ContentionMetrics = self.contention
+        _active.depth = 1
+        start = time.monotonic()
+        attempt = 0
+        try:
+            while True:
+                try:
+                    result = method(self, *args, **kwargs)
+                except sqlite3.OperationalError as e:
+                    if not is_lock_error(e):
+                        raise
+                    metrics.record_lock_error(kind)
+                    elapsed = time.monotonic() - start
+                    delay = policy.backoff(attempt)
+                    if elapsed + delay > policy.deadline(kind):
+                        metrics.record_outcome(kind, elapsed, recovered=False)
+                        logger.warning("%s gave up after %s lock errors in %.3fs: %s",
+                                       method.__name__, attempt + 1, elapsed, e)
+                        raise
+                    attempt += 1
+                    time.sleep(delay)
+                    continue
+                if attempt:
+                    metrics.record_outcome(kind, time.monotonic() - start, recovered=True)
+                return result
+        finally:
+            _active.depth = 0
+    return wrapper
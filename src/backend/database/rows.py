@@ -0,0 +1,84 @@
+"""Lightweight result rows, and lazy access to pandas.
+
+Read methods called with ``as_frame=False`` return lists of immutable row
+tuples instead of DataFrames. Each distinct column list gets a namedtuple
+subclass, created once and cached. Row fields are read as attributes
+(``row.notes``) or by column name (``row['notes']``), like a DataFrame row,
+so pages can switch between the two.
+
+pandas is imported only the first time a DataFrame is requested.
+"""
+import importlib
+import sqlite3
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+
+class RowMixin:
+    """Name-based access for generated row tuples."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a column value, or default if the row has no such column."""
+        return getattr(self, key, default)
+
+    def keys(self) -> Tuple[str, ...]:
+        """Column names, so that dict(row) works."""
+        return self._fields
+
+
+@lru_cache(maxsize=None)
+def row_class(table: str, columns: Tuple[str, ...]) -> type:
+    """Get the row class for a table and column list.
+
+    Args:
+        table: Table the rows come from, used for the class name
+        columns: Column names in result order
+
+    Returns:
+        namedtuple subclass with RowMixin behaviour
+    """
+    name = ''.join(part.title() for part in table.split('_')) + 'Row'
+    base = namedtuple(name, columns)
+    return type(name, (RowMixin, base), {'__slots__': ()})
+
+
+def make_rows(table: str, cursor: sqlite3.Cursor) -> List[Any]:
+    """Fetch every row of an executed cursor as row tuples."""
+    cls = row_class(table, tuple(description[0] for description in cursor.description))
+    return [cls(*row) for row in cursor]
+
+
+def load_pandas():
+    """Import pandas on first use."""
+    return importlib.import_module('pandas')
+
+
+def read_frame(conn: sqlite3.Connection, sql: str, params: Sequence[Any] = ()):
+    """Run a query and return its result as a DataFrame."""
+    return load_pandas().read_sql_query(sql, conn, params=params)
+
+
+def fetch(conn: sqlite3.Connection, table: str, sql: str, params: Sequence[Any] = (), as_frame: bool = True):
+    """Run a query and return a DataFrame or a list of row tuples.
+
+    Args:
+        conn: Connection to run the query on
+        table: Table the rows come from
+        sql: Query to run
+        params: Query parameters
+        as_frame: Return a DataFrame (imports pandas) instead of rows
+    """
+    if as_frame:
+        return read_frame(conn, sql, params)
+    return make_rows(table, conn.execute(sql, params))
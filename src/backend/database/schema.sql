@@ -93,3 +93,46 @@ CREATE TABLE IF NOT EXISTS comments (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+
+-- Indexes
+-- Every list view orders by shift_date (newest first), so each table carries
+-- an index in that order. SQLite walks these backwards for DESC ordering,
+-- which avoids a sort and lets LIMIT queries stop after the first rows.
+CREATE INDEX IF NOT EXISTS idx_handover_logs_shift_date
+    ON handover_logs(shift_date, created_at);
+
+CREATE INDEX IF NOT EXISTS idx_power_positions_shift_date
+    ON power_positions(shift_date);
+
+CREATE INDEX IF NOT EXISTS idx_gas_positions_shift_date
+    ON gas_positions(shift_date);
+
+CREATE INDEX IF NOT EXISTS idx_plant_status_shift_date
+    ON plant_status(shift_date);
+
+CREATE INDEX IF NOT EXISTS idx_power_system_status_shift_date
+    ON power_system_status(shift_date);
+
+CREATE INDEX IF NOT EXISTS idx_notifications_shift_date_priority
+    ON notifications(shift_date, priority);
+
+-- Unresolved notifications list, newest first
+CREATE INDEX IF NOT EXISTS idx_notifications_resolved_shift_date
+    ON notifications(is_resolved, shift_date, priority);
+
+-- Counts and top-N by resolution state and priority
+CREATE INDEX IF NOT EXISTS idx_notifications_resolved_priority
+    ON notifications(is_resolved, priority, shift_date);
+
+CREATE INDEX IF NOT EXISTS idx_it_issues_shift_date
+    ON it_issues(shift_date);
+
+-- Open issue counts and lists by status
+CREATE INDEX IF NOT EXISTS idx_it_issues_status
+    ON it_issues(status, shift_date);
+
+CREATE INDEX IF NOT EXISTS idx_competitor_activity_shift_date
+    ON competitor_activity(shift_date);
+
+CREATE INDEX IF NOT EXISTS idx_comments_shift_date
+    ON comments(shift_date, created_at);
@@ -0,0 +1,173 @@
+"""Full-text search over every section, backed by the search_index FTS5 table."""
+import re
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+# Tables mirrored into search_index (see migrations/0003_full_text_search.py)
+SEARCHABLE_TABLES = (
+    'handover_logs',
+    'power_positions',
+    'gas_positions',
+    'plant_status',
+    'power_system_status',
+    'notifications',
+    'it_issues',
+    'competitor_activity',
+    'comments',
+)
+
+# Code of each table in the search_index rowid, ``id * 16 + code``; fixed by
+# migrations/0003_full_text_search.py
+SEARCH_CODES = {
+    'handover_logs': 1,
+    'power_positions': 2,
+    'gas_positions': 3,
+    'plant_status': 4,
+    'power_system_status': 5,
+    'notifications': 6,
+    'it_issues': 7,
+    'competitor_activity': 8,
+    'comments': 9,
+}
+
+# Control characters used to mark matches inside snippets; they never
+# appear in text typed into the forms.
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_END = '\x03'
+
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+
+class SearchHit(NamedTuple):
+    """A ranked full-text match.
+
+    Attributes:
+        table: Source table of the matching row
+        row_id: Id of the row in that table
+        shift_date: Shift date of the row
+        title: Title-like field of the row (trader, plant, title, ...)
+        snippet: Excerpt of the matching text
+        highlights: (start, end) offsets of matched terms within snippet
+        rank: bm25 rank; lower is a better match
+    """
+    table: str
+    row_id: int
+    shift_date: str
+    title: str
+    snippet: str
+    highlights: Tuple[Tuple[int, int], ...]
+    rank: float
+
+
+def index_rowid(table: str, row_id: Any) -> Any:
+    """search_index rowid of a row; row_id may also be an SQL expression."""
+    if isinstance(row_id, str):
+        return f"{row_id} * 16 + {SEARCH_CODES[table]}"
+    return row_id * 16 + SEARCH_CODES[table]
+
+
+def build_match_query(text: str) -> Optional[str]:
+    """Turn free text typed by a user into a safe FTS5 MATCH expression.
+
+    Every word must appear; the last word also matches as a prefix so
+    results update sensibly while the user is still typing.
+
+    Args:
+        text: Raw search box input
+
+    Returns:
+        MATCH expression, or None if the text has no searchable words
+    """
+    tokens = _TOKEN.findall(text or '')
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def parse_snippet(marked: str) -> Tuple[str, Tuple[Tuple[int, int], ...]]:
+    """Strip highlight markers from a snippet and record their offsets.
+
+    Args:
+        marked: Snippet containing HIGHLIGHT_START/HIGHLIGHT_END markers
+
+    Returns:
+        Tuple of (plain snippet, highlight offsets)
+    """
+    plain = []
+    highlights = []
+    length = 0
+    start = None
+    for char in marked:
+        if char == HIGHLIGHT_START:
+            start = length
+        elif char == HIGHLIGHT_END:
+            if start is not None:
+                highlights.append((start, length))
+            start = None
+        else:
+            plain.append(char)
+            length += 1
+    return ''.join(plain), tuple(highlights)
+
+
+def build_search_query(
+    match: str,
+    tables: Optional[Sequence[str]],
+    date_range: Optional[Tuple[Optional[str], Optional[str]]],
+    limit: int,
+) -> Tuple[str, tuple]:
+    """Build the ranked search SQL.
+
+    Args:
+        match: FTS5 MATCH expression
+        tables: Restrict hits to these source tables
+        date_range: (from, to) shift_date bounds; either may be None
+        limit: Maximum number of hits
+
+    Returns:
+        Tuple of (sql, params)
+    """
+    predicates = ["search_index MATCH ?"]
+    params: list = [match]
+    if tables is not None:
+        unknown = set(tables) - set(SEARCHABLE_TABLES)
+        if unknown:
+            raise ValueError(f"Tables are not searchable: {sorted(unknown)}")
+        predicates.append(f"source IN ({', '.join('?' for _ in tables)})")
+        params.extend(tables)
+    if date_range is not None:
+        date_from, date_to = date_range
+        if date_from:
+            predicates.append("shift_date >= ?")
+            params.append(str(date_from))
+        if date_to:
+            predicates.append("shift_date <= ?")
+            params.append(str(date_to))
+    sql = (
+        "SELECT source, row_id, shift_date, title, "
+        f"snippet(search_index, -1, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', '…', 16) AS snippet, "
+        "rank "
+        "FROM search_index "
+        f"WHERE {' AND '.join(predicates)} "
+        "ORDER BY rank LIMIT ?"
+    )
+    params.append(limit)
+    return sql, tuple(params)
+
+
+def make_hits(rows) -> List[SearchHit]:
+    """Convert search result rows into SearchHit objects."""
+    hits = []
+    for row in rows:
+        snippet, highlights = parse_snippet(row['snippet'] or '')
+        hits.append(SearchHit(
+            row['source'],
+            int(row['row_id']),
+            row['shift_date'],
+            row['title'],
+            snippet,
+            highlights,
+            row['rank'],
+        ))
+    return hits
@@ -0,0 +1,40 @@
+"""Immutable read models assembled from several queries in one transaction."""
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional, Tuple
+
+
+def freeze_row(row) -> Mapping[str, Any]:
+    """Return a read-only mapping copy of a sqlite3.Row or dict."""
+    return MappingProxyType(dict(row))
+
+
+class DashboardSnapshot(NamedTuple):
+    """Everything the dashboard page shows, read at a single point in time.
+
+    Attributes:
+        critical_count: Unresolved critical notifications
+        open_it_issues_count: IT issues that are open or in progress
+        recent_handover_count: Handover logs among the latest ten
+        recent_handover_logs: Latest handover logs, newest first
+        has_unresolved_notifications: Whether any notification is unresolved
+        critical_notifications: Latest unresolved critical notifications
+        has_it_issues: Whether any IT issue exists at all
+        open_it_issues: Latest open or in-progress IT issues
+        latest_power_position: Most recent power position, if any
+        latest_gas_position: Most recent gas position, if any
+    """
+    critical_count: int
+    open_it_issues_count: int
+    recent_handover_count: int
+    recent_handover_logs: Tuple[Mapping[str, Any], ...]
+    has_unresolved_notifications: bool
+    critical_notifications: Tuple[Mapping[str, Any], ...]
+    has_it_issues: bool
+    open_it_issues: Tuple[Mapping[str, Any], ...]
+    latest_power_position: Optional[Mapping[str, Any]]
+    latest_gas_position: Optional[Mapping[str, Any]]
+
+    @property
+    def positions_count(self) -> int:
+        """Number of position types (power, gas) with a recorded position."""
+        return (self.latest_power_position is not None) + (self.latest_gas_position is not None)
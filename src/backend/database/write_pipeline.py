@@ -0,0 +1,221 @@
+"""Group commit for DatabaseManager writes.
+
+With a pipeline enabled, every create/update/delete method hands its work
+to a single writer thread instead of running it on the caller's thread.
+The writer takes whatever calls arrive within a short window and runs
+them in one transaction with a single commit, so a burst of form
+submissions at shift change costs one fsync and one write-lock
+acquisition instead of one each.
+
+Each call runs inside its own savepoint: a call that fails is rolled back
+on its own and its caller gets the exception, while the rest of the batch
+still commits. Calls run in the order they were submitted, so a session's
+writes keep their order.
+"""
+import functools
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW = 0.002
+DEFAULT_MAX_BATCH = 64
+
+_STOP = object()
+
+
+class _WriteCall(NamedTuple):
+    """A queued write method call and the future for its result."""
+    method: Callable
+    args: tuple
+    kwargs: dict
+    future: Future
+
+
+class BatchConnection:
+    """Write connection handed to methods running inside a batch.
+
+    Statements run on the real connection. ``commit()`` is left to the
+    pipeline, which commits the whole batch, and ``rollback()`` only
+    undoes the current call.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def commit(self):
+        """Do nothing; the batch commits once all its calls have run."""
+
+    def rollback(self):
+        """Undo the statements of the current call."""
+        self._conn.execute("ROLLBACK TO write_call")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
+class WritePipeline:
+    """Single writer thread that runs queued write calls in group commits."""
+
+    def __init__(self, db, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        """Initialize and start the writer thread.
+
+        Args:
+            db: DatabaseManager whose write methods are run
+            window: Seconds to wait for more calls after the first one of a batch
+            max_batch: Maximum calls per transaction
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.db = db
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: 'queue.Queue[Any]' = queue.Queue()
+        self._local = threading.local()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._stats = {'batches': 0, 'calls': 0, 'failed_calls': 0, 'failed_batches': 0, 'max_batch_size': 0}
+        self._thread = threading.Thread(target=self._run, name='db-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, name: str, *args, **kwargs) -> Future:
+        """Queue a write method call.
+
+        Args:
+            name: Name of a DatabaseManager write method, e.g. "create_comment"
+            args: Positional arguments of the method
+            kwargs: Keyword arguments of the method
+
+        Returns:
+            Future resolved with the method's return value once the batch
+            has committed, or with the exception it raised
+        """
+        method = getattr(type(self.db), name, None)
+        if method is None or not getattr(method, 'pipelined', False):
+            raise ValueError(f"Not a pipelined write method: {name}")
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write pipeline is closed")
+            self._queue.put(_WriteCall(method, args, kwargs, future))
+        return future
+
+    @property
+    def on_writer_thread(self) -> bool:
+        """Whether the current thread is the pipeline's writer."""
+        return threading.current_thread() is self._thread
+
+    def batch_connection(self) -> Optional[BatchConnection]:
+        """Connection of the batch being run, on the writer thread only."""
+        return getattr(self._local, 'conn', None)
+
+    def close(self):
+        """Run the calls already queued, then stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get batch counts and sizes."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['mean_batch_size'] = stats['calls'] / stats['batches'] if stats['batches'] else 0.0
+        stats['queued'] = self._queue.qsize()
+        return stats
+
+    def _collect(self, first: _WriteCall) -> List[_WriteCall]:
+        """Gather the calls arriving within the window after the first one."""
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                # Finish this batch, then stop
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [call for call in self._collect(item) if call.future.set_running_or_notify_cancel()]
+            if batch:
+                self._run_batch(batch)
+
+    def _run_batch(self, batch: List[_WriteCall]):
+        """Run a batch in one transaction and resolve its futures."""
+        results: List[Any] = []
+        written: Set[str] = set()
+        failed = 0
+        try:
+            with self.db.pool.writer() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                self._local.conn = BatchConnection(conn)
+                try:
+                    for call in batch:
+                        conn.execute("SAVEPOINT write_call")
+                        try:
+                            results.append((True, call.method(self.db, *call.args, **call.kwargs)))
+                        except Exception as e:
+                            conn.execute("ROLLBACK TO write_call")
+                            results.append((False, e))
+                            failed += 1
+                        conn.execute("RELEASE write_call")
+                        written.update(getattr(call.method, 'invalidates', ()))
+                finally:
+                    self._local.conn = None
+                conn.commit()
+        except Exception as e:
+            logger.warning("Group commit of %s writes failed: %s", len(batch), e)
+            with self._lock:
+                self._stats['failed_batches'] += 1
+            for call in batch:
+                call.future.set_exception(e)
+            return
+        finally:
+            if self.db.cache is not None and written:
+                # Reads that ran before the commit may have been cached
+                # under the generations the calls already bumped.
+                self.db.cache.invalidate(written)
+
+        with self._lock:
+            self._stats['batches'] += 1
+            self._stats['calls'] += len(batch)
+            self._stats['failed_calls'] += failed
+            self._stats['max_batch_size'] = max(self._stats['max_batch_size'], len(batch))
+        for call, (ok, result) in zip(batch, results):
+            if ok:
+                call.future.set_result(result)
+            else:
+                call.future.set_exception(result)
+
+
+def pipelined(method: Callable) -> Callable:
+    """Route a DatabaseManager write method through its write pipeline, if any.
+
+    The caller blocks until the batch holding the call has committed, so
+    the method keeps its synchronous return value.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        pipeline = self.write_pipeline
+        if pipeline is None or pipeline.on_writer_thread:
+            return method(self, *args, **kwargs)
+        return pipeline.submit(method.__name__, *args, **kwargs).result()
+    wrapper.pipelined = True
+    return wrapper
@@ -0,0 +1 @@
+"""Synthetic data and performance benchmarks for the shift handover app."""
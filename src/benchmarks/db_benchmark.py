@@ -0,0 +1,309 @@
+"""Micro-benchmarks of every DatabaseManager get_*, create_* and update_* method.
+
+For each scale tier, the benchmark:
+
+1. fills a fresh database with synthetic data;
+2. times each method a number of times after a warm-up call;
+3. writes the timings of all tiers to a JSON file.
+
+Runs are compared method by method with ``--compare``. Reads bypass the
+query cache unless ``--cache-mb`` is given, so the numbers are SQLite's.
+
+Run from the command line::
+
+    python -m src.benchmarks.db_benchmark --tiers 1000 100000 --out bench/before.json
+    python -m src.benchmarks.db_benchmark --tiers 1000 100000 --compare bench/before.json
+"""
+import argparse
+import inspect
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from src.backend.database.db_manager import TABLE_COLUMNS, UPDATE_COLUMNS, DatabaseManager
+from src.backend.database.filters import ListFilter
+from src.backend.database.instrumentation import measure_result
+from src.benchmarks.synthetic import SyntheticData, history_days, populate
+
+DEFAULT_TIERS = (1000, 100000)
+DEFAULT_REPEAT = 5
+BENCHMARK_PREFIXES = ('get_', 'create_', 'update_')
+# Methods with these prefixes that are not data operations
+SKIPPED_METHODS = {'get_connection', 'get_pragma_settings'}
+# Rows per call of the *_many methods
+BULK_ROWS = 100
+# Days of shifts read by list methods that would otherwise read whole tables
+LIST_WINDOW_DAYS = 30
+
+# Method name stems of each table: (singular, plural)
+TABLE_NAMES = {
+    'handover_logs': ('handover_log', 'handover_logs'),
+    'power_positions': ('power_position', 'power_positions'),
+    'gas_positions': ('gas_position', 'gas_positions'),
+    'plant_status': ('plant_status', 'plant_status'),
+    'power_system_status': ('power_system_status', 'power_system_status'),
+    'notifications': ('notification', 'notifications'),
+    'it_issues': ('it_issue', 'it_issues'),
+    'competitor_activity': ('competitor_activity', 'competitor_activity'),
+    'comments': ('comment', 'comments'),
+}
+
+
+class BenchmarkCall(NamedTuple):
+    """A benchmarked method call.
+
+    Attributes:
+        args: Description of the arguments, stored with the results
+        run: Makes one call; arguments may differ between calls
+    """
+    args: str
+    run: Callable[[], Any]
+
+
+def benchmark_methods() -> List[str]:
+    """Names of the DatabaseManager methods the benchmark times."""
+    return sorted(
+        name for name, _ in inspect.getmembers(DatabaseManager, inspect.isfunction)
+        if name.startswith(BENCHMARK_PREFIXES) and name not in SKIPPED_METHODS
+    )
+
+
+def build_calls(db: DatabaseManager, data: SyntheticData, seed: int = 0,
+                as_frame: bool = False) -> Dict[str, BenchmarkCall]:
+    """Build a call for every benchmarked method against a populated database.
+
+    Args:
+        db: DatabaseManager of the populated database
+        data: Generator the database was filled by
+        seed: Seed of the call arguments
+        as_frame: Read lists as DataFrames instead of row tuples
+
+    Raises:
+        ValueError: For a method the benchmark does not know how to call,
+            so new methods are not silently left out
+    """
+    rng = random.Random(f"{seed}:calls")
+    window = ListFilter(date_from=(data.end_date - timedelta(days=LIST_WINDOW_DAYS - 1)).isoformat())
+    since = datetime.combine(data.end_date, datetime.min.time()).strftime('%Y-%m-%d %H:%M:%S')
+    with db.get_connection() as conn:
+        max_ids = {table: conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+                   for table in TABLE_NAMES}
+    latest_seq = db.get_latest_change_seq()
+
+    def row_id(table):
+        return rng.randint(1, max(1, max_ids[table]))
+
+    def create_args(table):
+        values = data.sample(table, rng)
+        return [values[column] for column in TABLE_COLUMNS[table]]
+
+    def update_args(table):
+        values = data.sample(table, rng)
+        return [row_id(table)] + [values[column] for column in UPDATE_COLUMNS[table]]
+
+    calls: Dict[str, BenchmarkCall] = {}
+    for table, (singular, plural) in TABLE_NAMES.items():
+        create, update = getattr(db, f'create_{singular}'), getattr(db, f'update_{singular}')
+        create_many, update_many = getattr(db, f'create_{singular}_many'), getattr(db, f'update_{singular}_many')
+        get_one = getattr(db, f'get_{singular}')
+        calls.update({
+            f'create_{singular}': BenchmarkCall("one row", lambda t=table, f=create: f(*create_args(t))),
+            f'create_{singular}_many': BenchmarkCall(
+                f"{BULK_ROWS} rows", lambda t=table, f=create_many: f([create_args(t) for _ in range(BULK_ROWS)])),
+            f'update_{singular}': BenchmarkCall("random id", lambda t=table, f=update: f(*update_args(t))),
+            f'update_{singular}_many': BenchmarkCall(
+                f"{BULK_ROWS} random ids",
+                lambda t=table, f=update_many: f([update_args(t) for _ in range(BULK_ROWS)])),
+            f'get_{singular}': BenchmarkCall("random id", lambda t=table, f=get_one: f(row_id(t))),
+            f'get_all_{plural}': BenchmarkCall(
+                f"last {LIST_WINDOW_DAYS} days",
+                lambda f=getattr(db, f'get_all_{plural}'): f(window, as_frame=as_frame)),
+            f'get_{plural}_page': BenchmarkCall(
+                "first page", lambda f=getattr(db, f'get_{plural}_page'): f(as_frame=as_frame)),
+            f'get_{plural}_updated_since': BenchmarkCall(
+                "latest day", lambda f=getattr(db, f'get_{plural}_updated_since'): f(since, as_frame=as_frame)),
+        })
+    calls.update({
+        'get_history': BenchmarkCall(
+            f"handover_logs, last {LIST_WINDOW_DAYS} days",
+            lambda: db.get_history('handover_logs', window, as_frame=as_frame)),
+        'get_changes_since': BenchmarkCall("last 1000 changes", lambda: db.get_changes_since(max(0, latest_seq - 1000))),
+        'get_latest_change_seq': BenchmarkCall("", db.get_latest_change_seq),
+        'get_dashboard_snapshot': BenchmarkCall("defaults", db.get_dashboard_snapshot),
+        'get_critical_notifications_count': BenchmarkCall("", db.get_critical_notifications_count),
+        'get_open_it_issues_count': BenchmarkCall("", db.get_open_it_issues_count),
+        'get_latest_power_position': BenchmarkCall("", db.get_latest_power_position),
+        'get_latest_gas_position': BenchmarkCall("", db.get_latest_gas_position),
+        'get_recent_handover_logs': BenchmarkCall("defaults", lambda: db.get_recent_handover_logs(as_frame=as_frame)),
+        'get_unresolved_notifications': BenchmarkCall("", lambda: db.get_unresolved_notifications(as_frame=as_frame)),
+    })
+    unknown = set(benchmark_methods()) - set(calls)
+    if unknown:
+        raise ValueError(f"No benchmark call for: {', '.join(sorted(unknown))}")
+    return calls
+
+
+def time_call(call: BenchmarkCall, repeat: int, warmup: int = 1) -> Dict[str, Any]:
+    """Time a call after warming up.
+
+    Returns:
+        Timings in milliseconds, with the rows and estimated bytes of the
+        last result
+    """
+    for _ in range(warmup):
+        call.run()
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = call.run()
+        timings.append((time.perf_counter() - started) * 1000)
+    rows, size = measure_result(result)
+    timings.sort()
+    return {
+        'args': call.args,
+        'repeat': repeat,
+        'min_ms': timings[0],
+        'median_ms': statistics.median(timings),
+        'mean_ms': statistics.fmean(timings),
+        'p95_ms': timings[min(len(timings) - 1, int(0.95 * len(timings)))],
+        'max_ms': timings[-1],
+        'rows': rows,
+        'bytes': size,
+    }
+
+
+def run_tier(total_rows: int, workdir: str, repeat: int = DEFAULT_REPEAT, seed: int = 0,
+             cache_bytes: int = 0, methods: Optional[Sequence[str]] = None,
+             as_frame: bool = False) -> Dict[str, Any]:
+    """Benchmark every method against a fresh synthetic database.
+
+    Args:
+        total_rows: Rows across all tables
+        workdir: Directory for the database file
+        repeat: Timed calls per method
+        seed: Seed of the data and of the call arguments
+        cache_bytes: Read cache size; 0 times SQLite itself
+        methods: Methods to time (default: all)
+        as_frame: Read lists as DataFrames instead of row tuples
+    """
+    path = os.path.join(workdir, f"bench_{total_rows}.db")
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    db = DatabaseManager(path, cache_bytes=cache_bytes)
+    try:
+        started = time.perf_counter()
+        counts = populate(db, total_rows, seed)
+        populate_seconds = time.perf_counter() - started
+        data = SyntheticData(seed, days=history_days(total_rows))
+        calls = build_calls(db, data, seed, as_frame)
+        results = {}
+        for name in methods or benchmark_methods():
+            results[name] = time_call(calls[name], repeat)
+        return {
+            'rows': counts,
+            'populate_seconds': populate_seconds,
+            'db_bytes': os.path.getsize(path),
+            'methods': results,
+        }
+    finally:
+        db.close()
+
+
+def environment() -> Dict[str, Any]:
+    """Where and on what code a benchmark ran."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], section: str = 'methods',
+            metric: str = 'median_ms') -> List[str]:
+    """Describe the change of a timing between two runs.
+
+    Args:
+        baseline: Earlier results
+        current: New results
+        section: Key of the timed items within each tier
+        metric: Timing to compare
+
+    Returns:
+        One line per item and tier present in both runs, largest
+        slowdown first
+    """
+    changes = []
+    for tier, results in current['tiers'].items():
+        before = baseline.get('tiers', {}).get(tier)
+        if before is None:
+            continue
+        for name, stats in results[section].items():
+            old = before[section].get(name)
+            if old is None or not old[metric]:
+                continue
+            ratio = stats[metric] / old[metric]
+            changes.append((ratio, f"{tier:>9} rows  {name:<42} {old[metric]:9.3f}ms -> "
+                                   f"{stats[metric]:9.3f}ms  ({(ratio - 1) * 100:+.0f}%)"))
+    return [line for _, line in sorted(changes, reverse=True)]
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark DatabaseManager methods on synthetic data.")
+    parser.add_argument('--tiers', type=int, nargs='+', default=list(DEFAULT_TIERS), help="Dataset sizes in rows")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Timed calls per method")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the data and call arguments")
+    parser.add_argument('--cache-mb', type=int, default=0, help="Read cache size; 0 times SQLite itself")
+    parser.add_argument('--methods', nargs='+', help="Methods to time (default: all)")
+    parser.add_argument('--frames', action='store_true', help="Read lists as DataFrames instead of row tuples")
+    parser.add_argument('--workdir', help="Directory for the databases (default: a temporary one)")
+    parser.add_argument('--out', help="JSON results file (default: bench/db-<timestamp>.json)")
+    parser.add_argument('--compare', help="Earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='db-bench-')
+    os.makedirs(workdir, exist_ok=True)
+    results = {'environment': environment(), 'seed': args.seed, 'as_frame': args.frames, 'tiers': {}}
+    try:
+        for tier in args.tiers:
+            print(f"Benchmarking {tier} rows...", flush=True)
+            results['tiers'][str(tier)] = run_tier(tier, workdir, args.repeat, args.seed,
+                                                   args.cache_mb * 1024 * 1024, args.methods, args.frames)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    out = args.out or os.path.join('bench', f"db-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(out) or '.', exist_ok=True)
+    with open(out, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        for line in compare(baseline, results):
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
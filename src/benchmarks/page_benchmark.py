@@ -0,0 +1,234 @@
+"""Page-render benchmark of the Streamlit app on seeded databases.
+
+Each page of ``app.py`` is driven through Streamlit's AppTest, against
+databases seeded with synthetic data at several sizes. The benchmark
+measures:
+
+- the wall time of the first render of the page (cold);
+- the wall time of further reruns (warm);
+- the number of elements in the main area;
+- the peak Python memory of one rerun, with tracemalloc.
+
+Results are checked against the budgets in ``page_budgets.json``. Pages
+must stay within their element budget at every size, so a page that
+renders one widget per row fails as the database grows.
+
+Run from the command line; the exit status is 1 when a budget is exceeded::
+
+    python -m src.benchmarks.page_benchmark --tiers 1000 10000 --out bench/pages.json
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.backend.database.db_manager import DatabaseManager
+from src.benchmarks.db_benchmark import compare, environment
+from src.benchmarks.synthetic import populate
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'app.py')
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'page_budgets.json')
+
+DEFAULT_TIERS = (1000, 10000)
+DEFAULT_RERUNS = 3
+DEFAULT_TIMEOUT = 120.0
+# The search results page is reached through the sidebar search box
+SEARCH_PAGE = "🔍 Search"
+SEARCH_QUERY = "outage"
+
+
+def count_elements(node) -> int:
+    """Count the elements below an AppTest node, not counting containers."""
+    children = getattr(node, 'children', None)
+    if children is None:
+        return 1
+    return sum(count_elements(child) for child in children.values())
+
+
+def seed_database(path: str, total_rows: int, seed: int = 0) -> Dict[str, int]:
+    """Create a database at path filled with synthetic rows."""
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    db = DatabaseManager(path, cache_bytes=0)
+    try:
+        return populate(db, total_rows, seed)
+    finally:
+        db.close()
+
+
+def _open_page(page: str, timeout: float):
+    """Start the app and navigate to a page; returns the AppTest and its load time."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.run()
+    started = time.perf_counter()
+    if page == SEARCH_PAGE:
+        at.sidebar.text_input[0].set_value(SEARCH_QUERY).run()
+    else:
+        at.sidebar.radio[0].set_value(page).run()
+    return at, time.perf_counter() - started
+
+
+def app_pages(timeout: float = DEFAULT_TIMEOUT) -> List[str]:
+    """Pages of the app's navigation, plus the search results page."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.run()
+    return list(at.sidebar.radio[0].options) + [SEARCH_PAGE]
+
+
+def measure_page(page: str, reruns: int = DEFAULT_RERUNS, timeout: float = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    """Render a page and time its reruns.
+
+    Memory is measured on an extra rerun, as tracemalloc slows the timed
+    ones down.
+
+    Args:
+        page: Navigation label of the page, or SEARCH_PAGE
+        reruns: Timed warm reruns
+        timeout: Seconds a single rerun may take
+
+    Returns:
+        Cold and warm timings in milliseconds, the element count, peak
+        memory in MB and any exceptions the page raised
+    """
+    at, cold = _open_page(page, timeout)
+    timings = []
+    for _ in range(reruns):
+        started = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    at.run()
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    if not tracing:
+        tracemalloc.stop()
+
+    return {
+        'cold_ms': cold * 1000,
+        'rerun_ms': statistics.median(timings) if timings else cold * 1000,
+        'max_rerun_ms': max(timings, default=cold * 1000),
+        'elements': count_elements(at.main),
+        'peak_mb': peak / (1024 * 1024),
+        'exceptions': [exception.value for exception in at.exception],
+    }
+
+
+def run_tier(total_rows: int, workdir: str, pages: Optional[Sequence[str]] = None, reruns: int = DEFAULT_RERUNS,
+             seed: int = 0, timeout: float = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    """Benchmark pages against a database seeded with total_rows rows.
+
+    The app opens the database named by DB_PATH, so the variable is set
+    for the tier and the app's cached DatabaseManager is dropped.
+    """
+    import streamlit as st
+
+    path = os.path.join(workdir, f"pages_{total_rows}.db")
+    counts = seed_database(path, total_rows, seed)
+    previous = os.environ.get('DB_PATH')
+    os.environ['DB_PATH'] = path
+    st.cache_resource.clear()
+    try:
+        results = {page: measure_page(page, reruns, timeout) for page in pages or app_pages(timeout)}
+    finally:
+        st.cache_resource.clear()
+        if previous is None:
+            os.environ.pop('DB_PATH', None)
+        else:
+            os.environ['DB_PATH'] = previous
+    return {'rows': counts, 'pages': results}
+
+
+def load_budgets(path: str = BUDGETS_PATH) -> Dict[str, Any]:
+    """Read page budgets."""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def page_budget(budgets: Dict[str, Any], page: str) -> Dict[str, float]:
+    """Budget of one page: its own limits over the defaults."""
+    return dict(budgets.get('default', {}), **budgets.get('pages', {}).get(page, {}))
+
+
+def check_budgets(results: Dict[str, Any], budgets: Dict[str, Any]) -> List[str]:
+    """Compare results with budgets.
+
+    Returns:
+        One line per exceeded budget or page exception
+    """
+    violations = []
+    for tier, tier_results in results['tiers'].items():
+        for page, stats in tier_results['pages'].items():
+            for exception in stats['exceptions']:
+                violations.append(f"{tier} rows  {page}: raised {exception}")
+            for metric, limit in page_budget(budgets, page).items():
+                if stats[metric] > limit:
+                    violations.append(f"{tier} rows  {page}: {metric} {stats[metric]:.1f} > budget {limit}")
+    return violations
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Run the page benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark Streamlit page renders on seeded databases.")
+    parser.add_argument('--tiers', type=int, nargs='+', default=list(DEFAULT_TIERS), help="Dataset sizes in rows")
+    parser.add_argument('--pages', nargs='+', help="Navigation labels of the pages (default: all)")
+    parser.add_argument('--reruns', type=int, default=DEFAULT_RERUNS, help="Timed reruns per page")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the data")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="Seconds a rerun may take")
+    parser.add_argument('--budgets', default=BUDGETS_PATH, help="Budgets file")
+    parser.add_argument('--workdir', help="Directory for the databases (default: a temporary one)")
+    parser.add_argument('--out', help="JSON results file (default: bench/pages-<timestamp>.json)")
+    parser.add_argument('--compare', help="Earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='page-bench-')
+    os.makedirs(workdir, exist_ok=True)
+    results = {'environment': environment(), 'seed': args.seed, 'tiers': {}}
+    try:
+        for tier in args.tiers:
+            print(f"Rendering pages on {tier} rows...", flush=True)
+            results['tiers'][str(tier)] = run_tier(tier, workdir, args.pages, args.reruns, args.seed, args.timeout)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    out = args.out or os.path.join('bench', f"pages-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(out) or '.', exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"Results written to {out}")
+
+    for tier, tier_results in results['tiers'].items():
+        for page, stats in tier_results['pages'].items():
+            print(f"{tier:>9} rows  {page:<22} cold {stats['cold_ms']:8.1f}ms  rerun {stats['rerun_ms']:8.1f}ms  "
+                  f"{stats['elements']:6d} elements  {stats['peak_mb']:6.1f}MB")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        for line in compare(baseline, results, section='pages', metric='rerun_ms'):
+            print(line)
+
+    violations = check_budgets(results, load_budgets(args.budgets))
+    for line in violations:
+        print(f"OVER BUDGET  {line}")
+    if violations:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
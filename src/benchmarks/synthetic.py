@@ -0,0 +1,276 @@
+"""Deterministic synthetic shift data for every application table.
+
+Rows follow the shape of real desk usage:
+
+- two 12-hour shifts a day, starting at 06:00 and 18:00;
+- rows created steadily through each shift;
+- long-tailed (log-normal) note lengths;
+- a skewed mix of priorities and statuses;
+- older notifications and IT issues mostly resolved.
+
+The same seed always gives the same rows, and each table is generated
+independently, so a table's rows do not change when the row counts of
+other tables do.
+
+Fill a database from the command line::
+
+    python -m src.benchmarks.synthetic --db bench.db --rows 100000 --seed 7
+"""
+import argparse
+import math
+import os
+import random
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from src.backend.database.db_manager import UPDATE_COLUMNS, DatabaseManager
+
+# Share of the rows of a dataset that goes to each table
+TABLE_SHARES: Dict[str, float] = {
+    'handover_logs': 0.20,
+    'power_positions': 0.08,
+    'gas_positions': 0.08,
+    'plant_status': 0.15,
+    'power_system_status': 0.10,
+    'notifications': 0.14,
+    'it_issues': 0.05,
+    'competitor_activity': 0.08,
+    'comments': 0.12,
+}
+
+# Rows a desk writes per day across all tables, and the longest history
+# generated; larger datasets pack more rows into each shift
+ROWS_PER_DAY = 200
+MAX_DAYS = 10 * 365
+SHIFT_SECONDS = 12 * 3600
+SHIFT_STARTS = (6, 18)
+
+# Days after which notifications and IT issues are usually resolved
+RESOLVED_AFTER_DAYS = 3
+
+TRADERS = (
+    "Alice Byrne", "Brian Walsh", "Ciara Murphy", "Declan Kelly", "Eimear Ryan", "Fionn O'Brien",
+    "Grainne Doyle", "Hugh Nolan", "Aoife Quinn", "Sean Brennan", "Niamh Farrell", "Liam Keane",
+)
+PLANTS = (
+    "Moneypoint", "Poolbeg CCGT", "Aghada", "Tarbert", "Great Island", "Huntstown 1", "Huntstown 2",
+    "Dublin Bay", "Whitegate", "Tynagh", "Edenderry", "Lough Ree", "West Offaly", "Turlough Hill",
+    "Ardnacrusha", "Galway Wind Park", "Mount Lucas Wind", "Meentycat Wind",
+)
+SYSTEMS = (
+    "EMS", "SCADA", "Bidding Platform", "ETRM", "Market Data Feed", "Settlement Gateway",
+    "Nomination Portal", "Weather Service",
+)
+COMPETITORS = (
+    "Energia", "SSE Airtricity", "Bord Gais Energy", "ESB Generation", "Flogas", "Statkraft",
+    "Orsted", "Brookfield Renewable", "Tynagh Energy", "Indaver",
+)
+PRODUCTS = ("baseload", "peak", "off-peak", "EFA 1", "EFA 2", "EFA 5", "within-day", "day-ahead")
+PERIODS = ("DA", "WD", "BOM", "M+1", "Q+1", "Winter", "Summer", "Cal")
+HUBS = ("NBP", "TTF", "PSV", "ZEE")
+PORTFOLIO_STATUSES = ("Within limits", "Near limit", "Limit breach - escalated", "Flat", "Hedged")
+
+NOTIFICATION_TITLES = (
+    "Price spike", "Outage notice", "Nomination deadline", "Limit warning", "Forecast change",
+    "Interconnector trip", "Gas quality alert", "Imbalance exposure", "REMIT disclosure",
+)
+ISSUE_TITLES = (
+    "ETRM slow", "Market feed stale", "VPN drops", "Excel add-in crash", "Bid upload failed",
+    "Printer offline", "SSO loop", "Report missing", "Nomination portal timeout",
+)
+
+# Priority and status mixes as (value, weight)
+PRIORITY_MIX = (('low', 40), ('medium', 35), ('high', 18), ('critical', 7))
+PLANT_STATUS_MIX = (('operational', 85), ('partial', 10), ('offline', 5))
+SYSTEM_STATUS_MIX = (("Normal", 80), ("Degraded", 12), ("Alert", 6), ("Outage", 2))
+OPEN_ISSUE_MIX = (('open', 60), ('in_progress', 40))
+
+WORDS = (
+    "demand", "wind", "forecast", "imbalance", "price", "spread", "interconnector", "outage", "trip",
+    "ramp", "bid", "offer", "position", "hedge", "margin", "baseload", "peak", "flows", "nomination",
+    "linepack", "storage", "injection", "withdrawal", "curtailment", "constraint", "dispatch", "unit",
+    "MW", "MWh", "therms", "EUR", "clearing", "auction", "gate", "closure", "intraday", "balancing",
+    "reserve", "frequency", "schedule", "update", "expected", "confirmed", "pending", "revised",
+    "higher", "lower", "than", "after", "before", "from", "to", "the", "on", "at", "for", "with",
+    "and", "was", "is", "due", "overnight", "morning", "evening", "shift", "desk", "team", "check",
+)
+
+# Median and spread (of the log) of the word count of text columns
+TEXT_LENGTHS: Dict[str, Tuple[float, float]] = {
+    'notes': (40, 0.7),
+    'message': (20, 0.5),
+    'description': (30, 0.6),
+    'activity_details': (25, 0.6),
+    'comment_text': (15, 0.8),
+}
+
+
+def table_counts(total_rows: int) -> Dict[str, int]:
+    """Split a dataset size into rows per table by TABLE_SHARES."""
+    return {table: max(1, round(total_rows * share)) for table, share in TABLE_SHARES.items()}
+
+
+def history_days(total_rows: int) -> int:
+    """Days of history a dataset of this size covers."""
+    return min(MAX_DAYS, max(1, math.ceil(total_rows / ROWS_PER_DAY)))
+
+
+class SyntheticData:
+    """Generator of realistic rows for the application tables."""
+
+    def __init__(self, seed: int = 0, end_date: date = date(2024, 12, 31), days: int = 365):
+        """Initialize generator.
+
+        Args:
+            seed: Seed; the same seed gives the same rows
+            end_date: Shift date of the newest rows
+            days: Days of history the rows are spread over
+        """
+        self.seed = seed
+        self.end_date = end_date
+        self.days = days
+        self.start = datetime.combine(end_date - timedelta(days=days - 1), datetime.min.time())
+
+    def rng(self, table: str) -> random.Random:
+        """Random source of a table, independent of other tables."""
+        return random.Random(f"{self.seed}:{table}")
+
+    def rows(self, table: str, count: int) -> Iterator[Tuple[Any, ...]]:
+        """Generate rows oldest first.
+
+        Args:
+            table: Table to generate rows for
+            count: Number of rows
+
+        Yields:
+            Tuples of the UPDATE_COLUMNS of the table followed by
+            created_at and updated_at
+        """
+        rng = self.rng(table)
+        shifts = self.days * len(SHIFT_STARTS)
+        for i in range(count):
+            # Spread rows evenly over the shift timeline, oldest first
+            offset = i * shifts * SHIFT_SECONDS / count
+            shift, within = divmod(offset, SHIFT_SECONDS)
+            day, slot = divmod(int(shift), len(SHIFT_STARTS))
+            created = self.start + timedelta(days=day, hours=SHIFT_STARTS[slot], seconds=int(within))
+            # Night shifts that run past midnight still belong to their start date
+            shift_date = (self.start + timedelta(days=day)).date()
+            values = self.values(table, rng, shift_date)
+            stamp = created.strftime('%Y-%m-%d %H:%M:%S')
+            yield tuple(values[column] for column in UPDATE_COLUMNS[table]) + (stamp, stamp)
+
+    def values(self, table: str, rng: random.Random, shift_date: date) -> Dict[str, Any]:
+        """Column values of one row of a table for a shift date."""
+        age = (self.end_date - shift_date).days
+        values: Dict[str, Any] = {'shift_date': shift_date.isoformat()}
+        if table == 'handover_logs':
+            values.update(trader_name=rng.choice(TRADERS), notes=self.text(rng, 'notes'))
+        elif table in ('power_positions', 'gas_positions'):
+            values.update(position_details=self.position(rng, table), portfolio_status=rng.choice(PORTFOLIO_STATUSES))
+        elif table == 'plant_status':
+            values.update(plant_name=rng.choice(PLANTS), status=weighted(rng, PLANT_STATUS_MIX),
+                          notes=self.text(rng, 'notes') if rng.random() < 0.6 else None)
+        elif table == 'power_system_status':
+            values.update(system_name=rng.choice(SYSTEMS), status=weighted(rng, SYSTEM_STATUS_MIX),
+                          notes=self.text(rng, 'notes') if rng.random() < 0.5 else None)
+        elif table == 'notifications':
+            values.update(title=rng.choice(NOTIFICATION_TITLES), message=self.text(rng, 'message'),
+                          priority=weighted(rng, PRIORITY_MIX),
+                          is_resolved=int(rng.random() < (0.97 if age > RESOLVED_AFTER_DAYS else 0.3)))
+        elif table == 'it_issues':
+            resolved = rng.random() < (0.9 if age > RESOLVED_AFTER_DAYS else 0.2)
+            values.update(title=rng.choice(ISSUE_TITLES), description=self.text(rng, 'description'),
+                          status='resolved' if resolved else weighted(rng, OPEN_ISSUE_MIX))
+        elif table == 'competitor_activity':
+            values.update(competitor_name=rng.choice(COMPETITORS),
+                          activity_details=self.text(rng, 'activity_details'))
+        elif table == 'comments':
+            values.update(comment_text=self.text(rng, 'comment_text'))
+        else:
+            raise ValueError(f"Unknown table: {table}")
+        return values
+
+    def text(self, rng: random.Random, column: str) -> str:
+        """Free text with a log-normal word count."""
+        median, sigma = TEXT_LENGTHS[column]
+        words = max(1, int(rng.lognormvariate(math.log(median), sigma)))
+        text = ' '.join(rng.choices(WORDS, k=words))
+        return text[0].upper() + text[1:] + '.'
+
+    def position(self, rng: random.Random, table: str) -> str:
+        """Position summary in the style traders write them."""
+        side = rng.choice(("Long", "Short"))
+        if table == 'gas_positions':
+            volume = rng.randrange(5, 200) * 1000
+            return (f"{side} {volume} th/d {rng.choice(HUBS)} {rng.choice(PERIODS)} "
+                    f"@ {rng.uniform(20, 120):.2f} p/th")
+        return (f"{side} {rng.randrange(5, 400)}MW {rng.choice(PRODUCTS)} {rng.choice(PERIODS)} "
+                f"@ {rng.uniform(30, 250):.2f} EUR/MWh")
+
+    def sample(self, table: str, rng: random.Random) -> Dict[str, Any]:
+        """Column values of one new row for the latest shift."""
+        return self.values(table, rng, self.end_date)
+
+
+def weighted(rng: random.Random, mix: Sequence[Tuple[str, int]]) -> str:
+    """Pick a value from a (value, weight) mix."""
+    values, weights = zip(*mix)
+    return rng.choices(values, weights)[0]
+
+
+def populate(db: DatabaseManager, total_rows: int, seed: int = 0, end_date: date = date(2024, 12, 31),
+             chunk_size: int = 10000) -> Dict[str, int]:
+    """Fill a database with a synthetic dataset.
+
+    Args:
+        db: DatabaseManager of the database to fill
+        total_rows: Rows across all tables, split by TABLE_SHARES
+        seed: Seed of the generator
+        end_date: Shift date of the newest rows
+        chunk_size: Rows per transaction
+
+    Returns:
+        Rows inserted per table
+    """
+    counts = table_counts(total_rows)
+    data = SyntheticData(seed, end_date, history_days(total_rows))
+    for table, count in counts.items():
+        columns = UPDATE_COLUMNS[table] + ('created_at', 'updated_at')
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+        rows = data.rows(table, count)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            with db.get_connection(write=True) as conn:
+                conn.executemany(sql, chunk)
+                conn.commit()
+    with db.get_connection(write=True) as conn:
+        conn.execute("ANALYZE")
+        conn.commit()
+    return counts
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Fill a database with synthetic data from the command line."""
+    parser = argparse.ArgumentParser(description="Fill a shift handover database with synthetic data.")
+    parser.add_argument('--db', default=os.getenv('DB_PATH', 'shift_handover.db'), help="Database path")
+    parser.add_argument('--rows', type=int, required=True, help="Rows across all tables")
+    parser.add_argument('--seed', type=int, default=0, help="Generator seed")
+    parser.add_argument('--end-date', type=date.fromisoformat, default=date(2024, 12, 31),
+                        help="Shift date of the newest rows (YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+
+    db = DatabaseManager(args.db, cache_bytes=0)
+    try:
+        counts = populate(db, args.rows, args.seed, args.end_date)
+    finally:
+        db.close()
+    for table, count in counts.items():
+        print(f"{table}: {count} rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""Grid editing shared by the CRUD pages.
+
+In grid mode a list shows its current page in ``st.data_editor``. Edits
+stay in the browser until they are saved; saving writes only the rows
+that changed, in one transaction (DatabaseManager.apply_changes). Rows
+edited by someone else since the grid was loaded refuse the save instead
+of being overwritten.
+
+The rows are read once, with the change log position before the read,
+and kept in session state until they are saved, discarded or another
+page is shown.
+"""
+from typing import Any, Callable, Dict, List, Tuple
+import streamlit as st
+from src.backend.database.db_manager import UPDATE_COLUMNS, DatabaseManager
+from src.backend.database.edits import READ_ONLY_COLUMNS, EditConflict, diff_rows
+from src.backend.database.importer import TableRules, load_rules, validate_chunk
+from src.backend.database.pagination import Page
+from src.frontend.paged_list import PagedList
+from src.utils.helpers import show_success_message
+
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
+
+class GridEditor:
+    """Spreadsheet-style editing of one paged list."""
+
+    def __init__(self, db: DatabaseManager, table: str, paged: PagedList, load_page: Callable[..., Page]):
+        """Initialize the grid of a list.
+
+        Args:
+            db: Database manager instance
+            table: Table the list shows
+            paged: The list whose current page is edited
+            load_page: The table's ``get_*_page`` method
+        """
+        self.db = db
+        self.table = table
+        self.paged = paged
+        self.load_page = load_page
+        self.columns = UPDATE_COLUMNS[table]
+
+    def _key(self, name: str) -> str:
+        return f"{self.paged.key}_grid_{name}"
+
+    def toggle(self) -> bool:
+        """Show the grid mode switch; returns whether grid mode is on."""
+        on = st.toggle("🧮 Grid edit", key=self._key('on'),
+                       help="Edit this page of rows as a spreadsheet and save all changes at once")
+        if not on:
+            self._drop()
+        return on
+
+    def _drop(self):
+        st.session_state.pop(self._key('snapshot'), None)
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Rows of the current page as read, with the change log position."""
+        state = st.session_state
+        snapshot = state.get(self._key('snapshot'))
+        if snapshot is None or snapshot['query'] != self.paged.query():
+            # Taken before the read, so any later change is seen as a conflict
+            seq = self.db.get_latest_change_seq()
+            page = self.paged.load(self.load_page)
+            # A new editor key drops the edits made to the previous rows
+            state[self._key('version')] = state.get(self._key('version'), 0) + 1
+            snapshot = {'query': self.paged.query(), 'seq': seq, 'page': page}
+            state[self._key('snapshot')] = snapshot
+        return snapshot
+
+    def _column_config(self, rules: TableRules) -> Dict[str, Any]:
+        config = {
+            'id': st.column_config.NumberColumn("ID", width="small"),
+            'updated_at': st.column_config.TextColumn("Updated"),
+        }
+        for column in self.columns:
+            label = column.replace('_', ' ').title()
+            required = column in rules.required
+            if column == 'is_resolved':
+                config[column] = st.column_config.CheckboxColumn("Resolved", default=False)
+            elif column in rules.enums:
+                config[column] = st.column_config.SelectboxColumn(
+                    label, options=sorted(rules.enums[column]), required=required
+                )
+            elif column == 'shift_date':
+                config[column] = st.column_config.TextColumn(label, validate=DATE_PATTERN, required=required)
+            else:
+                config[column] = st.column_config.TextColumn(label, required=required)
+        return config
+
+    def _errors(self, rules: TableRules, original: List[Dict[str, Any]], changes) -> List[Tuple[str, List[str]]]:
+        """Validate the rows a save would write, as the importer does."""
+        before = {row['id']: row for row in original}
+        records = [(f"new row {i}", row) for i, row in enumerate(changes.inserted, 1)]
+        records += [(f"row {row['id']}", dict(before[row['id']], **row)) for row in changes.updated]
+        _, rejects = validate_chunk(self.table, rules, records)
+        return [(reject['line'], reject['errors']) for reject in rejects]
+
+    def show(self):
+        """Show the grid of the current page with its save and discard buttons."""
+        snapshot = self._snapshot()
+        page = snapshot['page']
+        self.paged.controls(page)
+
+        frame = page.rows.reindex(columns=['id', *self.columns, 'updated_at'])
+        if 'is_resolved' in frame:
+            frame['is_resolved'] = frame['is_resolved'].fillna(0).astype(bool)
+        with self.db.get_connection() as conn:
+            rules = load_rules(conn, self.table)
+
+        edited = st.data_editor(
+            frame,
+            key=self._key(f"editor_{st.session_state[self._key('version')]}"),
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            disabled=READ_ONLY_COLUMNS,
+            column_config=self._column_config(rules),
+        )
+        original = frame.to_dict('records')
+        changes = diff_rows(original, edited.to_dict('records'), self.columns)
+        errors = self._errors(rules, original, changes)
+        for row, row_errors in errors:
+            st.error(f"{row}: {'; '.join(row_errors)}")
+
+        st.caption(
+            f"{len(changes.inserted)} to add · {len(changes.updated)} to change · "
+            f"{len(changes.deleted)} to delete. Unsaved edits are dropped when another page is shown."
+        )
+        col_save, col_discard = st.columns(2)
+
+        with col_save:
+            save = st.button("💾 Save changes", key=self._key('save'), use_container_width=True,
+                             type="primary", disabled=not changes or bool(errors))
+
+        with col_discard:
+            discard = st.button("↩️ Discard", key=self._key('discard'), use_container_width=True,
+                                disabled=not changes)
+
+        if save:
+            try:
+                result = self.db.apply_changes(self.table, changes, snapshot['seq'])
+            except EditConflict as e:
+                st.error(
+                    f"Rows {', '.join(map(str, e.row_ids))} were changed by someone else since the grid "
+                    f"was loaded, so nothing was saved. Discard to reload them, then edit again."
+                )
+            else:
+                show_success_message(
+                    f"Saved: {len(result.inserted_ids)} added, {result.updated} changed, {result.deleted} deleted"
+                )
+                self._drop()
+                st.rerun()
+
+        if discard:
+            self._drop()
+            st.rerun()
+
+        self.paged.pager(page)
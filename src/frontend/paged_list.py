@@ -0,0 +1,121 @@
+"""Paged list component shared by the CRUD pages.
+
+Lists are read one keyset page at a time with the ``get_*_page`` methods,
+so a rerun only loads and renders the rows on screen. Each list keeps the
+following in session state, under its own key:
+
+- its cursor and page number;
+- its page size;
+- the date it last jumped to.
+
+A change of filters or page size starts the list again at the newest
+rows.
+"""
+from datetime import date
+from typing import Any, Callable, Dict, Optional
+import streamlit as st
+from src.backend.database.filters import ListFilter
+from src.backend.database.pagination import Page, date_cursor
+
+PAGE_SIZES = [10, 25, 50, 100]
+DEFAULT_PAGE_SIZE = 10
+
+
+class PagedList:
+    """State and controls of one paged list on a page."""
+
+    def __init__(self, key: str, filters: Optional[ListFilter] = None, noun: str = "records"):
+        """Initialize list state for this rerun.
+
+        Args:
+            key: Unique prefix for the list's widgets and session state
+            filters: Filters the list is read with
+            noun: What the rows are, for the summary line
+        """
+        self.key = key
+        self.filters = filters
+        self.noun = noun
+        state = st.session_state
+        state.setdefault(self._state('size'), DEFAULT_PAGE_SIZE)
+        signature = (filters, state[self._state('size')])
+        if state.get(self._state('signature')) != signature:
+            state[self._state('signature')] = signature
+            self._go(None, 1)
+
+    def _state(self, name: str) -> str:
+        return f"{self.key}_{name}"
+
+    def _go(self, cursor: Optional[str], page_no: Optional[int], keep_jump: bool = False):
+        st.session_state[self._state('cursor')] = cursor
+        st.session_state[self._state('page_no')] = page_no
+        if not keep_jump:
+            # Leaving the jumped-to page clears the date input
+            st.session_state.pop(self._state('jump'), None)
+
+    def query(self) -> Dict[str, Any]:
+        """Arguments of the ``get_*_page`` call for the current page."""
+        return {
+            'limit': st.session_state[self._state('size')],
+            'cursor': st.session_state[self._state('cursor')],
+            'with_total': True,
+            'filters': self.filters,
+        }
+
+    def load(self, load_page: Callable[..., Page], **options) -> Page:
+        """Read the current page.
+
+        A cursor that no longer decodes starts the list again at the
+        newest rows.
+
+        Args:
+            load_page: A DatabaseManager ``get_*_page`` method
+            options: Further arguments, e.g. preview and as_frame
+        """
+        try:
+            return load_page(**self.query(), **options)
+        except ValueError:
+            self._go(None, 1)
+            return load_page(**self.query(), **options)
+
+    def controls(self, page: Page):
+        """Show the row count, page size selector and jump-to-date input."""
+        col_summary, col_size, col_jump = st.columns([2, 1, 1])
+
+        with col_summary:
+            page_no = st.session_state[self._state('page_no')]
+            where = f"page {page_no}" if page_no else "from the chosen date"
+            st.markdown(f"**Total {self.noun.title()}:** {page.total} · {where}")
+
+        with col_size:
+            st.selectbox("Per page", PAGE_SIZES, key=self._state('size'))
+
+        with col_jump:
+            st.date_input("Jump to date", value=None, key=self._state('jump'),
+                          on_change=self._jump, help="Show rows from this shift date back")
+
+    def _jump(self):
+        day: Optional[date] = st.session_state[self._state('jump')]
+        if day is None:
+            self._go(None, 1)
+        else:
+            self._go(date_cursor(day), None, keep_jump=True)
+
+    def pager(self, page: Page):
+        """Show buttons to move to newer and older pages."""
+        page_no = st.session_state[self._state('page_no')]
+        col_latest, col_newer, col_older = st.columns(3)
+
+        with col_latest:
+            st.button("⏮️ Latest", key=self._state('latest'), use_container_width=True,
+                      disabled=st.session_state[self._state('cursor')] is None,
+                      on_click=self._go, args=(None, 1))
+
+        with col_newer:
+            st.button("◀️ Newer", key=self._state('newer'), use_container_width=True,
+                      disabled=page.prev_cursor is None,
+                      on_click=self._go, args=(page.prev_cursor, page_no - 1 if page_no else None))
+
+        with col_older:
+            st.button("Older ▶️", key=self._state('older'), use_container_width=True,
+                      disabled=page.next_cursor is None,
+                      on_click=self._go, args=(page.next_cursor, page_no + 1 if page_no else None))
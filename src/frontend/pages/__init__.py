@@ -6,6 +6,7 @@ from . import operations
 from . import issues_alerts
 from . import market
 from . import comments
+from . import search
 
 __all__ = [
     'dashboard',
@@ -14,5 +15,6 @@ __all__ = [
     'operations',
     'issues_alerts',
     'market',
-    'comments'
+    'comments',
+    'search'
 ]
@@ -2,7 +2,10 @@
 import streamlit as st
 from datetime import date
 from src.backend.database.db_manager import DatabaseManager
-from src.utils.helpers import show_success_message, validate_required_field
+from src.backend.database.filters import ListFilter
+from src.frontend.grid_editor import GridEditor
+from src.frontend.paged_list import PagedList
+from src.utils.helpers import PREVIEW_CHARS, full_text, show_success_message, validate_required_field
 
 
 def show(db: DatabaseManager):
@@ -23,24 +26,22 @@ def show(db: DatabaseManager):
         # Search functionality
         search = st.text_input("🔍 Search comments", "")
         
-        comments = db.get_all_comments()
+        comment_list = PagedList('comments', ListFilter(text=search or None), noun="comments")
+        comments = comment_list.load(db.get_comments_page, preview=PREVIEW_CHARS, as_frame=False)
         
-        if not comments.empty:
-            # Apply search filter
-            if search:
-                comments = comments[
-                    comments['comment_text'].str.contains(search, case=False, na=False)
-                ]
+        comment_grid = GridEditor(db, 'comments', comment_list, db.get_comments_page)
+        if comment_grid.toggle():
+            comment_grid.show()
+        elif comments.total:
+            comment_list.controls(comments)
             
-            st.markdown(f"**Total Comments:** {len(comments)}")
-            
-            for idx, comment in comments.iterrows():
+            for comment in comments.rows:
                 with st.container():
                     col1, col2 = st.columns([4, 1])
                     
                     with col1:
                         st.markdown(f"**📅 {comment['shift_date']}**")
-                        st.markdown(f"{comment['comment_text']}")
+                        st.markdown(full_text(comment, 'comment_text', db.get_comment, f"full_comment_{comment['id']}", "Show full comment"))
                         st.caption(f"Created: {comment['created_at']} | Updated: {comment['updated_at']}")
                     
                     with col2:
@@ -68,7 +69,8 @@ def show(db: DatabaseManager):
                         st.markdown("---")
                         with st.form(key=f"edit_comment_form_{comment['id']}"):
                             edit_date = st.date_input("Shift Date *", value=date.fromisoformat(comment['shift_date']))
-                            edit_text = st.text_area("Comment *", value=comment['comment_text'], height=150)
+                            full_comment = db.get_comment(comment['id']) or comment
+                            edit_text = st.text_area("Comment *", value=full_comment['comment_text'], height=150)
                             
                             col_submit, col_cancel = st.columns(2)
                             
@@ -94,6 +96,10 @@ def show(db: DatabaseManager):
                                 st.rerun()
                     
                     st.markdown("---")
+            
+            comment_list.pager(comments)
+        elif search:
+            st.info("No comments match your search.")
         else:
             st.info("No comments found. Add your first comment using the 'Add Comment' tab.")
     
@@ -1,6 +1,5 @@
 """Dashboard page - Main overview of shift handover system."""
 import streamlit as st
-import pandas as pd
 from src.backend.database.db_manager import DatabaseManager
 from src.utils.helpers import get_status_emoji, get_priority_emoji
 
@@ -14,44 +13,39 @@ def show(db: DatabaseManager):
     st.markdown('<h1 class="main-header">📊 Dashboard</h1>', unsafe_allow_html=True)
     st.markdown("Welcome to the Shift Handover System - Your at-a-glance overview")
     
+    snapshot = db.get_dashboard_snapshot()
+    
     # Summary metrics in columns
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        critical_count = db.get_critical_notifications_count()
         st.metric(
             label="🔴 Critical Alerts",
-            value=critical_count,
+            value=snapshot.critical_count,
             delta=None,
             help="Unresolved critical notifications"
         )
     
     with col2:
-        it_issues_count = db.get_open_it_issues_count()
         st.metric(
             label="🟡 Open IT Issues",
-            value=it_issues_count,
+            value=snapshot.open_it_issues_count,
             delta=None,
             help="IT issues that are open or in progress"
         )
     
     with col3:
-        recent_logs = db.get_recent_handover_logs(limit=10)
         st.metric(
             label="📝 Recent Handovers",
-            value=len(recent_logs),
+            value=snapshot.recent_handover_count,
             delta=None,
             help="Handover logs from last 10 entries"
         )
     
     with col4:
-        # Get latest positions count
-        power_pos = db.get_latest_power_position()
-        gas_pos = db.get_latest_gas_position()
-        positions_count = (1 if power_pos else 0) + (1 if gas_pos else 0)
         st.metric(
             label="💼 Active Positions",
-            value=positions_count,
+            value=snapshot.positions_count,
             delta=None,
             help="Current trading positions tracked"
         )
@@ -64,17 +58,15 @@ def show(db: DatabaseManager):
     with col_left:
         st.subheader("📋 Recent Handover Logs")
         
-        recent_logs = db.get_recent_handover_logs(limit=5)
-        
-        if not recent_logs.empty:
+        if snapshot.recent_handover_logs:
             # Display as cards
-            for _, log in recent_logs.iterrows():
+            for log in snapshot.recent_handover_logs:
                 with st.container():
                     st.markdown(f"""
                     <div style="border: 1px solid #1f77b4; border-radius: 5px; padding: 15px; margin-bottom: 10px; background-color: #f0f8ff;">
                         <h4 style="margin: 0; color: #1f77b4;">👤 {log['trader_name']}</h4>
                         <p style="margin: 5px 0; color: #666;">📅 {log['shift_date']}</p>
-                        <p style="margin: 5px 0;">{log['notes'][:100]}{'...' if len(str(log['notes'])) > 100 else ''}</p>
+                        <p style="margin: 5px 0;">{log['notes'] or ''}{'...' if (log['notes_length'] or 0) > 100 else ''}</p>
                         <small style="color: #999;">Created: {log['created_at']}</small>
                     </div>
                     """, unsafe_allow_html=True)
@@ -85,16 +77,12 @@ def show(db: DatabaseManager):
         # Critical Notifications
         st.subheader("🚨 Critical Alerts")
         
-        unresolved = db.get_unresolved_notifications()
-        
-        if not unresolved.empty:
-            critical = unresolved[unresolved['priority'] == 'critical'].head(3)
-            
-            if not critical.empty:
-                for _, notif in critical.iterrows():
+        if snapshot.has_unresolved_notifications:
+            if snapshot.critical_notifications:
+                for notif in snapshot.critical_notifications:
                     st.warning(f"""
                     **{get_priority_emoji(notif['priority'])} {notif['title']}**  
-                    {notif['message'][:80]}{'...' if len(str(notif['message'])) > 80 else ''}  
+                    {notif['message'][:80]}{'...' if notif['message_length'] > 80 else ''}  
                     *{notif['shift_date']}*
                     """)
             else:
@@ -107,13 +95,9 @@ def show(db: DatabaseManager):
         # IT Issues Summary
         st.subheader("💻 IT Issues")
         
-        it_issues = db.get_all_it_issues()
-        
-        if not it_issues.empty:
-            open_issues = it_issues[it_issues['status'].isin(['open', 'in_progress'])].head(3)
-            
-            if not open_issues.empty:
-                for _, issue in open_issues.iterrows():
+        if snapshot.has_it_issues:
+            if snapshot.open_it_issues:
+                for issue in snapshot.open_it_issues:
                     status_emoji = get_status_emoji(issue['status'])
                     st.info(f"""
                     **{status_emoji} {issue['title']}**  
@@ -134,12 +118,12 @@ def show(db: DatabaseManager):
     
     with pos_col1:
         st.markdown("#### ⚡ Power Position")
-        power_pos = db.get_latest_power_position()
+        power_pos = snapshot.latest_power_position
         
         if power_pos:
             st.success(f"""
             **Date:** {power_pos['shift_date']}  
-            **Position:** {power_pos['position_details'][:100]}{'...' if len(str(power_pos['position_details'])) > 100 else ''}  
+            **Position:** {power_pos['position_details']}{'...' if power_pos['position_details_length'] > 100 else ''}  
             **Portfolio Status:** {power_pos['portfolio_status'] if power_pos['portfolio_status'] else 'N/A'}
             """)
         else:
@@ -147,12 +131,12 @@ def show(db: DatabaseManager):
     
     with pos_col2:
         st.markdown("#### 🔥 Gas Position")
-        gas_pos = db.get_latest_gas_position()
+        gas_pos = snapshot.latest_gas_position
         
         if gas_pos:
             st.success(f"""
             **Date:** {gas_pos['shift_date']}  
-            **Position:** {gas_pos['position_details'][:100]}{'...' if len(str(gas_pos['position_details'])) > 100 else ''}  
+            **Position:** {gas_pos['position_details']}{'...' if gas_pos['position_details_length'] > 100 else ''}  
             **Portfolio Status:** {gas_pos['portfolio_status'] if gas_pos['portfolio_status'] else 'N/A'}
             """)
         else:
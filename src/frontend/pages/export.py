@@ -0,0 +1,71 @@
+"""Export page - Download tables as CSV or JSONL."""
+import tempfile
+from datetime import datetime
+import streamlit as st
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.export import EXPORT_FORMATS, export_zip
+from src.frontend.pages.search import SECTION_LABELS
+
+# Exports are spooled in memory up to this size, then to a temporary file
+SPOOL_BYTES = 8 * 1024 * 1024
+
+
+def show(db: DatabaseManager):
+    """Display export page.
+
+    Args:
+        db: Database manager instance
+    """
+    st.markdown('<h1 class="main-header">📦 Export</h1>', unsafe_allow_html=True)
+    st.markdown("Download shift data for a date range as a zip with one file per section")
+
+    with st.form(key="export_form"):
+        sections = st.multiselect(
+            "Sections",
+            options=list(SECTION_LABELS),
+            format_func=lambda table: SECTION_LABELS[table],
+            placeholder="All sections"
+        )
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            date_from = st.date_input("From", value=None)
+
+        with col2:
+            date_to = st.date_input("To", value=None)
+
+        with col3:
+            fmt = st.selectbox("Format", EXPORT_FORMATS, format_func=str.upper)
+
+        include_archive = st.checkbox("Include archived shifts", help="Also export shifts moved to archive files")
+
+        prepare = st.form_submit_button("📦 Prepare Export", use_container_width=True)
+
+    if prepare:
+        with st.spinner("Exporting..."):
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES) as spool:
+                counts = export_zip(
+                    db, spool, sections or None, fmt,
+                    date_from=date_from.isoformat() if date_from else None,
+                    date_to=date_to.isoformat() if date_to else None,
+                    include_archive=include_archive,
+                )
+                spool.seek(0)
+                st.session_state['export_file'] = (
+                    f"shift_handover_{datetime.now():%Y%m%d_%H%M%S}_{fmt}.zip", spool.read(), counts
+                )
+
+    if 'export_file' in st.session_state:
+        file_name, data, counts = st.session_state['export_file']
+        st.markdown(f"**{sum(counts.values())} rows** · " + " · ".join(
+            f"{SECTION_LABELS[table]}: {rows}" for table, rows in counts.items()
+        ))
+        st.download_button(
+            "⬇️ Download",
+            data=data,
+            file_name=file_name,
+            mime="application/zip",
+            on_click="ignore",
+            use_container_width=True
+        )
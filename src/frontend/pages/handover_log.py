@@ -2,7 +2,10 @@
 import streamlit as st
 from datetime import date
 from src.backend.database.db_manager import DatabaseManager
-from src.utils.helpers import show_success_message, show_error_message, validate_required_field
+from src.backend.database.filters import ListFilter
+from src.frontend.grid_editor import GridEditor
+from src.frontend.paged_list import PagedList
+from src.utils.helpers import PREVIEW_CHARS, full_text, show_success_message, show_error_message, validate_required_field
 
 
 def show(db: DatabaseManager):
@@ -20,30 +23,28 @@ def show(db: DatabaseManager):
     with tab1:
         st.subheader("All Handover Logs")
         
-        # Get all logs
-        logs = db.get_all_handover_logs()
+        # Search/filter (applied in SQL)
+        search = st.text_input("🔍 Search by trader name or notes", "")
         
-        if not logs.empty:
-            # Search/filter
-            search = st.text_input("🔍 Search by trader name or notes", "")
-            
-            if search:
-                logs = logs[
-                    logs['trader_name'].str.contains(search, case=False, na=False) |
-                    logs['notes'].str.contains(search, case=False, na=False)
-                ]
-            
-            st.markdown(f"**Total Logs:** {len(logs)}")
+        logs_list = PagedList('logs', ListFilter(text=search or None), noun="logs")
+        logs = logs_list.load(db.get_handover_logs_page, preview=PREVIEW_CHARS, as_frame=False)
+        
+        logs_grid = GridEditor(db, 'handover_logs', logs_list, db.get_handover_logs_page)
+        if logs_grid.toggle():
+            logs_grid.show()
+        elif logs.total:
+            logs_list.controls(logs)
             
-            # Display logs
-            for idx, log in logs.iterrows():
+            # Display the logs on this page
+            for log in logs.rows:
                 with st.expander(f"👤 {log['trader_name']} - {log['shift_date']}"):
                     col1, col2 = st.columns([3, 1])
                     
                     with col1:
                         st.markdown(f"**Shift Date:** {log['shift_date']}")
                         st.markdown(f"**Notes:**")
-                        st.text_area("", value=log['notes'], height=100, key=f"view_{log['id']}", disabled=True)
+                        notes = full_text(log, 'notes', db.get_handover_log, f"full_log_{log['id']}", "Show full notes")
+                        st.text_area("", value=notes, height=100, key=f"view_{log['id']}_{len(notes)}", disabled=True)
                         st.caption(f"Created: {log['created_at']} | Updated: {log['updated_at']}")
                     
                     with col2:
@@ -77,7 +78,8 @@ def show(db: DatabaseManager):
                         with st.form(key=f"edit_form_{log['id']}"):
                             edit_trader = st.text_input("Trader Name *", value=log['trader_name'])
                             edit_date = st.date_input("Shift Date *", value=date.fromisoformat(log['shift_date']))
-                            edit_notes = st.text_area("Notes", value=log['notes'], height=150)
+                            full_log = db.get_handover_log(log['id']) or log
+                            edit_notes = st.text_area("Notes", value=full_log['notes'], height=150)
                             
                             col_submit, col_cancel = st.columns(2)
                             
@@ -102,6 +104,10 @@ def show(db: DatabaseManager):
                             if cancel:
                                 st.session_state[f'edit_log_{log["id"]}'] = False
                                 st.rerun()
+            
+            logs_list.pager(logs)
+        elif search:
+            st.info("No handover logs match your search.")
         else:
             st.info("No handover logs found. Create your first log using the 'Add New Log' tab.")
     
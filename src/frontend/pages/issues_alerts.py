@@ -2,7 +2,13 @@
 import streamlit as st
 from datetime import date
 from src.backend.database.db_manager import DatabaseManager
-from src.utils.helpers import show_success_message, validate_required_field, get_priority_emoji, get_status_emoji
+from src.backend.database.filters import ListFilter
+from src.frontend.grid_editor import GridEditor
+from src.frontend.paged_list import PagedList
+from src.utils.helpers import PREVIEW_CHARS, full_text, show_success_message, validate_required_field, get_priority_emoji, get_status_emoji
+
+PRIORITIES = ['critical', 'high', 'medium', 'low']
+STATUSES = ['open', 'in_progress', 'resolved']
 
 
 def show(db: DatabaseManager):
@@ -14,6 +20,23 @@ def show(db: DatabaseManager):
     st.markdown('<h1 class="main-header">🚨 Issues & Alerts</h1>', unsafe_allow_html=True)
     st.markdown("Monitor notifications and track IT issues")
     
+    # The filter widgets are drawn inside each section, but their values are
+    # already in session state, so both sections can be loaded concurrently.
+    show_resolved = st.session_state.get('notif_show_resolved', False)
+    priority_filter = st.session_state.get('notif_priority_filter', PRIORITIES)
+    status_filter = st.session_state.get('it_status_filter', STATUSES)
+    notif_list = PagedList('notif', ListFilter(
+        resolved=None if show_resolved else False,
+        priorities=tuple(priority_filter) if priority_filter else None
+    ), noun="notifications")
+    issue_list = PagedList('issue', ListFilter(
+        statuses=tuple(status_filter) if status_filter else None
+    ), noun="IT issues")
+    notifications, it_issues = db.aio.run(
+        db.aio.get_notifications_page(**notif_list.query(), preview=PREVIEW_CHARS, as_frame=False),
+        db.aio.get_it_issues_page(**issue_list.query(), preview=PREVIEW_CHARS, as_frame=False)
+    )
+    
     st.markdown("---")
     
     # Notifications Section
@@ -25,28 +48,23 @@ def show(db: DatabaseManager):
             col_filter1, col_filter2 = st.columns(2)
             
             with col_filter1:
-                show_resolved = st.checkbox("Show Resolved", value=False)
+                st.checkbox("Show Resolved", value=False, key='notif_show_resolved')
             
             with col_filter2:
-                priority_filter = st.multiselect(
+                st.multiselect(
                     "Filter by Priority",
-                    options=['critical', 'high', 'medium', 'low'],
-                    default=['critical', 'high', 'medium', 'low']
+                    options=PRIORITIES,
+                    default=PRIORITIES,
+                    key='notif_priority_filter'
                 )
             
-            notifications = db.get_all_notifications()
-            
-            if not notifications.empty:
-                # Apply filters
-                if not show_resolved:
-                    notifications = notifications[notifications['is_resolved'] == 0]
-                
-                if priority_filter:
-                    notifications = notifications[notifications['priority'].isin(priority_filter)]
-                
-                st.markdown(f"**Total Notifications:** {len(notifications)}")
+            notif_grid = GridEditor(db, 'notifications', notif_list, db.get_notifications_page)
+            if notif_grid.toggle():
+                notif_grid.show()
+            elif notifications.total:
+                notif_list.controls(notifications)
                 
-                for idx, notif in notifications.iterrows():
+                for notif in notifications.rows:
                     priority_emoji = get_priority_emoji(notif['priority'])
                     resolved_text = "✅ RESOLVED" if notif['is_resolved'] else "🔴 ACTIVE"
                     
@@ -56,7 +74,8 @@ def show(db: DatabaseManager):
                         with col1:
                             st.markdown(f"### {priority_emoji} {notif['title']} - {resolved_text}")
                             st.markdown(f"**Priority:** {notif['priority'].upper()}")
-                            st.markdown(f"**Message:** {notif['message']}")
+                            message = full_text(notif, 'message', db.get_notification, f"full_notif_{notif['id']}", "Show full message")
+                            st.markdown(f"**Message:** {message}")
                             st.markdown(f"**Shift Date:** {notif['shift_date']}")
                             st.caption(f"Updated: {notif['updated_at']}")
                         
@@ -87,7 +106,8 @@ def show(db: DatabaseManager):
                             st.markdown("---")
                             with st.form(key=f"edit_notif_form_{notif['id']}"):
                                 edit_title = st.text_input("Title *", value=notif['title'])
-                                edit_message = st.text_area("Message *", value=notif['message'], height=100)
+                                full_notif = db.get_notification(notif['id']) or notif
+                                edit_message = st.text_area("Message *", value=full_notif['message'], height=100)
                                 edit_priority = st.selectbox(
                                     "Priority *",
                                     options=['low', 'medium', 'high', 'critical'],
@@ -116,6 +136,8 @@ def show(db: DatabaseManager):
                                     st.rerun()
                         
                         st.markdown("---")
+                
+                notif_list.pager(notifications)
             else:
                 st.info("No notifications found.")
         
@@ -142,22 +164,20 @@ def show(db: DatabaseManager):
         
         with it_tab1:
             # Filter by status
-            status_filter = st.multiselect(
+            st.multiselect(
                 "Filter by Status",
-                options=['open', 'in_progress', 'resolved'],
-                default=['open', 'in_progress', 'resolved']
+                options=STATUSES,
+                default=STATUSES,
+                key='it_status_filter'
             )
             
-            it_issues = db.get_all_it_issues()
-            
-            if not it_issues.empty:
-                # Apply filter
-                if status_filter:
-                    it_issues = it_issues[it_issues['status'].isin(status_filter)]
+            issue_grid = GridEditor(db, 'it_issues', issue_list, db.get_it_issues_page)
+            if issue_grid.toggle():
+                issue_grid.show()
+            elif it_issues.total:
+                issue_list.controls(it_issues)
                 
-                st.markdown(f"**Total IT Issues:** {len(it_issues)}")
-                
-                for idx, issue in it_issues.iterrows():
+                for issue in it_issues.rows:
                     status_emoji = get_status_emoji(issue['status'])
                     
                     with st.container():
@@ -166,7 +186,8 @@ def show(db: DatabaseManager):
                         with col1:
                             st.markdown(f"### {status_emoji} {issue['title']}")
                             st.markdown(f"**Status:** {issue['status'].replace('_', ' ').upper()}")
-                            st.markdown(f"**Description:** {issue['description']}")
+                            description = full_text(issue, 'description', db.get_it_issue, f"full_issue_{issue['id']}", "Show full description")
+                            st.markdown(f"**Description:** {description}")
                             st.markdown(f"**Shift Date:** {issue['shift_date']}")
                             st.caption(f"Updated: {issue['updated_at']}")
                         
@@ -191,7 +212,8 @@ def show(db: DatabaseManager):
                             st.markdown("---")
                             with st.form(key=f"edit_issue_form_{issue['id']}"):
                                 edit_title = st.text_input("Title *", value=issue['title'])
-                                edit_description = st.text_area("Description *", value=issue['description'], height=100)
+                                full_issue = db.get_it_issue(issue['id']) or issue
+                                edit_description = st.text_area("Description *", value=full_issue['description'], height=100)
                                 edit_status = st.selectbox(
                                     "Status *",
                                     options=['open', 'in_progress', 'resolved'],
@@ -219,6 +241,8 @@ def show(db: DatabaseManager):
                                     st.rerun()
                         
                         st.markdown("---")
+                
+                issue_list.pager(it_issues)
             else:
                 st.info("No IT issues found.")
         
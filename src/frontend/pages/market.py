@@ -2,7 +2,10 @@
 import streamlit as st
 from datetime import date
 from src.backend.database.db_manager import DatabaseManager
-from src.utils.helpers import show_success_message, validate_required_field
+from src.backend.database.filters import ListFilter
+from src.frontend.grid_editor import GridEditor
+from src.frontend.paged_list import PagedList
+from src.utils.helpers import PREVIEW_CHARS, full_text, show_success_message, validate_required_field
 
 
 def show(db: DatabaseManager):
@@ -23,19 +26,16 @@ def show(db: DatabaseManager):
         # Search functionality
         search = st.text_input("🔍 Search by competitor name or activity details", "")
         
-        activities = db.get_all_competitor_activity()
+        activity_list = PagedList('activity', ListFilter(text=search or None), noun="activities")
+        activities = activity_list.load(db.get_competitor_activity_page, preview=PREVIEW_CHARS, as_frame=False)
         
-        if not activities.empty:
-            # Apply search filter
-            if search:
-                activities = activities[
-                    activities['competitor_name'].str.contains(search, case=False, na=False) |
-                    activities['activity_details'].str.contains(search, case=False, na=False)
-                ]
+        activity_grid = GridEditor(db, 'competitor_activity', activity_list, db.get_competitor_activity_page)
+        if activity_grid.toggle():
+            activity_grid.show()
+        elif activities.total:
+            activity_list.controls(activities)
             
-            st.markdown(f"**Total Activities:** {len(activities)}")
-            
-            for idx, activity in activities.iterrows():
+            for activity in activities.rows:
                 with st.expander(f"🏢 {activity['competitor_name']} - {activity['shift_date']}"):
                     col1, col2 = st.columns([3, 1])
                     
@@ -43,7 +43,9 @@ def show(db: DatabaseManager):
                         st.markdown(f"**Competitor:** {activity['competitor_name']}")
                         st.markdown(f"**Shift Date:** {activity['shift_date']}")
                         st.markdown(f"**Activity Details:**")
-                        st.text_area("", value=activity['activity_details'], height=150, key=f"view_activity_{activity['id']}", disabled=True)
+                        details = full_text(activity, 'activity_details', db.get_competitor_activity,
+                                            f"full_activity_{activity['id']}", "Show full details")
+                        st.text_area("", value=details, height=150, key=f"view_activity_{activity['id']}_{len(details)}", disabled=True)
                         st.caption(f"Created: {activity['created_at']} | Updated: {activity['updated_at']}")
                     
                     with col2:
@@ -74,7 +76,8 @@ def show(db: DatabaseManager):
                         with st.form(key=f"edit_activity_form_{activity['id']}"):
                             edit_competitor = st.text_input("Competitor Name *", value=activity['competitor_name'])
                             edit_date = st.date_input("Shift Date *", value=date.fromisoformat(activity['shift_date']))
-                            edit_details = st.text_area("Activity Details *", value=activity['activity_details'], height=150)
+                            full_activity = db.get_competitor_activity(activity['id']) or activity
+                            edit_details = st.text_area("Activity Details *", value=full_activity['activity_details'], height=150)
                             
                             col_submit, col_cancel = st.columns(2)
                             
@@ -99,6 +102,10 @@ def show(db: DatabaseManager):
                             if cancel:
                                 st.session_state[f'edit_activity_{activity["id"]}'] = False
                                 st.rerun()
+            
+            activity_list.pager(activities)
+        elif search:
+            st.info("No competitor activities match your search.")
         else:
             st.info("No competitor activities recorded. Add your first activity using the 'Add Activity' tab.")
     
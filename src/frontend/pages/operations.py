@@ -2,7 +2,9 @@
 import streamlit as st
 from datetime import date
 from src.backend.database.db_manager import DatabaseManager
-from src.utils.helpers import show_success_message, validate_required_field, get_status_emoji, get_status_color
+from src.frontend.grid_editor import GridEditor
+from src.frontend.paged_list import PagedList
+from src.utils.helpers import PREVIEW_CHARS, full_text, show_success_message, validate_required_field, get_status_emoji, get_status_color
 
 
 def show(db: DatabaseManager):
@@ -14,6 +16,14 @@ def show(db: DatabaseManager):
     st.markdown('<h1 class="main-header">🏭 Operations</h1>', unsafe_allow_html=True)
     st.markdown("Track plant status and power system infrastructure")
     
+    # Both sections are independent, so load their pages concurrently
+    plant_list = PagedList('plant', noun="plant records")
+    system_list = PagedList('system', noun="system records")
+    plant_status, system_status = db.aio.run(
+        db.aio.get_plant_status_page(**plant_list.query(), preview=PREVIEW_CHARS, as_frame=False),
+        db.aio.get_power_system_status_page(**system_list.query(), preview=PREVIEW_CHARS, as_frame=False)
+    )
+    
     st.markdown("---")
     
     # Plant Status Section
@@ -21,12 +31,13 @@ def show(db: DatabaseManager):
         plant_tab1, plant_tab2 = st.tabs(["📋 View Status", "➕ Add Status"])
         
         with plant_tab1:
-            plant_status = db.get_all_plant_status()
-            
-            if not plant_status.empty:
-                st.markdown(f"**Total Plant Records:** {len(plant_status)}")
+            plant_grid = GridEditor(db, 'plant_status', plant_list, db.get_plant_status_page)
+            if plant_grid.toggle():
+                plant_grid.show()
+            elif plant_status.total:
+                plant_list.controls(plant_status)
                 
-                for idx, plant in plant_status.iterrows():
+                for plant in plant_status.rows:
                     status_emoji = get_status_emoji(plant['status'])
                     status_color = get_status_color(plant['status'])
                     
@@ -38,7 +49,8 @@ def show(db: DatabaseManager):
                             st.markdown(f"**Status:** <span style='color: {status_color}; font-weight: bold;'>{plant['status'].upper()}</span>", unsafe_allow_html=True)
                             st.markdown(f"**Shift Date:** {plant['shift_date']}")
                             if plant['notes']:
-                                st.markdown(f"**Notes:** {plant['notes']}")
+                                notes = full_text(plant, 'notes', db.get_plant_status, f"full_plant_{plant['id']}", "Show full notes")
+                                st.markdown(f"**Notes:** {notes}")
                             st.caption(f"Updated: {plant['updated_at']}")
                         
                         with col2:
@@ -68,7 +80,8 @@ def show(db: DatabaseManager):
                                     index=['operational', 'partial', 'offline'].index(plant['status'])
                                 )
                                 edit_date = st.date_input("Shift Date *", value=date.fromisoformat(plant['shift_date']))
-                                edit_notes = st.text_area("Notes", value=plant['notes'] or "", height=100)
+                                full_plant = db.get_plant_status(plant['id']) or plant
+                                edit_notes = st.text_area("Notes", value=full_plant['notes'] or "", height=100)
                                 
                                 col_submit, col_cancel = st.columns(2)
                                 
@@ -90,6 +103,8 @@ def show(db: DatabaseManager):
                                     st.rerun()
                         
                         st.markdown("---")
+                
+                plant_list.pager(plant_status)
             else:
                 st.info("No plant status records found.")
         
@@ -115,12 +130,13 @@ def show(db: DatabaseManager):
         system_tab1, system_tab2 = st.tabs(["📋 View Status", "➕ Add Status"])
         
         with system_tab1:
-            system_status = db.get_all_power_system_status()
-            
-            if not system_status.empty:
-                st.markdown(f"**Total System Records:** {len(system_status)}")
+            system_grid = GridEditor(db, 'power_system_status', system_list, db.get_power_system_status_page)
+            if system_grid.toggle():
+                system_grid.show()
+            elif system_status.total:
+                system_list.controls(system_status)
                 
-                for idx, system in system_status.iterrows():
+                for system in system_status.rows:
                     with st.container():
                         col1, col2 = st.columns([3, 1])
                         
@@ -129,7 +145,8 @@ def show(db: DatabaseManager):
                             st.markdown(f"**Status:** {system['status']}")
                             st.markdown(f"**Shift Date:** {system['shift_date']}")
                             if system['notes']:
-                                st.markdown(f"**Notes:** {system['notes']}")
+                                notes = full_text(system, 'notes', db.get_power_system_status, f"full_system_{system['id']}", "Show full notes")
+                                st.markdown(f"**Notes:** {notes}")
                             st.caption(f"Updated: {system['updated_at']}")
                         
                         with col2:
@@ -155,7 +172,8 @@ def show(db: DatabaseManager):
                                 edit_name = st.text_input("System Name *", value=system['system_name'])
                                 edit_status = st.text_input("Status *", value=system['status'])
                                 edit_date = st.date_input("Shift Date *", value=date.fromisoformat(system['shift_date']))
-                                edit_notes = st.text_area("Notes", value=system['notes'] or "", height=100)
+                                full_system = db.get_power_system_status(system['id']) or system
+                                edit_notes = st.text_area("Notes", value=full_system['notes'] or "", height=100)
                                 
                                 col_submit, col_cancel = st.columns(2)
                                 
@@ -177,6 +195,8 @@ def show(db: DatabaseManager):
                                     st.rerun()
                         
                         st.markdown("---")
+                
+                system_list.pager(system_status)
             else:
                 st.info("No power system status records found.")
         
@@ -0,0 +1,94 @@
+"""Performance page - Per-method database timings for tuning."""
+import json
+import streamlit as st
+from src.backend.database.db_manager import DatabaseManager
+
+
+def method_rows(snapshot):
+    """Flatten per-method statistics into table rows, slowest in total first."""
+    rows = [
+        {
+            'Method': name,
+            'Calls': stats['calls'],
+            'Errors': stats['errors'],
+            'Slow': stats['slow_calls'],
+            'Total ms': round(stats['total_ms'], 1),
+            'Mean ms': round(stats['latency']['mean_ms'], 2),
+            'p50 ms': stats['latency']['p50_ms'],
+            'p95 ms': stats['latency']['p95_ms'],
+            'p99 ms': stats['latency']['p99_ms'],
+            'Max ms': round(stats['latency']['max_ms'], 1),
+            'Rows': stats['rows'],
+            'KB': round(stats['bytes'] / 1024, 1),
+        }
+        for name, stats in snapshot.items()
+    ]
+    return sorted(rows, key=lambda row: row['Total ms'], reverse=True)
+
+
+def markdown_table(rows):
+    """Render table rows as a Markdown table."""
+    columns = list(rows[0])
+    lines = ['| ' + ' | '.join(columns) + ' |', '|' + '---|' * len(columns)]
+    lines.extend('| ' + ' | '.join(f"`{row[c]}`" if c == 'Method' else str(row[c]) for c in columns) + ' |'
+                 for row in rows)
+    return '\n'.join(lines)
+
+
+def show(db: DatabaseManager):
+    """Display performance page.
+
+    Args:
+        db: Database manager instance
+    """
+    st.markdown('<h1 class="main-header">⏱️ Performance</h1>', unsafe_allow_html=True)
+    threshold = db.metrics.slow_query_ms
+    st.markdown(
+        "Timings of database calls since the app started or the last reset · slow-query log "
+        + (f"logs calls over **{threshold:g} ms**" if threshold is not None else "is **off** (set DB_SLOW_QUERY_MS)")
+    )
+
+    snapshot = db.metrics.snapshot()
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Calls", sum(stats['calls'] for stats in snapshot.values()))
+    with col2:
+        st.metric("Time in database", f"{sum(stats['total_ms'] for stats in snapshot.values()) / 1000:.1f} s")
+    with col3:
+        st.metric("Slow calls", sum(stats['slow_calls'] for stats in snapshot.values()))
+    with col4:
+        st.metric("Errors", sum(stats['errors'] for stats in snapshot.values()))
+
+    st.markdown("---")
+    st.subheader("📋 Methods")
+    if snapshot:
+        st.markdown(markdown_table(method_rows(snapshot)))
+    else:
+        st.info("No database calls recorded yet.")
+
+    with st.expander("🔒 Lock contention and cache"):
+        st.json({
+            'contention': db.contention.stats(),
+            'cache': db.cache.stats() if db.cache is not None else None,
+            'write_pipeline': db.write_pipeline.stats() if db.write_pipeline is not None else None,
+        }, expanded=False)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "⬇️ Download JSON",
+            data=json.dumps({
+                'slow_query_ms': threshold,
+                'methods': snapshot,
+                'contention': db.contention.stats(),
+            }, indent=2),
+            file_name="db_metrics.json",
+            mime="application/json",
+            on_click="ignore",
+            use_container_width=True
+        )
+    with col2:
+        if st.button("🔄 Reset", use_container_width=True):
+            db.metrics.reset()
+            st.rerun()
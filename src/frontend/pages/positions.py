@@ -2,7 +2,9 @@
 import streamlit as st
 from datetime import date
 from src.backend.database.db_manager import DatabaseManager
-from src.utils.helpers import show_success_message, show_error_message, validate_required_field
+from src.frontend.grid_editor import GridEditor
+from src.frontend.paged_list import PagedList
+from src.utils.helpers import PREVIEW_CHARS, full_text, show_success_message, show_error_message, validate_required_field
 
 
 def show(db: DatabaseManager):
@@ -22,19 +24,24 @@ def show(db: DatabaseManager):
         power_tab1, power_tab2 = st.tabs(["📋 View Positions", "➕ Add Position"])
         
         with power_tab1:
-            power_positions = db.get_all_power_positions()
+            power_list = PagedList('power_positions', noun="power positions")
+            power_positions = power_list.load(db.get_power_positions_page, preview=PREVIEW_CHARS, as_frame=False)
             
-            if not power_positions.empty:
-                st.markdown(f"**Total Power Positions:** {len(power_positions)}")
+            power_grid = GridEditor(db, 'power_positions', power_list, db.get_power_positions_page)
+            if power_grid.toggle():
+                power_grid.show()
+            elif power_positions.total:
+                power_list.controls(power_positions)
                 
-                for idx, pos in power_positions.iterrows():
+                for pos in power_positions.rows:
                     with st.container():
                         col1, col2 = st.columns([3, 1])
                         
                         with col1:
                             st.markdown(f"### 📅 {pos['shift_date']}")
                             st.markdown(f"**Position Details:**")
-                            st.text_area("", value=pos['position_details'], height=100, key=f"power_view_{pos['id']}", disabled=True)
+                            details = full_text(pos, 'position_details', db.get_power_position, f"power_full_{pos['id']}", "Show full details")
+                            st.text_area("", value=details, height=100, key=f"power_view_{pos['id']}_{len(details)}", disabled=True)
                             st.markdown(f"**Portfolio Status:** {pos['portfolio_status'] if pos['portfolio_status'] else 'N/A'}")
                             st.caption(f"Updated: {pos['updated_at']}")
                         
@@ -59,7 +66,8 @@ def show(db: DatabaseManager):
                             st.markdown("---")
                             with st.form(key=f"edit_power_form_{pos['id']}"):
                                 edit_date = st.date_input("Shift Date *", value=date.fromisoformat(pos['shift_date']))
-                                edit_details = st.text_area("Position Details *", value=pos['position_details'], height=150)
+                                full_pos = db.get_power_position(pos['id']) or pos
+                                edit_details = st.text_area("Position Details *", value=full_pos['position_details'], height=150)
                                 edit_status = st.text_input("Portfolio Status", value=pos['portfolio_status'] or "")
                                 
                                 col_submit, col_cancel = st.columns(2)
@@ -82,6 +90,8 @@ def show(db: DatabaseManager):
                                     st.rerun()
                         
                         st.markdown("---")
+                
+                power_list.pager(power_positions)
             else:
                 st.info("No power positions recorded.")
         
@@ -110,19 +120,24 @@ def show(db: DatabaseManager):
         gas_tab1, gas_tab2 = st.tabs(["📋 View Positions", "➕ Add Position"])
         
         with gas_tab1:
-            gas_positions = db.get_all_gas_positions()
+            gas_list = PagedList('gas_positions', noun="gas positions")
+            gas_positions = gas_list.load(db.get_gas_positions_page, preview=PREVIEW_CHARS, as_frame=False)
             
-            if not gas_positions.empty:
-                st.markdown(f"**Total Gas Positions:** {len(gas_positions)}")
+            gas_grid = GridEditor(db, 'gas_positions', gas_list, db.get_gas_positions_page)
+            if gas_grid.toggle():
+                gas_grid.show()
+            elif gas_positions.total:
+                gas_list.controls(gas_positions)
                 
-                for idx, pos in gas_positions.iterrows():
+                for pos in gas_positions.rows:
                     with st.container():
                         col1, col2 = st.columns([3, 1])
                         
                         with col1:
                             st.markdown(f"### 📅 {pos['shift_date']}")
                             st.markdown(f"**Position Details:**")
-                            st.text_area("", value=pos['position_details'], height=100, key=f"gas_view_{pos['id']}", disabled=True)
+                            details = full_text(pos, 'position_details', db.get_gas_position, f"gas_full_{pos['id']}", "Show full details")
+                            st.text_area("", value=details, height=100, key=f"gas_view_{pos['id']}_{len(details)}", disabled=True)
                             st.markdown(f"**Portfolio Status:** {pos['portfolio_status'] if pos['portfolio_status'] else 'N/A'}")
                             st.caption(f"Updated: {pos['updated_at']}")
                         
@@ -147,7 +162,8 @@ def show(db: DatabaseManager):
                             st.markdown("---")
                             with st.form(key=f"edit_gas_form_{pos['id']}"):
                                 edit_date = st.date_input("Shift Date *", value=date.fromisoformat(pos['shift_date']))
-                                edit_details = st.text_area("Position Details *", value=pos['position_details'], height=150)
+                                full_pos = db.get_gas_position(pos['id']) or pos
+                                edit_details = st.text_area("Position Details *", value=full_pos['position_details'], height=150)
                                 edit_status = st.text_input("Portfolio Status", value=pos['portfolio_status'] or "")
                                 
                                 col_submit, col_cancel = st.columns(2)
@@ -170,6 +186,8 @@ def show(db: DatabaseManager):
                                     st.rerun()
                         
                         st.markdown("---")
+                
+                gas_list.pager(gas_positions)
             else:
                 st.info("No gas positions recorded.")
         
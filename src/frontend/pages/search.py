@@ -0,0 +1,76 @@
+"""Search page - Full-text search across every section."""
+import streamlit as st
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.search import SearchHit
+
+SECTION_LABELS = {
+    'handover_logs': "📝 Handover Log",
+    'power_positions': "⚡ Power Position",
+    'gas_positions': "🔥 Gas Position",
+    'plant_status': "🏭 Plant Status",
+    'power_system_status': "⚡ Power System Status",
+    'notifications': "🔔 Notification",
+    'it_issues': "💻 IT Issue",
+    'competitor_activity': "📈 Market Activity",
+    'comments': "💬 Comment",
+}
+
+
+def highlight(hit: SearchHit) -> str:
+    """Render a hit's snippet as markdown with matched terms in bold."""
+    parts = []
+    position = 0
+    for start, end in hit.highlights:
+        parts.append(hit.snippet[position:start])
+        parts.append(f"**{hit.snippet[start:end]}**")
+        position = end
+    parts.append(hit.snippet[position:])
+    return ''.join(parts)
+
+
+def show(db: DatabaseManager, query: str):
+    """Display search results for the global search box.
+
+    Args:
+        db: Database manager instance
+        query: Text typed into the sidebar search box
+    """
+    st.markdown('<h1 class="main-header">🔍 Search</h1>', unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns([2, 1, 1])
+
+    with col1:
+        sections = st.multiselect(
+            "Sections",
+            options=list(SECTION_LABELS),
+            format_func=lambda table: SECTION_LABELS[table],
+            placeholder="All sections"
+        )
+
+    with col2:
+        date_from = st.date_input("From", value=None)
+
+    with col3:
+        date_to = st.date_input("To", value=None)
+
+    hits = db.search(
+        query,
+        tables=sections or None,
+        date_range=(date_from, date_to),
+        limit=50
+    )
+
+    st.markdown(f"**{len(hits)} result{'s' if len(hits) != 1 else ''} for** _{query}_")
+
+    if not hits:
+        st.info("No matches found. Try fewer or different words.")
+        return
+
+    for hit in hits:
+        with st.container():
+            heading = f"{SECTION_LABELS[hit.table]} · {hit.shift_date}"
+            if hit.title:
+                heading += f" · {hit.title}"
+            st.markdown(f"**{heading}**")
+            st.markdown(highlight(hit))
+            st.markdown("---")
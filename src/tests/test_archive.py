@@ -0,0 +1,180 @@
+"""Unit tests for hot/archive tiering."""
+import pytest
+import os
+import shutil
+import sqlite3
+import tempfile
+from datetime import date
+from src.backend.database.archive import Archiver
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.filters import ListFilter
+
+TODAY = date(2024, 6, 30)
+
+
+@pytest.fixture
+def db():
+    """Create a temporary database in its own directory."""
+    directory = tempfile.mkdtemp()
+    db_manager = DatabaseManager(os.path.join(directory, 'shifts.db'))
+
+    yield db_manager
+
+    db_manager.close()
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def archiver(db):
+    """Create an archiver with a 90 day horizon and small batches."""
+    return Archiver(db, horizon_days=90, retention_years=2, batch_size=2, pause=0)
+
+
+def add_logs(db, *shift_dates):
+    """Create one handover log per shift date."""
+    return [db.create_handover_log("Trader", shift_date, f"Notes {shift_date}") for shift_date in shift_dates]
+
+
+class TestArchiver:
+    """Tests for moving old shifts into archive files."""
+
+    def test_old_rows_move_to_year_files(self, db, archiver):
+        """Test that rows older than the horizon leave the hot table."""
+        add_logs(db, "2022-03-01", "2023-01-10", "2023-05-01", "2023-11-20", "2024-06-01")
+
+        moved = archiver.run(TODAY)
+
+        assert moved == {2022: 1, 2023: 3}
+        assert os.path.exists(archiver.archive_path(2022))
+        assert os.path.exists(archiver.archive_path(2023))
+        hot = db.get_all_handover_logs(as_frame=False)
+        assert [row.shift_date for row in hot] == ["2024-06-01"]
+
+    def test_history_includes_archived_rows(self, db, archiver):
+        """Test that the history view unions hot and archived rows."""
+        add_logs(db, "2022-03-01", "2023-05-01", "2024-06-01")
+        db.create_comment("Old comment", "2023-02-02")
+        archiver.run(TODAY)
+
+        history = db.get_history('handover_logs', as_frame=False)
+
+        assert [row.shift_date for row in history] == ["2024-06-01", "2023-05-01", "2022-03-01"]
+        assert history[1].notes == "Notes 2023-05-01"
+        comments = db.get_history('comments', as_frame=False)
+        assert [row.comment_text for row in comments] == ["Old comment"]
+        assert db.get_all_comments(as_frame=False) == []
+
+    def test_history_filters_by_date(self, db, archiver):
+        """Test that history filters apply to archived rows."""
+        add_logs(db, "2022-03-01", "2023-05-01", "2024-06-01")
+        archiver.run(TODAY)
+
+        history = db.get_history('handover_logs', ListFilter(date_from="2023-01-01", date_to="2023-12-31"))
+
+        assert list(history['shift_date']) == ["2023-05-01"]
+
+    def test_history_rejects_unknown_table(self, db):
+        """Test that only application tables have a history."""
+        with pytest.raises(ValueError):
+            db.get_history('archive_files')
+
+    def test_past_years_are_sealed(self, db, archiver):
+        """Test that only years ending before the cutoff are sealed."""
+        add_logs(db, "2023-05-01", "2024-01-15")
+        archiver.run(TODAY)
+
+        registry = archiver.registry()
+
+        assert registry[2023]['sealed'] == 1
+        assert registry[2023]['row_count'] == 1
+        assert registry[2024]['sealed'] == 0
+        assert registry[2024]['row_count'] == 1
+
+    def test_archives_are_attached_read_only(self, db, archiver):
+        """Test that readers attach every archive year without write access."""
+        add_logs(db, "2023-05-01", "2024-01-15")
+        archiver.run(TODAY)
+
+        with db.get_connection() as conn:
+            attached = {row['name'] for row in conn.execute("PRAGMA database_list")}
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM archive_2024.handover_logs")
+
+        assert {'archive_2023', 'archive_2024'} <= attached
+
+    def test_back_dated_rows_stay_out_of_sealed_years(self, db, archiver):
+        """Test that a sealed archive is never written again."""
+        add_logs(db, "2023-05-01")
+        archiver.run(TODAY)
+        add_logs(db, "2023-06-01")
+
+        moved = archiver.run(TODAY)
+
+        assert 2023 not in moved
+        assert [row.shift_date for row in db.get_all_handover_logs(as_frame=False)] == ["2023-06-01"]
+        assert len(db.get_history('handover_logs')) == 2
+
+    def test_run_is_repeatable(self, db, archiver):
+        """Test that a second run with nothing to move changes nothing."""
+        add_logs(db, "2024-02-01", "2024-02-02", "2024-02-03")
+        archiver.run(TODAY)
+
+        moved = archiver.run(TODAY)
+
+        assert moved == {}
+        assert archiver.registry()[2024]['row_count'] == 3
+        assert len(db.get_history('handover_logs')) == 3
+
+    def test_purge_removes_expired_years(self, db, archiver):
+        """Test that years past retention are unregistered and deleted."""
+        add_logs(db, "2020-05-01", "2023-05-01")
+        archiver.run(TODAY)
+        old_path = archiver.archive_path(2020)
+
+        purged = archiver.purge(TODAY)
+
+        assert purged == [2020]
+        assert not os.path.exists(old_path)
+        assert sorted(archiver.registry()) == [2023]
+        assert [row.shift_date for row in db.get_history('handover_logs', as_frame=False)] == ["2023-05-01"]
+
+    def test_archived_history_query_uses_index(self, db, archiver):
+        """Test that date-bounded history reads search each archive's index."""
+        add_logs(db, "2023-05-01", "2024-06-01")
+        archiver.run(TODAY)
+
+        with db.get_connection() as conn:
+            plan = [row[3] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM handover_logs_history WHERE shift_date >= ?",
+                ("2023-01-01",)
+            )]
+
+        assert not any(detail.startswith('SCAN') and 'USING' not in detail for detail in plan), plan
+
+    def test_other_process_archive_is_seen(self, db):
+        """Test that a pass run by another manager reaches this one's readers and cache."""
+        add_logs(db, "2023-05-01", "2024-06-01")
+        db.cache.check_interval = 0
+        assert len(db.get_history('handover_logs')) == 2
+        assert len(db.get_all_handover_logs()) == 2
+
+        other = DatabaseManager(db.db_path, cache_bytes=0)
+        try:
+            Archiver(other, horizon_days=90).run(TODAY)
+        finally:
+            other.close()
+
+        assert len(db.get_history('handover_logs')) == 2
+        assert list(db.get_all_handover_logs()['shift_date']) == ["2024-06-01"]
+
+    def test_archived_rows_stay_searchable(self, db, archiver):
+        """Test that archived rows keep their search entries until purged."""
+        db.create_notification("Outage", "Winter outage at plant A", "high", "2020-01-10")
+        db.create_notification("Outage", "Summer outage at plant B", "high", "2023-07-10")
+        archiver.run(TODAY)
+
+        assert sorted(hit.shift_date for hit in db.search("outage")) == ["2020-01-10", "2023-07-10"]
+
+        archiver.purge(TODAY)
+
+        assert [hit.shift_date for hit in db.search("outage")] == ["2023-07-10"]
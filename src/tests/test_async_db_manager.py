@@ -0,0 +1,89 @@
+"""Unit tests for AsyncDatabaseManager."""
+import pytest
+import asyncio
+import inspect
+import os
+import tempfile
+import threading
+from src.backend.database.async_db_manager import AsyncDatabaseManager, SYNC_ONLY_METHODS
+from src.backend.database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_path():
+    """Create a temporary database file path."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    
+    yield path
+    
+    os.unlink(path)
+
+
+@pytest.fixture
+def db(db_path):
+    """Create a temporary database for testing."""
+    db_manager = DatabaseManager(db_path)
+    
+    yield db_manager
+    
+    db_manager.close()
+
+
+class TestAsyncDatabaseManager:
+    """Tests for AsyncDatabaseManager."""
+    
+    def test_same_surface(self):
+        """Test that every public method has a coroutine counterpart."""
+        for name, method in inspect.getmembers(DatabaseManager, inspect.isfunction):
+            if name.startswith('_') or name in SYNC_ONLY_METHODS:
+                continue
+            assert inspect.iscoroutinefunction(getattr(AsyncDatabaseManager, name)), name
+            assert inspect.signature(getattr(AsyncDatabaseManager, name)) == inspect.signature(method)
+    
+    def test_read_and_write(self, db_path):
+        """Test creating and reading rows through coroutines."""
+        async def scenario():
+            async with AsyncDatabaseManager(db_path) as adb:
+                log_id = await adb.create_handover_log("John Doe", "2024-01-15", "Notes")
+                logs, count = await asyncio.gather(
+                    adb.get_all_handover_logs(),
+                    adb.get_critical_notifications_count()
+                )
+                return log_id, logs, count
+        
+        log_id, logs, count = asyncio.run(scenario())
+        
+        assert list(logs['id']) == [log_id]
+        assert count == 0
+    
+    def test_calls_run_concurrently(self, db, monkeypatch):
+        """Test that independent calls overlap instead of queueing."""
+        barrier = threading.Barrier(2, timeout=5)
+        monkeypatch.setattr(db, 'get_open_it_issues_count', lambda: (barrier.wait(), 1)[1])
+        monkeypatch.setattr(db, 'get_critical_notifications_count', lambda: (barrier.wait(), 2)[1])
+        
+        results = db.aio.run(db.aio.get_open_it_issues_count(), db.aio.get_critical_notifications_count())
+        
+        assert results == [1, 2]
+    
+    def test_shares_pool_and_cache(self, db):
+        """Test that the shared front end sees writes made synchronously."""
+        assert db.aio.run(db.aio.get_all_comments())[0].empty
+        
+        db.create_comment("Comment", "2024-01-15")
+        
+        assert len(db.aio.run(db.aio.get_all_comments())[0]) == 1
+        assert db.aio.db is db
+    
+    def test_errors_propagate(self, db):
+        """Test that exceptions from the worker thread reach the caller."""
+        with pytest.raises(ValueError):
+            db.aio.run(db.aio.search("outage", tables=['trades']))
+    
+    def test_close_keeps_shared_manager_open(self, db):
+        """Test that closing a shared front end leaves the manager usable."""
+        adb = AsyncDatabaseManager.from_manager(db)
+        adb.close()
+        
+        assert db.get_all_comments().empty
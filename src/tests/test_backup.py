@@ -0,0 +1,130 @@
+"""Unit tests for online backups."""
+import pytest
+import gzip
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from src.backend.database.backup import (
+    BackupError, BackupScheduler, list_backups, rotate_backups, run_backup, verify_backup
+)
+from src.backend.database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def workdir():
+    """Create a temporary directory for the database and its backups."""
+    directory = tempfile.mkdtemp()
+
+    yield directory
+
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def db(workdir):
+    """Create a database with some rows."""
+    db_manager = DatabaseManager(os.path.join(workdir, 'shifts.db'))
+    db_manager.create_comment_many([(f"Comment {n}", "2024-01-15") for n in range(500)])
+
+    yield db_manager
+
+    db_manager.close()
+
+
+def count_comments(path):
+    """Count the comments in a backup file."""
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM comments").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestBackup:
+    """Tests for taking, verifying and rotating backups."""
+
+    def test_backup_copies_database(self, db, workdir):
+        """Test that a backup holds every row and reports progress."""
+        backup_dir = os.path.join(workdir, 'backups')
+        steps = []
+
+        result = run_backup(db.db_path, backup_dir, step_pages=2, step_sleep=0,
+                            progress=lambda copied, total: steps.append((copied, total)))
+
+        assert count_comments(result.path) == 500
+        assert result.pages == steps[-1][1]
+        assert steps[-1][0] == steps[-1][1]
+        assert len(steps) > 1
+        assert list_backups(db.db_path, backup_dir) == [result.path]
+        assert not [name for name in os.listdir(backup_dir) if name.endswith('.partial')]
+
+    def test_compressed_backup(self, db, workdir):
+        """Test that a compressed backup unpacks to a valid database."""
+        result = run_backup(db.db_path, os.path.join(workdir, 'backups'), compress=True)
+        unpacked = os.path.join(workdir, 'unpacked.db')
+        with gzip.open(result.path, 'rb') as packed, open(unpacked, 'wb') as raw:
+            shutil.copyfileobj(packed, raw)
+
+        assert result.path.endswith('.db.gz')
+        verify_backup(unpacked)
+        assert count_comments(unpacked) == 500
+
+    def test_writes_continue_during_backup(self, db, workdir):
+        """Test that the app can write while a slow backup runs."""
+        written = []
+
+        def write(copied, total):
+            if not written:
+                written.append(db.create_comment("During backup", "2024-01-16"))
+
+        run_backup(db.db_path, os.path.join(workdir, 'backups'), step_pages=1, step_sleep=0, progress=write)
+
+        assert db.get_comment(written[0])['comment_text'] == "During backup"
+
+    def test_verify_rejects_corrupt_file(self, workdir):
+        """Test that a file that is not a valid database fails verification."""
+        path = os.path.join(workdir, 'corrupt.db')
+        with open(path, 'wb') as f:
+            f.write(b'SQLite format 3\x00' + b'\xff' * 4096)
+
+        with pytest.raises((BackupError, sqlite3.DatabaseError)):
+            verify_backup(path)
+
+    def test_rotation_keeps_newest(self, db, workdir):
+        """Test that only the newest backups are kept."""
+        backup_dir = os.path.join(workdir, 'backups')
+        os.makedirs(backup_dir)
+        old = [os.path.join(backup_dir, f"shifts-2024010{n}-000000.db") for n in range(1, 4)]
+        for path in old:
+            open(path, 'w').close()
+        open(os.path.join(backup_dir, 'notes.txt'), 'w').close()
+
+        result = run_backup(db.db_path, backup_dir, keep=2)
+
+        assert list_backups(db.db_path, backup_dir) == [old[2], result.path]
+        assert os.path.exists(os.path.join(backup_dir, 'notes.txt'))
+        with pytest.raises(ValueError):
+            rotate_backups(db.db_path, backup_dir, 0)
+
+    def test_scheduler_runs_in_background(self, db, workdir):
+        """Test that the scheduler takes backups on its own thread."""
+        backup_dir = os.path.join(workdir, 'backups')
+        done = threading.Event()
+        scheduler = BackupScheduler(db.db_path, backup_dir, interval=0.01, compress=False, keep=1)
+        original = scheduler.run_now
+
+        def run_once():
+            result = original()
+            done.set()
+            return result
+
+        scheduler.run_now = run_once
+        scheduler.start()
+        assert done.wait(5)
+        scheduler.stop()
+
+        assert scheduler.last_error is None
+        assert count_comments(scheduler.last_result.path) == 500
+        assert scheduler.progress[0] == scheduler.progress[1] > 0
@@ -0,0 +1,135 @@
+"""Unit tests for the synthetic data generator and the database benchmark."""
+import pytest
+import os
+import shutil
+import tempfile
+from collections import Counter
+from src.backend.database.db_manager import DatabaseManager
+from src.benchmarks import page_benchmark
+from src.benchmarks.db_benchmark import benchmark_methods, build_calls, compare, run_tier
+from src.benchmarks.page_benchmark import SEARCH_PAGE, check_budgets, load_budgets
+from src.benchmarks.synthetic import TABLE_SHARES, SyntheticData, history_days, populate, table_counts
+
+
+@pytest.fixture
+def workdir():
+    """Create a temporary directory for benchmark databases."""
+    directory = tempfile.mkdtemp()
+
+    yield directory
+
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def db(workdir):
+    """Create a database filled with 2000 synthetic rows."""
+    db_manager = DatabaseManager(os.path.join(workdir, 'synthetic.db'), cache_bytes=0)
+    populate(db_manager, 2000, seed=3)
+
+    yield db_manager
+
+    db_manager.close()
+
+
+class TestSyntheticData:
+    """Tests for the synthetic data generator."""
+
+    def test_rows_are_deterministic(self):
+        """Test that a seed always gives the same rows, independent of other tables."""
+        first = list(SyntheticData(seed=1).rows('notifications', 50))
+        second = list(SyntheticData(seed=1).rows('notifications', 50))
+        other = list(SyntheticData(seed=2).rows('notifications', 50))
+
+        assert first == second
+        assert first != other
+
+    def test_rows_follow_shift_cadence(self):
+        """Test that rows run oldest first through day and night shifts."""
+        rows = list(SyntheticData(days=10).rows('comments', 200))
+        created = [row[-1] for row in rows]
+        hours = Counter(int(stamp[11:13]) for stamp in created)
+
+        assert created == sorted(created)
+        assert rows[0][1] == "2024-12-22" and rows[-1][1] == "2024-12-31"
+        assert hours[6] and hours[18] and any(hour < 6 for hour in hours)
+
+    def test_populate_fills_every_table(self, db):
+        """Test that every table gets its share and the mixes are valid."""
+        counts = table_counts(2000)
+
+        assert set(counts) == set(TABLE_SHARES)
+        assert sum(counts.values()) == 2000
+        with db.get_connection() as conn:
+            for table, count in counts.items():
+                assert conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == count
+            priorities = dict(conn.execute("SELECT priority, COUNT(*) FROM notifications GROUP BY priority"))
+        assert priorities['low'] > priorities['critical'] > 0
+
+    def test_history_is_bounded(self):
+        """Test that large datasets pack more rows into each day instead of centuries."""
+        assert history_days(100) == 1
+        assert history_days(10_000_000) == 3650
+
+
+class TestDatabaseBenchmark:
+    """Tests for the DatabaseManager benchmark."""
+
+    def test_every_method_has_a_call(self, db):
+        """Test that each get_/create_/update_ method is benchmarked and runs."""
+        calls = build_calls(db, SyntheticData(seed=3, days=history_days(2000)), seed=3)
+
+        assert sorted(calls) == benchmark_methods()
+        for name, call in calls.items():
+            call.run()
+
+    def test_run_tier(self, workdir):
+        """Test that a tier reports timings, rows and sizes per method."""
+        result = run_tier(500, workdir, repeat=2, methods=['get_all_comments', 'create_comment'])
+
+        assert sum(result['rows'].values()) == 500
+        assert set(result['methods']) == {'get_all_comments', 'create_comment'}
+        stats = result['methods']['get_all_comments']
+        assert stats['min_ms'] <= stats['median_ms'] <= stats['max_ms']
+        assert stats['rows'] > 0 and stats['bytes'] > 0
+
+    def test_compare_orders_by_slowdown(self):
+        """Test that a comparison lists the largest slowdown first."""
+        def run(get_ms, create_ms):
+            return {'tiers': {'1000': {'methods': {
+                'get_comment': {'median_ms': get_ms}, 'create_comment': {'median_ms': create_ms},
+            }}}}
+
+        lines = compare(run(1.0, 2.0), run(0.5, 3.0))
+
+        assert lines[0].split()[2] == 'create_comment' and lines[0].endswith("(+50%)")
+        assert lines[1].endswith("(-50%)")
+
+
+class TestPageBenchmark:
+    """Tests for the page-render benchmark."""
+
+    def test_run_tier_renders_pages(self, workdir):
+        """Test that pages render against a seeded database and are measured."""
+        result = page_benchmark.run_tier(300, workdir, pages=["📊 Dashboard", SEARCH_PAGE], reruns=1)
+
+        assert set(result['pages']) == {"📊 Dashboard", SEARCH_PAGE}
+        for stats in result['pages'].values():
+            assert stats['exceptions'] == []
+            assert stats['elements'] > 0
+            assert stats['rerun_ms'] > 0 and stats['peak_mb'] > 0
+
+    def test_budgets(self):
+        """Test that page budgets override the defaults and report every excess."""
+        budgets = {'default': {'rerun_ms': 100, 'elements': 50}, 'pages': {'Dashboard': {'elements': 10}}}
+        results = {'tiers': {'1000': {'pages': {
+            'Dashboard': {'rerun_ms': 20, 'elements': 30, 'exceptions': []},
+            'Comments': {'rerun_ms': 150, 'elements': 30, 'exceptions': ['boom']},
+        }}}}
+
+        violations = check_budgets(results, budgets)
+
+        assert len(violations) == 3
+        assert any('Dashboard: elements' in line for line in violations)
+        assert any('Comments: rerun_ms' in line for line in violations)
+        assert 'default' in load_budgets()
@@ -0,0 +1,140 @@
+"""Unit tests for the SQLite connection pool."""
+import pytest
+import os
+import tempfile
+import threading
+from src.backend.database.connection_pool import ConnectionPool, PoolTimeoutError
+from src.backend.database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_path():
+    """Create a temporary database file path."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    yield path
+
+    os.unlink(path)
+
+
+@pytest.fixture
+def pool(db_path):
+    """Create a small connection pool."""
+    pool = ConnectionPool(db_path, max_readers=2, timeout=0.2)
+
+    yield pool
+
+    pool.close()
+
+
+class TestConnectionPool:
+    """Tests for pooled connection checkout."""
+
+    def test_reader_connections_are_reused(self, pool):
+        """Test that a returned reader is handed out again."""
+        with pool.reader() as first:
+            pass
+        with pool.reader() as second:
+            pass
+
+        assert first is second
+        assert pool.stats()['opened'] == 1
+
+    def test_reader_lane_is_bounded(self, pool):
+        """Test that checkout times out once every reader is in use."""
+        with pool.reader(), pool.reader():
+            with pytest.raises(PoolTimeoutError):
+                with pool.reader():
+                    pass
+
+        assert pool.stats()['timeouts'] == 1
+
+    def test_writer_is_exclusive(self, pool):
+        """Test that a second thread cannot check out the busy writer."""
+        errors = []
+
+        def try_write():
+            try:
+                with pool.writer():
+                    pass
+            except PoolTimeoutError as exc:
+                errors.append(exc)
+
+        with pool.writer():
+            thread = threading.Thread(target=try_write)
+            thread.start()
+            thread.join()
+
+        assert len(errors) == 1
+
+    def test_uncommitted_writes_are_rolled_back(self, pool):
+        """Test that a writer is returned to the pool without an open transaction."""
+        with pool.writer() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.commit()
+            conn.execute("INSERT INTO t VALUES (1)")
+
+        with pool.reader() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_unhealthy_connection_is_replaced(self, db_path):
+        """Test that a broken idle connection is discarded on checkout."""
+        pool = ConnectionPool(db_path, max_readers=1, health_check_interval=0)
+        with pool.reader() as conn:
+            pass
+        conn.close()
+
+        with pool.reader() as replacement:
+            assert replacement is not conn
+            assert replacement.execute("SELECT 1").fetchone()[0] == 1
+
+        assert pool.stats()['health_check_failures'] == 1
+        pool.close()
+
+    def test_recycle_replaces_connections(self, db_path):
+        """Test that recycled connections are reopened and re-initialized."""
+        opened = []
+        pool = ConnectionPool(db_path, max_readers=1, reader_initializer=opened.append)
+        with pool.reader() as reader:
+            with pool.writer() as writer:
+                pass
+            pool.recycle()
+        assert opened == [reader]
+
+        with pool.reader() as new_reader, pool.writer() as new_writer:
+            assert new_reader is not reader
+            assert new_writer is not writer
+        assert opened == [reader, new_reader]
+        pool.close()
+
+    def test_closed_pool_rejects_checkout(self, pool):
+        """Test that a closed pool cannot be used."""
+        pool.close()
+
+        with pytest.raises(RuntimeError):
+            with pool.reader():
+                pass
+
+
+class TestDatabaseManagerPooling:
+    """Tests for DatabaseManager use of the pool."""
+
+    def test_concurrent_sessions_share_pool(self, db_path):
+        """Test that many threads reuse a bounded set of connections."""
+        db = DatabaseManager(db_path, pool_size=2)
+        db.create_comment("Shared", "2024-01-15")
+
+        def read():
+            for _ in range(10):
+                assert len(db.get_all_comments()) == 1
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # One writer plus at most two readers
+        assert db.pool.stats()['opened'] <= 3
+        db.close()
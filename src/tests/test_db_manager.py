@@ -1,9 +1,15 @@
 """Unit tests for database manager."""
 import pytest
 import os
+import sqlite3
+import subprocess
+import sys
 import tempfile
-from datetime import date
+from datetime import date, datetime
 from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.filters import ListFilter
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 @pytest.fixture
@@ -19,6 +25,7 @@ def db():
     yield db_manager
     
     # Cleanup
+    db_manager.close()
     os.unlink(path)
 
 
@@ -221,3 +228,410 @@ class TestComments:
         
         comments = db.get_all_comments()
         assert len(comments) == 0
+
+
+class TestPragmaProfiles:
+    """Tests for PRAGMA performance profiles."""
+    
+    def test_default_profile_settings(self, db):
+        """Test that the balanced profile is in effect by default."""
+        settings = db.get_pragma_settings()
+        assert settings['journal_mode'] == 'WAL'
+        assert settings['synchronous'] == 'NORMAL'
+        assert settings['temp_store'] == 'MEMORY'
+        assert settings['busy_timeout'] == 5000
+        assert db.pragma_settings == settings
+    
+    def test_durable_profile(self):
+        """Test that the durable profile uses full fsync."""
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        db_manager = DatabaseManager(path, profile='durable')
+        
+        settings = db_manager.get_pragma_settings()
+        assert settings['synchronous'] == 'FULL'
+        assert settings['mmap_size'] == 0
+        
+        db_manager.close()
+        os.unlink(path)
+    
+    def test_unknown_profile(self):
+        """Test that an unknown profile name is rejected."""
+        with pytest.raises(ValueError):
+            DatabaseManager("unused.db", profile='turbo')
+
+
+class TestBulkWrites:
+    """Tests for bulk create, update and delete operations."""
+    
+    def test_create_many_returns_ids_in_order(self, db):
+        """Test that bulk create returns one id per row across chunks."""
+        rows = [(f"Trader {i}", "2024-01-15", f"Notes {i}") for i in range(7)]
+        ids = db.create_handover_log_many(rows, chunk_size=3)
+        
+        assert len(ids) == 7
+        logs = db.get_all_handover_logs().set_index('id')
+        assert [logs.loc[log_id, 'trader_name'] for log_id in ids] == [row[0] for row in rows]
+    
+    def test_create_many_accepts_dicts(self, db):
+        """Test that bulk create accepts rows keyed by column name."""
+        ids = db.create_comment_many([
+            {'comment_text': "First", 'shift_date': "2024-01-15"},
+            {'comment_text': "Second", 'shift_date': "2024-01-16"},
+        ])
+        
+        assert len(ids) == 2
+        assert len(db.get_all_comments()) == 2
+    
+    def test_create_many_is_atomic(self, db):
+        """Test that a constraint failure rolls back the whole batch."""
+        rows = [
+            ("Plant A", "operational", "", "2024-01-15"),
+            ("Plant B", "exploded", "", "2024-01-15"),
+        ]
+        
+        with pytest.raises(sqlite3.IntegrityError):
+            db.create_plant_status_many(rows, chunk_size=1)
+        
+        assert len(db.get_all_plant_status()) == 0
+    
+    def test_update_many(self, db):
+        """Test updating several notifications at once."""
+        ids = db.create_notification_many([
+            ("Alert 1", "Message", "high", "2024-01-15"),
+            ("Alert 2", "Message", "low", "2024-01-15"),
+        ])
+        
+        updated = db.update_notification_many([
+            (ids[0], "Alert 1", "Message", "critical", "2024-01-15", True),
+            {'id': ids[1], 'title': "Alert 2", 'message': "Message", 'priority': "low",
+             'shift_date': "2024-01-15", 'is_resolved': True},
+        ])
+        
+        assert updated == 2
+        assert len(db.get_unresolved_notifications()) == 0
+    
+    def test_update_many_partial_dicts(self, db):
+        """Test that dict rows only change the columns they have."""
+        ids = db.create_handover_log_many([("Trader", "2024-01-15", "Notes 1"), ("Trader", "2024-01-15", "Notes 2")])
+        
+        updated = db.update_handover_log_many([
+            {'id': ids[0], 'trader_name': "Updated", 'shift_date': "2024-01-16"},
+            {'id': ids[1], 'notes': "New notes"},
+        ])
+        
+        assert updated == 2
+        first, second = db.get_handover_log(ids[0]), db.get_handover_log(ids[1])
+        assert (first['trader_name'], first['shift_date'], first['notes']) == ("Updated", "2024-01-16", "Notes 1")
+        # Leaving out NOT NULL columns keeps them instead of writing NULL
+        assert (second['trader_name'], second['notes']) == ("Trader", "New notes")
+    
+    def test_update_many_rejects_bad_dicts(self, db):
+        """Test that dict rows with unknown or no columns are rejected."""
+        log_id = db.create_handover_log("Trader", "2024-01-15", "Notes")
+        
+        with pytest.raises(ValueError):
+            db.update_handover_log_many([{'id': log_id, 'note': "Typo"}])
+        with pytest.raises(ValueError):
+            db.update_handover_log_many([{'id': log_id}])
+        assert db.get_handover_log(log_id)['notes'] == "Notes"
+    
+    def test_delete_many(self, db):
+        """Test deleting several IT issues at once."""
+        ids = db.create_it_issue_many([
+            ("Issue 1", "Description", "open", "2024-01-15"),
+            ("Issue 2", "Description", "open", "2024-01-15"),
+            ("Issue 3", "Description", "open", "2024-01-15"),
+        ])
+        
+        assert db.delete_it_issue_many(ids[:2]) == 2
+        assert db.get_open_it_issues_count() == 1
+    
+    def test_wrong_row_length(self, db):
+        """Test that a row with the wrong number of values is rejected."""
+        with pytest.raises(ValueError):
+            db.create_power_position_many([("2024-01-15", "Long 100MW")])
+
+
+class TestListFilters:
+    """Tests for SQL-side list filters."""
+    
+    def test_text_filter_is_case_insensitive(self, db):
+        """Test searching trader names and notes."""
+        db.create_handover_log("John Doe", "2024-01-15", "Gas outage at terminal")
+        db.create_handover_log("Jane Smith", "2024-01-16", "Quiet shift")
+        
+        assert len(db.get_all_handover_logs(ListFilter(text="OUTAGE"))) == 1
+        assert len(db.get_all_handover_logs(ListFilter(text="jane"))) == 1
+        assert len(db.get_all_handover_logs(ListFilter(text="nothing"))) == 0
+    
+    def test_text_filter_matches_wildcards_literally(self, db):
+        """Test that % and _ in the search text are not wildcards."""
+        db.create_comment("Load at 50% capacity", "2024-01-15")
+        db.create_comment("Load at 500 MW", "2024-01-15")
+        
+        assert len(db.get_all_comments(ListFilter(text="50%"))) == 1
+        assert len(db.get_all_comments(ListFilter(text="_"))) == 0
+    
+    def test_date_range_filter(self, db):
+        """Test filtering by shift date range."""
+        for day in range(10, 20):
+            db.create_competitor_activity("Competitor", "Activity", f"2024-01-{day}")
+        
+        activities = db.get_all_competitor_activity(ListFilter(date_from="2024-01-12", date_to="2024-01-14"))
+        assert sorted(activities['shift_date']) == ["2024-01-12", "2024-01-13", "2024-01-14"]
+    
+    def test_notification_filters(self, db):
+        """Test priority and resolved filters on notifications."""
+        db.create_notification("Critical", "Message", "critical", "2024-01-15")
+        db.create_notification("Low", "Message", "low", "2024-01-15")
+        resolved_id = db.create_notification("High", "Message", "high", "2024-01-15")
+        db.resolve_notification(resolved_id)
+        
+        unresolved = db.get_all_notifications(ListFilter(resolved=False))
+        assert sorted(unresolved['title']) == ["Critical", "Low"]
+        
+        urgent = db.get_all_notifications(ListFilter(priorities=('critical', 'high')))
+        assert sorted(urgent['title']) == ["Critical", "High"]
+        
+        assert db.get_all_notifications(ListFilter(priorities=())).empty
+    
+    def test_status_filter(self, db):
+        """Test filtering IT issues by status."""
+        db.create_it_issue("Issue 1", "Description", "open", "2024-01-15")
+        db.create_it_issue("Issue 2", "Description", "resolved", "2024-01-15")
+        
+        issues = db.get_all_it_issues(ListFilter(statuses=('open', 'in_progress')))
+        assert list(issues['title']) == ["Issue 1"]
+    
+    def test_unsupported_filter(self, db):
+        """Test that a filter field the table lacks is rejected."""
+        with pytest.raises(ValueError):
+            db.get_all_comments(ListFilter(priorities=('high',)))
+    
+    def test_filtered_page_total(self, db):
+        """Test that page totals count only matching rows."""
+        db.create_comment_many([("Outage", "2024-01-15"), ("Normal", "2024-01-15"), ("outage again", "2024-01-16")])
+        
+        page = db.get_comments_page(limit=1, with_total=True, filters=ListFilter(text="outage"))
+        assert page.total == 2
+        assert len(page.rows) == 1
+        assert page.next_cursor is not None
+
+
+class TestDashboardSnapshot:
+    """Tests for the dashboard snapshot read."""
+    
+    def test_empty_database(self, db):
+        """Test the snapshot of an empty database."""
+        snapshot = db.get_dashboard_snapshot()
+        
+        assert snapshot.critical_count == 0
+        assert snapshot.recent_handover_logs == ()
+        assert not snapshot.has_unresolved_notifications
+        assert not snapshot.has_it_issues
+        assert snapshot.latest_power_position is None
+        assert snapshot.positions_count == 0
+    
+    def test_snapshot_contents(self, db):
+        """Test that the snapshot matches the individual queries."""
+        db.create_handover_log_many([("Trader", f"2024-01-{day:02d}", f"Notes {day}") for day in range(1, 13)])
+        db.create_notification("Old", "Message", "critical", "2024-01-10")
+        db.create_notification("New", "Message", "critical", "2024-01-12")
+        db.create_notification("Low", "Message", "low", "2024-01-13")
+        db.create_it_issue("Open", "Description", "open", "2024-01-10")
+        db.create_it_issue("Progress", "Description", "in_progress", "2024-01-11")
+        db.create_it_issue("Done", "Description", "resolved", "2024-01-12")
+        db.create_power_position("2024-01-15", "Long 50MW", "Balanced")
+        
+        snapshot = db.get_dashboard_snapshot()
+        
+        assert snapshot.critical_count == db.get_critical_notifications_count() == 2
+        assert snapshot.open_it_issues_count == db.get_open_it_issues_count() == 2
+        assert snapshot.recent_handover_count == 10
+        assert [log['shift_date'] for log in snapshot.recent_handover_logs] == [
+            "2024-01-12", "2024-01-11", "2024-01-10", "2024-01-09", "2024-01-08"
+        ]
+        assert [n['title'] for n in snapshot.critical_notifications] == ["New", "Old"]
+        assert [i['title'] for i in snapshot.open_it_issues] == ["Progress", "Open"]
+        assert snapshot.latest_power_position['position_details'] == "Long 50MW"
+        assert snapshot.latest_gas_position is None
+        assert snapshot.positions_count == 1
+    
+    def test_snapshot_is_immutable(self, db):
+        """Test that snapshot rows cannot be modified."""
+        db.create_handover_log("Trader", "2024-01-15", "Notes")
+        snapshot = db.get_dashboard_snapshot()
+        
+        with pytest.raises(TypeError):
+            snapshot.recent_handover_logs[0]['notes'] = "Changed"
+        with pytest.raises(AttributeError):
+            snapshot.critical_count = 5
+
+
+class TestColumnProjection:
+    """Tests for column projection and preview reads."""
+    
+    def test_columns(self, db):
+        """Test returning only the requested columns plus the id."""
+        db.create_handover_log("John Doe", "2024-01-15", "Notes")
+        
+        logs = db.get_all_handover_logs(columns=('trader_name', 'shift_date'))
+        
+        assert list(logs.columns) == ['trader_name', 'shift_date', 'id']
+    
+    def test_unknown_column(self, db):
+        """Test that unknown column names are rejected."""
+        with pytest.raises(ValueError):
+            db.get_all_comments(columns=('comment_text; DROP TABLE comments',))
+    
+    def test_preview(self, db):
+        """Test that long text is cut in SQL and its full length reported."""
+        log_id = db.create_handover_log("John Doe", "2024-01-15", "x" * 500)
+        db.create_handover_log("Jane Doe", "2024-01-14", None)
+        
+        logs = db.get_all_handover_logs(preview=100)
+        
+        assert len(logs.iloc[0]['notes']) == 100
+        assert logs.iloc[0]['notes_length'] == 500
+        assert logs.iloc[1]['notes'] is None
+        assert db.get_handover_log(log_id)['notes'] == "x" * 500
+    
+    def test_preview_page(self, db):
+        """Test that projected pages still produce working cursors."""
+        db.create_comment_many([(f"Comment {i} " + "y" * 50, "2024-01-15") for i in range(3)])
+        
+        page = db.get_comments_page(limit=2, columns=('comment_text',), preview=10)
+        following = db.get_comments_page(limit=2, cursor=page.next_cursor, columns=('comment_text',), preview=10)
+        
+        assert set(page.rows.columns) == {'comment_text', 'comment_text_length', 'id', 'shift_date', 'created_at'}
+        assert (page.rows['comment_text'].str.len() == 10).all()
+        assert len(following.rows) == 1
+    
+    def test_get_by_id(self, db):
+        """Test loading a single full row by id."""
+        issue_id = db.create_it_issue("Issue", "Description", "open", "2024-01-15")
+        
+        assert db.get_it_issue(issue_id)['description'] == "Description"
+        assert db.get_it_issue(issue_id + 1) is None
+    
+    def test_dashboard_preview(self, db):
+        """Test that the dashboard snapshot carries previews."""
+        db.create_notification("Alert", "m" * 300, "critical", "2024-01-15")
+        
+        notif = db.get_dashboard_snapshot(preview=80).critical_notifications[0]
+        
+        assert len(notif['message']) == 80
+        assert notif['message_length'] == 300
+
+
+class TestRowResults:
+    """Tests for list reads returning row tuples instead of DataFrames."""
+    
+    def test_rows_match_frame(self, db):
+        """Test that row tuples carry the same data as the DataFrame."""
+        db.create_notification("Alert", "Message", "high", "2024-01-15")
+        db.create_notification("Other", "Message", "low", "2024-01-14")
+        
+        rows = db.get_all_notifications(as_frame=False)
+        frame = db.get_all_notifications()
+        
+        assert isinstance(rows, list)
+        assert [tuple(row) for row in rows] == list(frame.itertuples(index=False, name=None))
+    
+    def test_row_access(self, db):
+        """Test attribute, name and index access on a row."""
+        db.create_comment("Comment", "2024-01-15")
+        
+        row = db.get_all_comments(columns=('comment_text',), as_frame=False)[0]
+        
+        assert row.comment_text == row['comment_text'] == row[0] == "Comment"
+        assert dict(row) == {'comment_text': "Comment", 'id': row.id}
+        assert row.get('missing') is None
+        with pytest.raises(KeyError):
+            row['missing']
+        with pytest.raises(AttributeError):
+            row.comment_text = "Changed"
+    
+    def test_rows_use_slots(self, db):
+        """Test that rows carry no per-instance dict."""
+        db.create_comment("Comment", "2024-01-15")
+        
+        row = db.get_all_comments(as_frame=False)[0]
+        
+        assert not hasattr(row, '__dict__')
+    
+    def test_import_does_not_load_pandas(self):
+        """Test that importing the manager leaves pandas unloaded."""
+        code = (
+            "import sys; import src.backend.database.db_manager; "
+            "import src.backend.database.async_db_manager; "
+            "sys.exit('pandas' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT_DIR)
+        
+        assert result.returncode == 0
+
+
+class TestChangeCapture:
+    """Tests for the change log and incremental reads."""
+    
+    def test_changes_are_logged_in_order(self, db):
+        """Test that inserts, updates and deletes are logged by triggers."""
+        start = db.get_latest_change_seq()
+        log_id = db.create_handover_log("Trader", "2024-01-15", "Notes")
+        db.update_handover_log(log_id, "Trader", "2024-01-15", "Edited")
+        comment_ids = db.create_comment_many([("One", "2024-01-15"), ("Two", "2024-01-15")])
+        db.delete_handover_log(log_id)
+        
+        changes = db.get_changes_since(start)
+        
+        assert [(c.table, c.row_id, c.operation) for c in changes] == [
+            ('handover_logs', log_id, 'insert'),
+            ('handover_logs', log_id, 'update'),
+            ('comments', comment_ids[0], 'insert'),
+            ('comments', comment_ids[1], 'insert'),
+            ('handover_logs', log_id, 'delete'),
+        ]
+        assert [c.seq for c in changes] == sorted(c.seq for c in changes)
+        assert db.get_latest_change_seq() == changes[-1].seq
+    
+    def test_changes_since_skips_seen_changes(self, db):
+        """Test that only changes after the given seq are returned."""
+        db.create_comment("Seen", "2024-01-15")
+        seq = db.get_latest_change_seq()
+        notif_id = db.create_notification("Alert", "Message", "high", "2024-01-15")
+        db.resolve_notification(notif_id)
+        
+        changes = db.get_changes_since(seq)
+        
+        assert [(c.table, c.operation) for c in changes] == [
+            ('notifications', 'insert'), ('notifications', 'update')
+        ]
+        assert db.get_changes_since(changes[-1].seq) == []
+    
+    def test_changes_since_filters_and_limits(self, db):
+        """Test table filters and paging through the log with limit."""
+        db.create_comment("Comment", "2024-01-15")
+        db.create_it_issue_many([("Issue", "Description", "open", "2024-01-15")] * 3)
+        
+        first = db.get_changes_since(0, tables=('it_issues',), limit=2)
+        rest = db.get_changes_since(first[-1].seq, tables=('it_issues',), limit=2)
+        
+        assert len(first) == 2 and len(rest) == 1
+        assert all(c.table == 'it_issues' for c in first + rest)
+        with pytest.raises(ValueError):
+            db.get_changes_since(0, tables=('change_log',))
+    
+    def test_updated_since(self, db):
+        """Test that updated_since returns rows changed at or after a timestamp."""
+        old_id = db.create_plant_status("Plant A", "operational", "", "2024-01-15")
+        new_id = db.create_plant_status("Plant B", "offline", "", "2024-01-15")
+        with db.get_connection(write=True) as conn:
+            conn.execute("UPDATE plant_status SET updated_at = '2024-01-01 00:00:00' WHERE id = ?", (old_id,))
+            conn.commit()
+        
+        rows = db.get_plant_status_updated_since("2024-06-01 00:00:00", columns=('plant_name',), as_frame=False)
+        
+        assert [(row.id, row.plant_name) for row in rows] == [(new_id, "Plant B")]
+        assert len(db.get_plant_status_updated_since(datetime(2023, 12, 31))) == 2
@@ -0,0 +1,126 @@
+"""Unit tests for grid edit diffs and their transactional writes."""
+import pytest
+import os
+import tempfile
+import numpy as np
+from src.backend.database.db_manager import UPDATE_COLUMNS, DatabaseManager
+from src.backend.database.edits import ChangeSet, EditConflict, diff_rows, plain_value
+
+COLUMNS = UPDATE_COLUMNS['notifications']
+
+
+@pytest.fixture
+def db():
+    """Create a temporary database with three notifications."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    db_manager = DatabaseManager(path)
+    db_manager.create_notification_many(
+        (f"Alert {i}", f"Message {i}", "low", "2024-01-15") for i in range(3)
+    )
+
+    yield db_manager
+
+    db_manager.close()
+    os.unlink(path)
+
+
+def read_rows(db):
+    """Read the notifications as a grid would, oldest first."""
+    return sorted(db.get_all_notifications().to_dict('records'), key=lambda row: row['id'])
+
+
+class TestDiffRows:
+    """Tests for diff_rows."""
+
+    def test_minimal_diff(self, db):
+        """Test that only changed columns, new rows and removed ids are reported."""
+        original = read_rows(db)
+        edited = [dict(row) for row in original[1:]]
+        edited[0]['is_resolved'] = True
+        edited.append({'id': None, 'title': "New", 'message': "Body", 'priority': "high",
+                       'shift_date': "2024-01-16", 'is_resolved': False})
+
+        changes = diff_rows(original, edited, COLUMNS)
+
+        assert changes.updated == [{'id': original[1]['id'], 'is_resolved': 1}]
+        assert changes.deleted == [original[0]['id']]
+        assert changes.inserted == [{'title': "New", 'message': "Body", 'priority': "high",
+                                     'shift_date': "2024-01-16", 'is_resolved': 0}]
+
+    def test_unchanged_grid(self, db):
+        """Test that grid cell types that only look different are not changes."""
+        original = read_rows(db)
+        edited = [dict(row, id=np.int64(row['id']), is_resolved=bool(row['is_resolved']),
+                       title=f" {row['title']} ") for row in original]
+        edited.append({'id': float('nan'), 'title': None, 'message': "  "})
+
+        changes = diff_rows(original, edited, COLUMNS)
+
+        assert not changes
+        assert plain_value(np.float64('nan')) is None
+
+    def test_unknown_row(self, db):
+        """Test that an edited id that was never read is rejected."""
+        with pytest.raises(ValueError):
+            diff_rows(read_rows(db), [{'id': 999, 'title': "Ghost"}], COLUMNS)
+
+
+class TestApplyChanges:
+    """Tests for DatabaseManager.apply_changes."""
+
+    def test_applies_all_changes(self, db):
+        """Test that inserts, updates and deletes are written together."""
+        seq = db.get_latest_change_seq()
+        first, second, _ = read_rows(db)
+        changes = ChangeSet(
+            [{'title': "New", 'message': "Body", 'priority': "high", 'shift_date': "2024-01-16",
+              'is_resolved': None}],
+            [{'id': second['id'], 'is_resolved': 1, 'title': "Fixed"}],
+            [first['id']],
+        )
+
+        result = db.apply_changes('notifications', changes, seq)
+
+        assert result.updated == 1 and result.deleted == 1
+        rows = {row['id']: row for row in read_rows(db)}
+        assert first['id'] not in rows
+        assert rows[second['id']]['title'] == "Fixed" and rows[second['id']]['is_resolved'] == 1
+        assert rows[second['id']]['message'] == second['message']
+        # A missing value falls back to the column default
+        assert rows[result.inserted_ids[0]]['is_resolved'] == 0
+
+    def test_conflict_refuses_whole_edit(self, db):
+        """Test that a row changed after the read blocks every change of the edit."""
+        seq = db.get_latest_change_seq()
+        first, second, third = read_rows(db)
+        db.resolve_notification(second['id'])
+        changes = ChangeSet(
+            [{'title': "New", 'message': "Body", 'priority': "low", 'shift_date': "2024-01-16"}],
+            [{'id': second['id'], 'title': "Mine"}],
+            [third['id']],
+        )
+
+        with pytest.raises(EditConflict) as raised:
+            db.apply_changes('notifications', changes, seq)
+
+        assert raised.value.row_ids == [second['id']]
+        rows = read_rows(db)
+        assert [row['id'] for row in rows] == [first['id'], second['id'], third['id']]
+        assert rows[1]['title'] == second['title']
+
+    def test_conflict_on_deleted_row(self, db):
+        """Test that updating a row someone else deleted is a conflict."""
+        seq = db.get_latest_change_seq()
+        row = read_rows(db)[0]
+        db.delete_notification(row['id'])
+
+        with pytest.raises(EditConflict):
+            db.apply_changes('notifications', ChangeSet([], [{'id': row['id'], 'title': "Mine"}], []), seq)
+
+    def test_invalid_changes(self, db):
+        """Test that unknown tables and columns are rejected."""
+        with pytest.raises(ValueError):
+            db.apply_changes('users', ChangeSet([], [], []), 0)
+        with pytest.raises(ValueError):
+            db.apply_changes('comments', ChangeSet([{'comment_text': "x", 'owner': "me"}], [], []), 0)
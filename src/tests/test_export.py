@@ -0,0 +1,111 @@
+"""Unit tests for streaming exports."""
+import pytest
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from datetime import date
+from src.backend.database.archive import Archiver
+from src.backend.database.db_manager import READ_COLUMNS, DatabaseManager
+from src.backend.database.export import export_tables, export_zip, iter_chunks, write_table
+
+
+@pytest.fixture
+def workdir():
+    """Create a temporary directory for the database and exports."""
+    directory = tempfile.mkdtemp()
+
+    yield directory
+
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def db(workdir):
+    """Create a database with handover logs over several days."""
+    db_manager = DatabaseManager(os.path.join(workdir, 'shifts.db'))
+    db_manager.create_handover_log_many([
+        ("Trader", f"2024-01-{day:02d}", f"Notes, \"day\" {day}\nsecond line") for day in range(1, 6)
+    ])
+    db_manager.create_comment("Comment", "2024-01-03")
+
+    yield db_manager
+
+    db_manager.close()
+
+
+class TestExport:
+    """Tests for CSV/JSONL export."""
+
+    def test_chunks_are_bounded(self, db):
+        """Test that rows are read in chunks of at most chunk_size."""
+        chunks = list(iter_chunks(db, 'handover_logs', chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert [row[2] for chunk in chunks for row in chunk] == [f"2024-01-0{day}" for day in range(1, 6)]
+
+    def test_csv_round_trips(self, db):
+        """Test that CSV output has a header and quotes embedded text."""
+        out = io.StringIO()
+
+        count = write_table(db, 'handover_logs', out, 'csv', chunk_size=2)
+
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        assert count == 5
+        assert tuple(rows[0]) == READ_COLUMNS['handover_logs']
+        assert rows[0]['notes'] == "Notes, \"day\" 1\nsecond line"
+
+    def test_jsonl_date_range(self, db):
+        """Test JSONL output limited to a shift_date range."""
+        out = io.StringIO()
+
+        count = write_table(db, 'handover_logs', out, 'jsonl', date_from="2024-01-02", date_to="2024-01-03")
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert count == 2
+        assert [record['shift_date'] for record in records] == ["2024-01-02", "2024-01-03"]
+
+    def test_empty_csv_has_header(self, db):
+        """Test that an empty export still names its columns."""
+        out = io.StringIO()
+
+        assert write_table(db, 'it_issues', out, 'csv') == 0
+        assert out.getvalue().strip() == ','.join(READ_COLUMNS['it_issues'])
+
+    def test_rejects_unknown_table_and_format(self, db):
+        """Test that only application tables and known formats are exported."""
+        with pytest.raises(ValueError):
+            write_table(db, 'change_log', io.StringIO())
+        with pytest.raises(ValueError):
+            write_table(db, 'comments', io.StringIO(), 'xml')
+
+    def test_parallel_export_matches_serial(self, db, workdir):
+        """Test that exporting tables concurrently writes the same files."""
+        serial = export_tables(db, os.path.join(workdir, 'serial'), fmt='jsonl')
+        parallel = export_tables(db, os.path.join(workdir, 'parallel'), fmt='jsonl', parallel=True)
+
+        assert [(r.table, r.rows) for r in serial] == [(r.table, r.rows) for r in parallel]
+        for first, second in zip(serial, parallel):
+            with open(first.path) as a, open(second.path) as b:
+                assert a.read() == b.read()
+
+    def test_zip_export(self, db):
+        """Test that a zip export holds one file per table."""
+        out = io.BytesIO()
+
+        counts = export_zip(db, out, ['handover_logs', 'comments'], 'csv')
+
+        with zipfile.ZipFile(out) as archive:
+            assert archive.namelist() == ['handover_logs.csv', 'comments.csv']
+            assert archive.read('comments.csv').decode().count('\n') == 2
+        assert counts == {'handover_logs': 5, 'comments': 1}
+
+    def test_include_archive(self, db):
+        """Test that archived rows are exported on request."""
+        Archiver(db, horizon_days=30, pause=0).run(date(2024, 2, 3))
+
+        assert write_table(db, 'handover_logs', io.StringIO(), 'jsonl') == 2
+        assert write_table(db, 'handover_logs', io.StringIO(), 'jsonl', include_archive=True) == 5
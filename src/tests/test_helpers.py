@@ -5,6 +5,7 @@ from src.utils.helpers import (
     get_status_emoji,
     get_priority_emoji,
     format_date,
+    is_truncated,
     validate_required_field
 )
 from datetime import date, datetime
@@ -68,3 +69,9 @@ class TestHelperFunctions:
         """Test required field validation with whitespace."""
         result = validate_required_field("   ", "Field Name")
         assert result is False
+    
+    def test_is_truncated(self):
+        """Test detecting shortened preview text."""
+        assert is_truncated({'notes': 'abc', 'notes_length': 10}, 'notes')
+        assert not is_truncated({'notes': 'abc', 'notes_length': 3}, 'notes')
+        assert not is_truncated({'notes': None, 'notes_length': None}, 'notes')
@@ -0,0 +1,151 @@
+"""Unit tests for bulk imports."""
+import pytest
+import csv
+import json
+import os
+import shutil
+import tempfile
+from src.backend.database import importer
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.importer import import_file, load_rules, validate_chunk
+
+
+@pytest.fixture
+def workdir():
+    """Create a temporary directory for the database and input files."""
+    directory = tempfile.mkdtemp()
+
+    yield directory
+
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def db(workdir):
+    """Create an empty database."""
+    db_manager = DatabaseManager(os.path.join(workdir, 'shifts.db'))
+
+    yield db_manager
+
+    db_manager.close()
+
+
+def write_csv(path, rows, fieldnames=('trader_name', 'shift_date', 'notes')):
+    """Write dict rows to a CSV file."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_rejects(path):
+    """Read a rejects file."""
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestImport:
+    """Tests for validating and importing CSV/JSONL files."""
+
+    def test_rules_follow_schema(self, db):
+        """Test that NOT NULL and CHECK ... IN constraints are read from the schema."""
+        with db.get_connection() as conn:
+            rules = load_rules(conn, 'plant_status')
+
+        assert rules.required == {'shift_date', 'plant_name', 'status'}
+        assert rules.enums == {'status': {'operational', 'partial', 'offline'}}
+
+    def test_validate_chunk(self, db):
+        """Test that each invalid record is rejected with all of its errors."""
+        with db.get_connection() as conn:
+            rules = load_rules(conn, 'it_issues')
+        records = [
+            (2, {'title': ' VPN ', 'description': 'Down', 'status': 'open', 'shift_date': '2024-01-15'}),
+            (3, {'title': '', 'description': 'x', 'status': 'closed', 'shift_date': '2024-02-30'}),
+            (4, 'not json'),
+        ]
+
+        valid, rejects = validate_chunk('it_issues', rules, records)
+
+        assert valid == [('VPN', 'Down', 'open', '2024-01-15')]
+        assert [reject['line'] for reject in rejects] == [3, 4]
+        assert len(rejects[0]['errors']) == 3
+        assert rejects[1]['errors'][0] == "not a JSON object"
+
+    def test_csv_import_with_rejects(self, db, workdir):
+        """Test that valid rows are inserted and invalid ones written aside."""
+        path = os.path.join(workdir, 'logs.csv')
+        write_csv(path, [
+            {'trader_name': f"Trader {n}", 'shift_date': f"2024-01-{n:02d}", 'notes': f"Notes {n}"}
+            for n in range(1, 8)
+        ] + [{'trader_name': '', 'shift_date': '2024-01-09', 'notes': 'x'}])
+
+        result = import_file(db, 'handover_logs', path, chunk_size=3)
+
+        assert (result.records, result.inserted, result.rejected) == (8, 7, 1)
+        assert len(db.get_all_handover_logs(as_frame=False)) == 7
+        assert read_rejects(result.rejects_path)[0]['line'] == 9
+
+    def test_jsonl_import(self, db, workdir):
+        """Test importing notifications with their resolved flag."""
+        path = os.path.join(workdir, 'notifications.jsonl')
+        with open(path, 'w') as f:
+            f.write(json.dumps({'shift_date': '2024-01-15', 'title': 'T', 'message': 'M',
+                                'priority': 'high', 'is_resolved': True}) + '\n\n')
+            f.write(json.dumps({'shift_date': '2024-01-15', 'title': 'T', 'message': 'M',
+                                'priority': 'urgent'}) + '\n')
+
+        result = import_file(db, 'notifications', path)
+
+        notifications = db.get_all_notifications(columns=('id', 'is_resolved'), as_frame=False)
+        assert (result.inserted, result.rejected) == (1, 1)
+        assert notifications[0][1] == 1
+        assert read_rejects(result.rejects_path)[0]['line'] == 3
+
+    def test_missing_required_column(self, db, workdir):
+        """Test that a CSV without a required column is refused up front."""
+        path = os.path.join(workdir, 'comments.csv')
+        write_csv(path, [{'shift_date': '2024-01-15'}], ('shift_date',))
+
+        with pytest.raises(ValueError):
+            import_file(db, 'comments', path)
+
+    def test_resume_after_failure(self, db, workdir, monkeypatch):
+        """Test that a rerun continues after the last committed chunk."""
+        path = os.path.join(workdir, 'logs.csv')
+        write_csv(path, [
+            {'trader_name': 'T' if n % 4 else '', 'shift_date': '2024-01-15', 'notes': f"Notes {n}"}
+            for n in range(1, 11)
+        ])
+        original = importer.validate_chunk
+        calls = []
+
+        def fail_on_third_chunk(*args):
+            calls.append(1)
+            if len(calls) == 3:
+                raise RuntimeError("interrupted")
+            return original(*args)
+
+        monkeypatch.setattr(importer, 'validate_chunk', fail_on_third_chunk)
+        with pytest.raises(RuntimeError):
+            import_file(db, 'handover_logs', path, chunk_size=3)
+        monkeypatch.setattr(importer, 'validate_chunk', original)
+
+        result = import_file(db, 'handover_logs', path, chunk_size=3)
+
+        assert result.resumed_from == 6
+        assert (result.records, result.inserted, result.rejected) == (10, 8, 2)
+        assert len(db.get_all_handover_logs(as_frame=False)) == 8
+        assert [reject['line'] for reject in read_rejects(result.rejects_path)] == [5, 9]
+
+    def test_finished_job_is_not_repeated(self, db, workdir):
+        """Test that importing the same file twice inserts its rows once, unless restarted."""
+        path = os.path.join(workdir, 'logs.csv')
+        write_csv(path, [{'trader_name': 'T', 'shift_date': '2024-01-15', 'notes': 'N'}])
+
+        import_file(db, 'handover_logs', path)
+        again = import_file(db, 'handover_logs', path)
+        assert (again.resumed_from, len(db.get_all_handover_logs(as_frame=False))) == (1, 1)
+
+        import_file(db, 'handover_logs', path, restart=True)
+        assert len(db.get_all_handover_logs(as_frame=False)) == 2
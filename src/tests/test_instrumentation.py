@@ -0,0 +1,110 @@
+"""Unit tests for per-method instrumentation and the slow-query log."""
+import pytest
+import json
+import logging
+import os
+import shutil
+import tempfile
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.instrumentation import SIZE_SAMPLE_ROWS, QueryMetrics, measure_result
+
+
+@pytest.fixture
+def workdir():
+    """Create a temporary directory for the database."""
+    directory = tempfile.mkdtemp()
+
+    yield directory
+
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def db(workdir):
+    """Create a database that logs every call as slow."""
+    db_manager = DatabaseManager(os.path.join(workdir, 'shifts.db'), slow_query_ms=0)
+
+    yield db_manager
+
+    db_manager.close()
+
+
+class TestInstrumentation:
+    """Tests for call metrics and the slow-query log."""
+
+    def test_calls_rows_and_bytes_are_recorded(self, db):
+        """Test that each public call is counted with its rows and size."""
+        db.create_comment_many([(f"Comment {n}", "2024-01-15") for n in range(3)])
+        db.get_all_comments(as_frame=False)
+        db.get_all_comments(as_frame=False)
+
+        stats = db.metrics.snapshot()
+
+        assert stats['create_comment_many']['calls'] == 1
+        assert stats['get_all_comments']['calls'] == 2
+        assert stats['get_all_comments']['rows'] == 6
+        assert stats['get_all_comments']['bytes'] > 0
+        assert stats['get_all_comments']['latency']['count'] == 2
+
+    def test_errors_are_counted(self, db):
+        """Test that a failing call is recorded as an error."""
+        with pytest.raises(ValueError):
+            db.get_history('change_log')
+
+        assert db.metrics.snapshot()['get_history']['errors'] == 1
+
+    def test_slow_calls_log_sql_and_plan(self, db, caplog):
+        """Test that a slow call logs its statements with bound parameters and plans."""
+        db.create_comment("Slow", "2024-01-15")
+
+        with caplog.at_level(logging.WARNING, logger='src.backend.database.instrumentation'):
+            db.get_all_comments(as_frame=False)
+
+        message = caplog.records[-1].getMessage()
+        assert message.startswith("Slow call get_all_comments")
+        assert "FROM comments" in message
+        assert "SCAN" in message or "SEARCH" in message
+        assert db.metrics.snapshot()['get_all_comments']['slow_calls'] == 1
+
+    def test_disabled_slow_log(self, workdir, caplog):
+        """Test that no slow calls are logged without a threshold."""
+        db = DatabaseManager(os.path.join(workdir, 'quiet.db'))
+        try:
+            with caplog.at_level(logging.WARNING, logger='src.backend.database.instrumentation'):
+                db.get_all_comments(as_frame=False)
+        finally:
+            db.close()
+
+        assert not caplog.records
+        assert db.metrics.snapshot()['get_all_comments']['slow_calls'] == 0
+
+    def test_pipelined_writes_are_recorded_once(self, workdir):
+        """Test that a group-committed write is counted once, by its caller."""
+        db = DatabaseManager(os.path.join(workdir, 'pipeline.db'), group_commit_window=0.001)
+        try:
+            db.create_comment("Batched", "2024-01-15")
+        finally:
+            db.close()
+
+        assert db.metrics.snapshot()['create_comment']['calls'] == 1
+
+    def test_large_results_are_sampled(self):
+        """Test that sizes of long results are extrapolated from a sample."""
+        rows = [(n, "x" * 20) for n in range(SIZE_SAMPLE_ROWS * 10)]
+
+        count, size = measure_result(rows)
+
+        assert count == len(rows)
+        assert size > 10 * sum(len(str(row)) for row in rows[:SIZE_SAMPLE_ROWS])
+
+    def test_json_dump_and_reset(self):
+        """Test the JSON dump of the registry and resetting it."""
+        metrics = QueryMetrics(slow_query_ms=100)
+        metrics.record('get_comment', 0.003, rows=1, size=200)
+
+        dump = json.loads(metrics.to_json())
+        metrics.reset()
+
+        assert dump['slow_query_ms'] == 100
+        assert dump['methods']['get_comment']['latency']['count'] == 1
+        assert metrics.snapshot() == {}
@@ -0,0 +1,191 @@
+"""Unit tests for schema migrations."""
+import pytest
+import os
+import shutil
+import sqlite3
+import tempfile
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.migrator import BASELINE_SCHEMA, MIGRATIONS_DIR, MigrationError, Migrator, load_migrations, split_statements
+
+
+@pytest.fixture
+def db_path():
+    """Create a temporary database file path."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    yield path
+
+    os.unlink(path)
+
+
+# Version number for migrations written by these tests
+NEW_VERSION = load_migrations()[-1].version + 1
+
+
+@pytest.fixture
+def migrations_dir():
+    """Create a copy of the shipped migrations that tests can add to."""
+    with tempfile.TemporaryDirectory() as path:
+        for filename in os.listdir(MIGRATIONS_DIR):
+            if filename[:4].isdigit():
+                shutil.copy(os.path.join(MIGRATIONS_DIR, filename), path)
+        yield path
+    load_migrations.cache_clear()
+
+
+def write_migration(directory, name, content):
+    """Write migration NEW_VERSION and drop cached migration lists."""
+    with open(os.path.join(directory, f"{NEW_VERSION:04d}_{name}"), 'w') as f:
+        f.write(content)
+    load_migrations.cache_clear()
+
+
+class TestMigrator:
+    """Tests for applying numbered migrations."""
+
+    def test_new_database_is_migrated(self, db_path):
+        """Test that a new database gets the baseline schema and a version row."""
+        db = DatabaseManager(db_path)
+        migrator = Migrator(db.get_connection)
+
+        assert migrator.current_version() == len(migrator.migrations)
+        assert migrator.is_current()
+        db.close()
+
+    def test_current_database_takes_fast_path(self, db_path):
+        """Test that re-opening an up-to-date database applies nothing."""
+        DatabaseManager(db_path).close()
+        db = DatabaseManager(db_path)
+
+        assert Migrator(db.get_connection).migrate() == []
+        db.close()
+
+    def test_legacy_database_is_adopted(self, db_path):
+        """Test that a database created before versioning keeps its data."""
+        with open(BASELINE_SCHEMA) as f:
+            schema = f.read()
+        conn = sqlite3.connect(db_path)
+        conn.executescript(schema)
+        conn.execute("INSERT INTO comments (comment_text, shift_date) VALUES ('Old', '2023-01-01')")
+        conn.commit()
+        conn.close()
+
+        db = DatabaseManager(db_path)
+
+        assert len(db.get_all_comments()) == 1
+        assert Migrator(db.get_connection).is_current()
+        db.close()
+
+    def test_sql_migration(self, db_path, migrations_dir):
+        """Test that a numbered SQL migration is applied once."""
+        write_migration(migrations_dir, 'add_shift_label.sql',
+                        "ALTER TABLE handover_logs ADD COLUMN shift_label TEXT;\n")
+        db = DatabaseManager(db_path)
+        migrator = Migrator(db.get_connection, migrations_dir)
+
+        assert migrator.migrate() == [NEW_VERSION]
+        assert migrator.migrate() == []
+        with db.get_connection() as conn:
+            columns = [row['name'] for row in conn.execute("PRAGMA table_info(handover_logs)")]
+        assert 'shift_label' in columns
+        db.close()
+
+    def test_failed_migration_is_rolled_back(self, db_path, migrations_dir):
+        """Test that a failing migration leaves no partial schema change."""
+        write_migration(migrations_dir, 'broken.sql',
+                        "CREATE TABLE scratch (x INTEGER);\nSELECT * FROM missing_table;\n")
+        db = DatabaseManager(db_path)
+        migrator = Migrator(db.get_connection, migrations_dir)
+
+        with pytest.raises(sqlite3.OperationalError):
+            migrator.migrate()
+
+        assert migrator.current_version() == NEW_VERSION - 1
+        with db.get_connection() as conn:
+            assert conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE name = 'scratch'"
+            ).fetchone()[0] == 0
+        db.close()
+
+    def test_changed_migration_is_rejected(self, db_path, migrations_dir):
+        """Test that editing an applied migration is detected."""
+        write_migration(migrations_dir, 'scratch.sql', "CREATE TABLE scratch (x INTEGER);\n")
+        db = DatabaseManager(db_path)
+        Migrator(db.get_connection, migrations_dir).migrate()
+
+        write_migration(migrations_dir, 'scratch.sql', "CREATE TABLE scratch (y INTEGER);\n")
+        with pytest.raises(MigrationError):
+            Migrator(db.get_connection, migrations_dir).migrate()
+        db.close()
+
+    def test_python_migration_backfills_in_batches(self, db_path, migrations_dir):
+        """Test that a backfill updates every row across several batches."""
+        db = DatabaseManager(db_path)
+        for i in range(25):
+            db.create_handover_log(f"Trader {i}", "2024-01-15", "x" * i)
+
+        write_migration(migrations_dir, 'notes_length.py', '''
+def upgrade(conn):
+    conn.execute("ALTER TABLE handover_logs ADD COLUMN notes_length INTEGER")
+
+def backfill(migrator):
+    migrator.backfill("handover_logs", "notes_length = length(notes)",
+                      "notes_length IS NULL", batch_size=10, pause=0)
+''')
+        migrator = Migrator(db.get_connection, migrations_dir)
+
+        assert migrator.migrate() == [NEW_VERSION]
+        assert migrator.is_current()
+        with db.get_connection() as conn:
+            assert conn.execute(
+                "SELECT COUNT(*) FROM handover_logs WHERE notes_length = length(notes)"
+            ).fetchone()[0] == 25
+        db.close()
+
+    def test_interrupted_backfill_resumes(self, db_path, migrations_dir):
+        """Test that a backfill left incomplete is finished on the next run."""
+        db = DatabaseManager(db_path)
+        db.create_comment("Hello", "2024-01-15")
+        write_migration(migrations_dir, 'comment_length.py', '''
+def upgrade(conn):
+    conn.execute("ALTER TABLE comments ADD COLUMN text_length INTEGER")
+
+def backfill(migrator):
+    migrator.backfill("comments", "text_length = length(comment_text)", "text_length IS NULL")
+''')
+        migrator = Migrator(db.get_connection, migrations_dir)
+        migrator.migrate()
+        with db.get_connection(write=True) as conn:
+            conn.execute("UPDATE comments SET text_length = NULL")
+            conn.execute("UPDATE schema_version SET completed_at = NULL WHERE version = ?", (NEW_VERSION,))
+            conn.commit()
+
+        assert not migrator.is_current()
+        assert migrator.migrate() == [NEW_VERSION]
+        with db.get_connection() as conn:
+            assert conn.execute("SELECT text_length FROM comments").fetchone()[0] == 5
+        db.close()
+
+
+class TestSplitStatements:
+    """Tests for SQL script splitting."""
+
+    def test_split_keeps_triggers_whole(self):
+        """Test that statements inside a trigger body are not split."""
+        script = """
+-- Comment
+CREATE TABLE a (x);
+CREATE TRIGGER t AFTER INSERT ON a BEGIN
+    UPDATE a SET x = 1;
+END;
+-- Trailing comment
+"""
+        statements = split_statements(script)
+        assert len(statements) == 2
+        assert statements[1].endswith('END;')
+
+    def test_incomplete_statement(self):
+        """Test that an unterminated statement is rejected."""
+        with pytest.raises(MigrationError):
+            split_statements("CREATE TABLE a (x)")
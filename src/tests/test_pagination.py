@@ -0,0 +1,137 @@
+"""Unit tests for keyset pagination."""
+import pytest
+import os
+import tempfile
+from datetime import date
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.pagination import NEXT, date_cursor, decode_cursor, encode_cursor
+from src.benchmarks.page_benchmark import APP_PATH
+
+
+@pytest.fixture
+def db():
+    """Create a temporary database with 23 comments over several shifts."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    db_manager = DatabaseManager(path)
+    # Bulk inserted rows share created_at, so id decides their order
+    db_manager.create_comment_many(
+        (f"Comment {i}", f"2024-01-{10 + i % 5:02d}") for i in range(23)
+    )
+
+    yield db_manager
+
+    db_manager.close()
+    os.unlink(path)
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes to the key it was built from."""
+        cursor = encode_cursor(("2024-01-15", "2024-01-15 08:00:00", 7), NEXT)
+        assert decode_cursor(cursor) == (("2024-01-15", "2024-01-15 08:00:00", 7), NEXT)
+
+    def test_invalid_cursor(self):
+        """Test that a tampered cursor is rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestKeysetPagination:
+    """Tests for get_*_page methods."""
+
+    def test_first_page(self, db):
+        """Test that the first page has a next cursor and no previous cursor."""
+        page = db.get_comments_page(limit=10, with_total=True)
+
+        assert len(page.rows) == 10
+        assert page.next_cursor is not None
+        assert page.prev_cursor is None
+        assert page.total == 23
+
+    def test_walk_forward_matches_full_listing(self, db):
+        """Test that following next cursors visits every row once, in order."""
+        expected = db.get_all_comments()
+        expected = expected.sort_values(
+            ['shift_date', 'created_at', 'id'], ascending=False
+        )['id'].tolist()
+
+        seen = []
+        cursor = None
+        while True:
+            page = db.get_comments_page(limit=10, cursor=cursor)
+            seen.extend(page.rows['id'].tolist())
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert seen == expected
+        assert page.total is None
+
+    def test_previous_page(self, db):
+        """Test that the previous cursor returns the same rows as before."""
+        first = db.get_comments_page(limit=10)
+        second = db.get_comments_page(limit=10, cursor=first.next_cursor)
+        back = db.get_comments_page(limit=10, cursor=second.prev_cursor)
+
+        assert back.rows['id'].tolist() == first.rows['id'].tolist()
+        assert back.prev_cursor is None
+        assert back.next_cursor is not None
+
+    def test_empty_table(self, db):
+        """Test paging a table with no rows."""
+        page = db.get_it_issues_page()
+
+        assert page.rows.empty
+        assert page.next_cursor is None
+        assert page.prev_cursor is None
+
+    def test_row_tuples(self, db):
+        """Test that pages of row tuples match DataFrame pages."""
+        first = db.get_comments_page(limit=10, as_frame=False)
+        second = db.get_comments_page(limit=10, cursor=first.next_cursor, as_frame=False)
+        back = db.get_comments_page(limit=10, cursor=second.prev_cursor, as_frame=False)
+
+        assert [row.id for row in first.rows] == db.get_comments_page(limit=10).rows['id'].tolist()
+        assert [row.id for row in back.rows] == [row.id for row in first.rows]
+        assert second.next_cursor == db.get_comments_page(limit=10, cursor=first.next_cursor).next_cursor
+
+    def test_date_cursor(self, db):
+        """Test that a date cursor starts at the newest rows of that shift date."""
+        page = db.get_comments_page(limit=10, cursor=date_cursor(date(2024, 1, 12)), as_frame=False)
+
+        assert page.rows[0].shift_date == "2024-01-12"
+        assert all(row.shift_date <= "2024-01-12" for row in page.rows)
+        assert page.prev_cursor is not None
+
+
+class TestPagedList:
+    """Tests for the paged list on the CRUD pages."""
+
+    def test_comments_page(self, db, monkeypatch):
+        """Test that the Comments page renders one page and moves between pages."""
+        import streamlit as st
+        from streamlit.testing.v1 import AppTest
+
+        monkeypatch.setenv('DB_PATH', db.db_path)
+        st.cache_resource.clear()
+        at = AppTest.from_file(APP_PATH, default_timeout=30)
+        at.run()
+        at.sidebar.radio[0].set_value("💬 Comments").run()
+
+        def shown():
+            return [md.value for md in at.markdown if md.value.startswith("**📅")]
+
+        assert len(shown()) == 10
+        assert at.button(key='comments_newer').disabled
+        at.button(key='comments_older').click().run()
+        at.button(key='comments_older').click().run()
+        assert len(shown()) == 3
+        assert at.button(key='comments_older').disabled
+
+        at.selectbox(key='comments_size').set_value(25).run()
+        assert len(shown()) == 23
+        assert not at.exception
+        st.cache_resource.clear()
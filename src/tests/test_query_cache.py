@@ -0,0 +1,162 @@
+"""Unit tests for the write-invalidated read cache."""
+import pytest
+import os
+import tempfile
+import pandas as pd
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.query_cache import QueryCache, estimate_size
+
+
+@pytest.fixture
+def db():
+    """Create a temporary database for testing."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    db_manager = DatabaseManager(path)
+    
+    yield db_manager
+    
+    db_manager.close()
+    os.unlink(path)
+
+
+def checkouts(db):
+    """Number of connections handed out by the pool so far."""
+    return db.pool.stats()['checkouts']
+
+
+class TestQueryCache:
+    """Tests for QueryCache."""
+    
+    def test_generations_invalidate_entries(self):
+        """Test that bumping a table generation hides results read from it."""
+        cache = QueryCache()
+        generations = cache.generations(('comments',))
+        cache.put('key', ('comments',), generations, 'value')
+        
+        assert cache.get('key', cache.generations(('comments',))) == (True, 'value')
+        
+        cache.invalidate(['handover_logs'])
+        assert cache.get('key', cache.generations(('comments',))) == (True, 'value')
+        
+        cache.invalidate(['comments'])
+        assert cache.get('key', cache.generations(('comments',))) == (False, None)
+        assert cache.stats()['entries'] == 0
+    
+    def test_stale_result_not_stored(self):
+        """Test that a result read before a concurrent write is discarded."""
+        cache = QueryCache()
+        generations = cache.generations(('comments',))
+        cache.invalidate(['comments'])
+        cache.put('key', ('comments',), generations, 'old value')
+        
+        assert cache.stats()['entries'] == 0
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        size = estimate_size('x' * 100)
+        cache = QueryCache(max_bytes=size * 2)
+        for key in ('a', 'b'):
+            cache.put(key, ('t',), (0,), 'x' * 100)
+        cache.get('a', (0,))
+        cache.put('c', ('t',), (0,), 'x' * 100)
+        
+        assert cache.get('b', (0,)) == (False, None)
+        assert cache.get('a', (0,))[0]
+        assert cache.get('c', (0,))[0]
+        assert cache.stats()['evictions'] == 1
+        assert cache.stats()['bytes'] <= cache.max_bytes
+    
+    def test_stats(self):
+        """Test hit and miss counters."""
+        cache = QueryCache()
+        cache.get('key', (0,))
+        cache.put('key', ('t',), (0,), 1)
+        cache.get('key', (0,))
+        
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 0.5)
+        
+        cache.clear()
+        assert cache.stats()['hits'] == 0
+
+
+class TestDatabaseManagerCache:
+    """Tests for caching in DatabaseManager."""
+    
+    def test_repeated_read_skips_database(self, db):
+        """Test that a repeated read is answered without a connection."""
+        db.create_comment("Comment", "2024-01-15")
+        db.get_all_comments()
+        before = checkouts(db)
+        
+        comments = db.get_all_comments()
+        
+        assert len(comments) == 1
+        assert checkouts(db) == before
+        assert db.cache.stats()['hits'] == 1
+    
+    def test_write_invalidates_only_its_table(self, db):
+        """Test that writes drop cached reads of the tables they change."""
+        db.get_all_comments()
+        db.get_all_handover_logs()
+        
+        db.create_comment("Comment", "2024-01-15")
+        before = checkouts(db)
+        db.get_all_handover_logs()
+        assert checkouts(db) == before
+        
+        assert len(db.get_all_comments()) == 1
+        assert checkouts(db) == before + 1
+    
+    def test_dependent_reads_invalidated(self, db):
+        """Test that reads spanning tables follow writes to each of them."""
+        assert db.get_dashboard_snapshot().critical_count == 0
+        assert db.search("outage") == []
+        
+        db.create_notification("Outage", "Message", "critical", "2024-01-15")
+        
+        assert db.get_dashboard_snapshot().critical_count == 1
+        assert len(db.search("outage")) == 1
+    
+    def test_direct_write_invalidates_everything(self, db):
+        """Test that writes through get_connection clear the cache."""
+        db.get_all_comments()
+        with db.get_connection(write=True) as conn:
+            conn.execute("INSERT INTO comments (comment_text, shift_date) VALUES ('Direct', '2024-01-15')")
+            conn.commit()
+        
+        assert len(db.get_all_comments()) == 1
+    
+    def test_results_are_detached(self, db):
+        """Test that modifying a returned DataFrame leaves the cache intact."""
+        db.create_comment("Comment", "2024-01-15")
+        comments = db.get_all_comments()
+        comments['extra'] = 1
+        comments.drop(comments.index, inplace=True)
+        
+        cached = db.get_all_comments()
+        assert len(cached) == 1
+        assert 'extra' not in cached.columns
+    
+    def test_filters_are_part_of_the_key(self, db):
+        """Test that different arguments are cached separately."""
+        db.create_it_issue("Issue", "Description", "open", "2024-01-15")
+        
+        assert len(db.get_it_issues_page(limit=10).rows) == 1
+        assert len(db.get_it_issues_page(limit=10, cursor=None, with_total=True).rows) == 1
+        assert db.get_all_it_issues().equals(db.get_all_it_issues())
+        assert db.cache.stats()['entries'] == 3
+    
+    def test_cache_disabled(self):
+        """Test that cache_bytes=0 turns caching off."""
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        db_manager = DatabaseManager(path, cache_bytes=0)
+        try:
+            assert db_manager.cache is None
+            db_manager.create_comment("Comment", "2024-01-15")
+            assert isinstance(db_manager.get_all_comments(), pd.DataFrame)
+        finally:
+            db_manager.close()
+            os.unlink(path)
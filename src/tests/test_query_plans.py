@@ -0,0 +1,247 @@
+"""Index-usage tests for every DatabaseManager query."""
+import pytest
+import os
+import tempfile
+from src.backend.database.connection_pool import ConnectionPool
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.edits import ChangeSet
+from src.backend.database.filters import ListFilter
+from src.backend.database.pagination import NEXT, PREV, encode_cursor
+
+NEXT_CURSOR = encode_cursor(("2024-01-15", "2024-01-15 08:00:00", 5), NEXT)
+PREV_CURSOR = encode_cursor(("2024-01-15", "2024-01-15 08:00:00", 5), PREV)
+
+# Arguments for every DatabaseManager data method. A new query method must be
+# added here, otherwise test_every_method_is_covered fails.
+METHOD_CALLS = {
+    'create_handover_log': ("Trader", "2024-01-15", "Notes"),
+    'create_handover_log_many': ([("Trader", "2024-01-15", "Notes")],),
+    'get_all_handover_logs': (),
+    'get_handover_log': (1,),
+    'get_handover_logs_page': (10, NEXT_CURSOR, True),
+    'get_handover_logs_updated_since': ("2024-01-15 08:00:00",),
+    'get_recent_handover_logs': (5,),
+    'update_handover_log': (1, "Trader", "2024-01-15", "Notes"),
+    'update_handover_log_many': ([(1, "Trader", "2024-01-15", "Notes")],),
+    'delete_handover_log': (1,),
+    'delete_handover_log_many': ([1, 2],),
+    'create_power_position': ("2024-01-15", "Long 100MW", "Balanced"),
+    'create_power_position_many': ([("2024-01-15", "Long 100MW", "Balanced")],),
+    'get_all_power_positions': (),
+    'get_power_position': (1,),
+    'get_power_positions_page': (10, NEXT_CURSOR, True),
+    'get_power_positions_updated_since': ("2024-01-15 08:00:00",),
+    'get_latest_power_position': (),
+    'update_power_position': (1, "2024-01-15", "Long 100MW", "Balanced"),
+    'update_power_position_many': ([(1, "2024-01-15", "Long 100MW", "Balanced")],),
+    'delete_power_position': (1,),
+    'delete_power_position_many': ([1, 2],),
+    'create_gas_position': ("2024-01-15", "Long 500 therm", "Balanced"),
+    'create_gas_position_many': ([("2024-01-15", "Long 500 therm", "Balanced")],),
+    'get_all_gas_positions': (),
+    'get_gas_position': (1,),
+    'get_gas_positions_page': (10, NEXT_CURSOR, True),
+    'get_gas_positions_updated_since': ("2024-01-15 08:00:00",),
+    'get_latest_gas_position': (),
+    'update_gas_position': (1, "2024-01-15", "Long 500 therm", "Balanced"),
+    'update_gas_position_many': ([(1, "2024-01-15", "Long 500 therm", "Balanced")],),
+    'delete_gas_position': (1,),
+    'delete_gas_position_many': ([1, 2],),
+    'create_plant_status': ("Plant A", "operational", "", "2024-01-15"),
+    'create_plant_status_many': ([("Plant A", "operational", "", "2024-01-15")],),
+    'get_all_plant_status': (),
+    'get_plant_status': (1,),
+    'get_plant_status_page': (10, NEXT_CURSOR, True),
+    'get_plant_status_updated_since': ("2024-01-15 08:00:00",),
+    'update_plant_status': (1, "Plant A", "offline", "", "2024-01-15"),
+    'update_plant_status_many': ([(1, "Plant A", "offline", "", "2024-01-15")],),
+    'delete_plant_status': (1,),
+    'delete_plant_status_many': ([1, 2],),
+    'create_power_system_status': ("Grid", "Normal", "", "2024-01-15"),
+    'create_power_system_status_many': ([("Grid", "Normal", "", "2024-01-15")],),
+    'get_all_power_system_status': (),
+    'get_power_system_status': (1,),
+    'get_power_system_status_page': (10, NEXT_CURSOR, True),
+    'get_power_system_status_updated_since': ("2024-01-15 08:00:00",),
+    'update_power_system_status': (1, "Grid", "Degraded", "", "2024-01-15"),
+    'update_power_system_status_many': ([(1, "Grid", "Degraded", "", "2024-01-15")],),
+    'delete_power_system_status': (1,),
+    'delete_power_system_status_many': ([1, 2],),
+    'create_notification': ("Alert", "Message", "critical", "2024-01-15"),
+    'create_notification_many': ([("Alert", "Message", "critical", "2024-01-15")],),
+    'get_all_notifications': (),
+    'get_notification': (1,),
+    'get_notifications_page': (10, NEXT_CURSOR, True),
+    'get_notifications_updated_since': ("2024-01-15 08:00:00",),
+    'get_unresolved_notifications': (),
+    'get_critical_notifications_count': (),
+    'get_dashboard_snapshot': (),
+    'update_notification': (1, "Alert", "Message", "high", "2024-01-15", False),
+    'update_notification_many': ([(1, "Alert", "Message", "high", "2024-01-15", False)],),
+    'resolve_notification': (1,),
+    'delete_notification': (1,),
+    'delete_notification_many': ([1, 2],),
+    'create_it_issue': ("Issue", "Description", "open", "2024-01-15"),
+    'create_it_issue_many': ([("Issue", "Description", "open", "2024-01-15")],),
+    'get_all_it_issues': (),
+    'get_it_issue': (1,),
+    'get_it_issues_page': (10, NEXT_CURSOR, True),
+    'get_it_issues_updated_since': ("2024-01-15 08:00:00",),
+    'get_open_it_issues_count': (),
+    'update_it_issue': (1, "Issue", "Description", "resolved", "2024-01-15"),
+    'update_it_issue_many': ([(1, "Issue", "Description", "resolved", "2024-01-15")],),
+    'delete_it_issue': (1,),
+    'delete_it_issue_many': ([1, 2],),
+    'create_competitor_activity': ("Competitor", "Details", "2024-01-15"),
+    'create_competitor_activity_many': ([("Competitor", "Details", "2024-01-15")],),
+    'get_all_competitor_activity': (),
+    'get_competitor_activity': (1,),
+    'get_competitor_activity_page': (10, NEXT_CURSOR, True),
+    'get_competitor_activity_updated_since': ("2024-01-15 08:00:00",),
+    'update_competitor_activity': (1, "Competitor", "Details", "2024-01-15"),
+    'update_competitor_activity_many': ([(1, "Competitor", "Details", "2024-01-15")],),
+    'delete_competitor_activity': (1,),
+    'delete_competitor_activity_many': ([1, 2],),
+    'create_comment': ("Comment", "2024-01-15"),
+    'create_comment_many': ([("Comment", "2024-01-15")],),
+    'get_all_comments': (),
+    'get_comment': (1,),
+    'get_comments_page': (10, NEXT_CURSOR, True),
+    'get_comments_updated_since': ("2024-01-15 08:00:00",),
+    'update_comment': (1, "Comment", "2024-01-15"),
+    'update_comment_many': ([(1, "Comment", "2024-01-15")],),
+    'delete_comment': (1,),
+    'delete_comment_many': ([1, 2],),
+    'get_changes_since': (10,),
+    'get_latest_change_seq': (),
+    'get_history': ('notifications', ListFilter(date_from="2024-01-01", date_to="2024-12-31")),
+    'search': ("outage", ['notifications', 'it_issues'], ("2024-01-01", "2024-12-31")),
+    'apply_changes': ('notifications', ChangeSet(
+        [{'title': "Title", 'message': "Message", 'priority': "low", 'shift_date': "2024-01-15"}],
+        [{'id': 1, 'is_resolved': 1}], [2]
+    ), 0),
+}
+
+# Methods that do not query application tables
+NON_QUERY_METHODS = {'get_connection', 'get_pragma_settings', 'init_database', 'close'}
+
+
+def data_methods():
+    """List the public DatabaseManager methods that run queries."""
+    return sorted(
+        name for name in dir(DatabaseManager)
+        if not name.startswith('_')
+        and callable(getattr(DatabaseManager, name))
+        and name not in NON_QUERY_METHODS
+    )
+
+
+@pytest.fixture
+def traced_db(monkeypatch):
+    """Create a database whose pooled connections record executed SQL."""
+    statements = []
+    original_open = ConnectionPool._open
+
+    def traced_open(pool, *args, **kwargs):
+        conn = original_open(pool, *args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(ConnectionPool, '_open', traced_open)
+
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    db_manager = DatabaseManager(path)
+
+    yield db_manager, statements
+
+    db_manager.close()
+    os.unlink(path)
+
+
+def query_plan(db, sql):
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement."""
+    with db.get_connection() as conn:
+        return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+
+
+def is_fts_internal(sql):
+    """Return True for statements FTS5 runs against its own shadow tables."""
+    return "'main'." in sql
+
+
+def is_full_scan(detail):
+    """Return True for a plan step that reads a table without an index."""
+    return (
+        detail.startswith('SCAN')
+        and 'USING' not in detail
+        and detail != 'SCAN CONSTANT ROW'
+        and 'VIRTUAL TABLE INDEX' not in detail
+    )
+
+
+class TestQueryPlans:
+    """Every DatabaseManager query must be served by an index."""
+
+    def test_every_method_is_covered(self):
+        """Test that METHOD_CALLS lists every data method."""
+        assert sorted(METHOD_CALLS) == data_methods()
+
+    @pytest.mark.parametrize('method', sorted(METHOD_CALLS))
+    def test_query_uses_index(self, traced_db, method):
+        """Test that a method's queries avoid table scans and temp B-trees."""
+        db, statements = traced_db
+        statements.clear()
+
+        getattr(db, method)(*METHOD_CALLS[method])
+
+        queries = [
+            sql for sql in statements
+            if sql.lstrip().split(None, 1)[0].upper() in ('SELECT', 'UPDATE', 'DELETE')
+            and not is_fts_internal(sql)
+        ]
+        if not method.startswith('create_'):
+            assert queries, f"{method} executed no queries"
+
+        for sql in queries:
+            for detail in query_plan(db, sql):
+                assert not is_full_scan(detail), f"{method}: {detail}\n{sql}"
+                assert 'TEMP B-TREE' not in detail, f"{method}: {detail}\n{sql}"
+
+    @pytest.mark.parametrize('method', sorted(m for m in METHOD_CALLS if m.endswith('_page')))
+    def test_previous_page_uses_index(self, traced_db, method):
+        """Test that paging backwards walks the index instead of sorting."""
+        db, statements = traced_db
+        statements.clear()
+
+        getattr(db, method)(10, PREV_CURSOR)
+
+        for sql in statements:
+            for detail in query_plan(db, sql):
+                assert not is_full_scan(detail), f"{method}: {detail}\n{sql}"
+                assert 'TEMP B-TREE' not in detail, f"{method}: {detail}\n{sql}"
+
+    @pytest.mark.parametrize('method, filters', [
+        ('get_all_handover_logs', ListFilter(text="outage", date_from="2024-01-01", date_to="2024-01-31")),
+        ('get_all_notifications', ListFilter(resolved=False, priorities=('critical', 'high'))),
+        ('get_all_it_issues', ListFilter(statuses=('open', 'in_progress'))),
+        ('get_all_competitor_activity', ListFilter(text="volume")),
+        ('get_comments_page', ListFilter(text="outage")),
+    ])
+    def test_filtered_query_uses_index(self, traced_db, method, filters):
+        """Test that filtered list queries avoid table scans and unbounded sorts.
+
+        A multi-value IN filter can be served by an index search whose
+        matches are then sorted; that sort only covers the matching rows.
+        """
+        db, statements = traced_db
+        statements.clear()
+
+        getattr(db, method)(filters=filters)
+
+        for sql in statements:
+            plan = query_plan(db, sql)
+            for detail in plan:
+                assert not is_full_scan(detail), f"{method}: {detail}\n{sql}"
+            if any('TEMP B-TREE' in detail for detail in plan):
+                assert any(detail.startswith('SEARCH') for detail in plan), f"{method}: {plan}\n{sql}"
@@ -0,0 +1,169 @@
+"""Unit tests for lock-error retries and contention metrics."""
+import pytest
+import os
+import sqlite3
+import tempfile
+import threading
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.metrics import Histogram
+from src.backend.database.retry import READ, ContentionMetrics, RetryPolicy, is_lock_error, retry_on_lock
+
+
+@pytest.fixture
+def db_path():
+    """Create a temporary database file path."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    yield path
+
+    os.unlink(path)
+
+
+def make_db(db_path, **policy):
+    """Create a manager whose writer fails at once on a lock instead of waiting."""
+    db = DatabaseManager(db_path, retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.01, **policy))
+    with db.get_connection(write=True) as conn:
+        conn.execute("PRAGMA busy_timeout = 0")
+    return db
+
+
+def hold_write_lock(db_path, seconds):
+    """Hold the database write lock from another connection for a while."""
+    other = sqlite3.connect(db_path, check_same_thread=False)
+    other.execute("BEGIN IMMEDIATE")
+    released = threading.Event()
+
+    def release():
+        other.rollback()
+        other.close()
+        released.set()
+
+    timer = threading.Timer(seconds, release)
+    timer.start()
+    return released
+
+
+class FlakyReader:
+    """Stand-in manager whose read fails on a lock a given number of times."""
+
+    write_pipeline = None
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+        self.retry_policy = RetryPolicy(base_delay=0.001, max_delay=0.001, read_deadline=1.0)
+        self.contention = ContentionMetrics()
+
+    def read(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise sqlite3.OperationalError("database is locked")
+        return "rows"
+
+    read = retry_on_lock(read, READ)
+
+
+class TestLockErrors:
+    """Tests for lock error classification."""
+
+    def test_is_lock_error(self):
+        """Test that only busy/locked errors are retried."""
+        assert is_lock_error(sqlite3.OperationalError("database is locked"))
+        assert not is_lock_error(sqlite3.OperationalError("no such table: missing"))
+        assert not is_lock_error(sqlite3.IntegrityError("NOT NULL constraint failed"))
+
+    def test_read_is_retried(self):
+        """Test that a read succeeds after transient lock errors."""
+        reader = FlakyReader(failures=2)
+
+        assert reader.read() == "rows"
+        assert reader.calls == 3
+        stats = reader.contention.stats()['read']
+        assert stats['lock_errors'] == 2
+        assert stats['recovered_calls'] == 1
+        assert stats['lock_wait']['count'] == 1
+
+
+class TestDatabaseManagerRetry:
+    """Tests for retries of DatabaseManager writes."""
+
+    def test_write_waits_for_lock(self, db_path):
+        """Test that a write retries until another connection releases the lock."""
+        db = make_db(db_path)
+        released = hold_write_lock(db_path, 0.2)
+
+        comment_id = db.create_comment("Comment", "2024-01-15")
+
+        assert released.is_set()
+        assert db.get_comment(comment_id)['comment_text'] == "Comment"
+        stats = db.contention.stats()['write']
+        assert stats['lock_errors'] >= 1
+        assert stats['recovered_calls'] == 1
+        assert stats['lock_wait']['max_ms'] >= 150
+        db.close()
+
+    def test_write_gives_up_at_deadline(self, db_path):
+        """Test that the lock error is raised once the deadline passes."""
+        db = make_db(db_path, write_deadline=0.05)
+        released = hold_write_lock(db_path, 0.5)
+
+        with pytest.raises(sqlite3.OperationalError):
+            db.create_comment("Comment", "2024-01-15")
+
+        assert db.contention.stats()['write']['failed_calls'] == 1
+        released.wait()
+        assert db.get_all_comments(as_frame=False) == []
+        db.close()
+
+    def test_checkout_waits_are_recorded(self, db_path):
+        """Test that pool checkout times are recorded per kind."""
+        db = DatabaseManager(db_path)
+        db.create_comment("Comment", "2024-01-15")
+        db.get_all_comments()
+
+        stats = db.contention.stats()
+        assert stats['write']['checkout_wait']['count'] >= 1
+        assert stats['read']['checkout_wait']['count'] >= 1
+        db.close()
+
+    def test_retry_replays_generator_rows(self, db_path, monkeypatch):
+        """Test that a retried bulk write sees every row of a generator again."""
+        db = make_db(db_path)
+        chunks = DatabaseManager._chunks
+        failures = [sqlite3.OperationalError("database is locked")]
+
+        def flaky_chunks(rows, chunk_size):
+            for i, chunk in enumerate(chunks(rows, chunk_size)):
+                if i == 1 and failures:
+                    raise failures.pop()
+                yield chunk
+
+        monkeypatch.setattr(DatabaseManager, '_chunks', staticmethod(flaky_chunks))
+
+        ids = db.create_comment_many(((f"Comment {i}", "2024-01-15") for i in range(5)), chunk_size=3)
+
+        assert len(ids) == 5
+        assert len(db.get_all_comments(as_frame=False)) == 5
+        assert db.contention.stats()['write']['recovered_calls'] == 1
+        db.close()
+
+
+class TestHistogram:
+    """Tests for duration histograms."""
+
+    def test_buckets_and_quantiles(self):
+        """Test bucket counts and quantile estimates."""
+        histogram = Histogram(buckets_ms=(1, 10, 100))
+        for seconds in (0.0005, 0.005, 0.005, 0.05, 0.5):
+            histogram.observe(seconds)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot['count'] == 5
+        assert snapshot['buckets'] == {'<=1ms': 1, '<=10ms': 2, '<=100ms': 1, '>100ms': 1}
+        assert snapshot['p50_ms'] == 10
+        assert snapshot['max_ms'] == pytest.approx(500)
+        assert histogram.quantile(1.0) == pytest.approx(500)
+        assert Histogram().quantile(0.5) == 0.0
+
@@ -0,0 +1,104 @@
+"""Unit tests for full-text search."""
+import pytest
+import os
+import tempfile
+from src.backend.database.db_manager import DatabaseManager
+from src.backend.database.migrator import Migrator
+from src.backend.database.search import build_match_query, parse_snippet
+
+
+@pytest.fixture
+def db():
+    """Create a temporary database with rows in several sections."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    db_manager = DatabaseManager(path)
+    db_manager.create_handover_log("John Doe", "2023-12-20", "Gas outage at the terminal overnight")
+    db_manager.create_notification("Outage alert", "Interconnector tripped", "critical", "2024-01-10")
+    db_manager.create_it_issue("ETRM slow", "Trade capture latency after outage", "open", "2024-01-12")
+    db_manager.create_comment("Quiet shift, nothing to report", "2024-01-15")
+
+    yield db_manager
+
+    db_manager.close()
+    os.unlink(path)
+
+
+class TestMatchQuery:
+    """Tests for turning user input into MATCH expressions."""
+
+    def test_words_are_quoted(self):
+        """Test that FTS5 syntax in user input is treated as plain words."""
+        assert build_match_query('outage AND "x" OR') == '"outage" "AND" "x" "OR"*'
+
+    def test_empty_query(self):
+        """Test that input without words produces no query."""
+        assert build_match_query("  -- ") is None
+
+    def test_parse_snippet(self):
+        """Test that highlight markers become offsets."""
+        assert parse_snippet("Gas \x02outage\x03 today") == ("Gas outage today", ((4, 10),))
+
+
+class TestSearch:
+    """Tests for DatabaseManager.search."""
+
+    def test_search_across_sections(self, db):
+        """Test that one query finds matches in every section."""
+        hits = db.search("outage")
+
+        assert {hit.table for hit in hits} == {'handover_logs', 'notifications', 'it_issues'}
+        for hit in hits:
+            start, end = hit.highlights[0]
+            assert hit.snippet[start:end].lower().startswith('outage')
+
+    def test_prefix_and_stemming(self, db):
+        """Test that partial last words and word forms match."""
+        assert len(db.search("outages")) == 3
+        assert [hit.table for hit in db.search("intercon")] == ['notifications']
+
+    def test_table_and_date_filters(self, db):
+        """Test restricting hits by table and shift date."""
+        hits = db.search("outage", tables=['notifications', 'handover_logs'], date_range=("2024-01-01", None))
+
+        assert [hit.table for hit in hits] == ['notifications']
+
+    def test_unknown_table(self, db):
+        """Test that an unknown table name is rejected."""
+        with pytest.raises(ValueError):
+            db.search("outage", tables=['trades'])
+
+    def test_index_follows_updates_and_deletes(self, db):
+        """Test that triggers keep the index in sync with the tables."""
+        comment_id = db.create_comment("Pipeline maintenance", "2024-01-16")
+        assert len(db.search("pipeline")) == 1
+
+        db.update_comment(comment_id, "Compressor maintenance", "2024-01-16")
+        assert db.search("pipeline") == []
+        assert db.search("compressor")[0].row_id == comment_id
+
+        db.delete_comment(comment_id)
+        assert db.search("compressor") == []
+
+    def test_bulk_writes_are_indexed(self, db):
+        """Test that bulk inserts are searchable."""
+        db.create_competitor_activity_many([
+            ("Competitor A", "Bought peak power", "2024-01-15"),
+            ("Competitor B", "Sold peak gas", "2024-01-15"),
+        ])
+
+        assert len(db.search("peak")) == 2
+
+    def test_backfill_indexes_existing_rows(self, db):
+        """Test that the migration backfill indexes rows missing from the index."""
+        with db.get_connection(write=True) as conn:
+            conn.execute("DELETE FROM search_index")
+            conn.execute(
+                "UPDATE schema_version SET completed_at = NULL WHERE name = 'full_text_search'"
+            )
+            conn.commit()
+        assert db.search("outage") == []
+
+        Migrator(db.get_connection).migrate()
+
+        assert len(db.search("outage")) == 3
@@ -0,0 +1,115 @@
+"""Unit tests for the group-commit write pipeline."""
+import pytest
+import os
+import sqlite3
+import tempfile
+import threading
+from src.backend.database.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db_path():
+    """Create a temporary database file path."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    yield path
+
+    os.unlink(path)
+
+
+@pytest.fixture
+def db(db_path):
+    """Create a database whose writes go through a 50 ms group-commit window."""
+    db_manager = DatabaseManager(db_path, group_commit_window=0.05)
+
+    yield db_manager
+
+    db_manager.close()
+
+
+class TestWritePipeline:
+    """Tests for group-committed writes."""
+
+    def test_write_methods_return_results(self, db):
+        """Test that pipelined methods keep their synchronous results."""
+        log_id = db.create_handover_log("Trader", "2024-01-15", "Notes")
+        db.update_handover_log(log_id, "Trader", "2024-01-15", "Edited")
+
+        assert db.get_handover_log(log_id)['notes'] == "Edited"
+        assert db.delete_comment_many([]) == 0
+        assert db.write_pipeline.stats()['calls'] == 3
+
+    def test_concurrent_writes_share_a_commit(self, db):
+        """Test that writes arriving together are committed in one batch."""
+        barrier = threading.Barrier(8)
+        ids = []
+
+        def write(n):
+            barrier.wait()
+            ids.append(db.create_comment(f"Comment {n}", "2024-01-15"))
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = db.write_pipeline.stats()
+        assert len(set(ids)) == 8
+        assert len(db.get_all_comments(as_frame=False)) == 8
+        assert stats['calls'] == 8
+        assert stats['batches'] < 8
+
+    def test_failed_call_does_not_affect_batch(self, db):
+        """Test that one failing call is rolled back on its own."""
+        pipeline = db.write_pipeline
+        first = pipeline.submit('create_handover_log', "Trader", "2024-01-15", "First")
+        bad = pipeline.submit('create_handover_log', None, "2024-01-15", "Bad")
+        last = pipeline.submit('create_handover_log', "Trader", "2024-01-15", "Last")
+
+        assert first.result() < last.result()
+        with pytest.raises(sqlite3.IntegrityError):
+            bad.result()
+        assert sorted(row.notes for row in db.get_all_handover_logs(as_frame=False)) == ["First", "Last"]
+        assert pipeline.stats()['failed_calls'] == 1
+
+    def test_calls_run_in_submission_order(self, db):
+        """Test that queued calls keep the order they were submitted in."""
+        pipeline = db.write_pipeline
+        created = pipeline.submit('create_notification', "Alert", "Message", "high", "2024-01-15")
+        notif_id = created.result()
+        futures = [
+            pipeline.submit('update_notification', notif_id, "Alert", "First", "high", "2024-01-15", False),
+            pipeline.submit('resolve_notification', notif_id),
+            pipeline.submit('update_notification', notif_id, "Alert", "Last", "low", "2024-01-15", False),
+        ]
+        for future in futures:
+            future.result()
+
+        notification = db.get_notification(notif_id)
+        assert (notification['message'], notification['is_resolved']) == ("Last", 0)
+
+    def test_reads_see_committed_batch(self, db):
+        """Test that cached reads are refreshed once a batch commits."""
+        assert len(db.get_all_comments()) == 0
+
+        db.create_comment("Comment", "2024-01-15")
+
+        assert len(db.get_all_comments()) == 1
+
+    def test_submit_rejects_read_methods(self, db):
+        """Test that only write methods can be queued."""
+        with pytest.raises(ValueError):
+            db.write_pipeline.submit('get_all_comments')
+
+    def test_close_runs_queued_calls(self, db_path):
+        """Test that closing the manager finishes queued writes first."""
+        db = DatabaseManager(db_path, group_commit_window=0.05)
+        futures = [db.write_pipeline.submit('create_comment', f"Comment {n}", "2024-01-15") for n in range(5)]
+
+        db.close()
+
+        assert all(future.done() and future.exception() is None for future in futures)
+        with pytest.raises(RuntimeError):
+            db.write_pipeline.submit('create_comment', "Late", "2024-01-15")
@@ -1,7 +1,11 @@
 """Helper functions for the shift handover application."""
 from datetime import datetime, date
+from typing import Callable, Optional
 import streamlit as st
 
+# Characters of long text loaded for list views; full text is loaded by id
+PREVIEW_CHARS = 300
+
 
 def get_status_color(status: str) -> str:
     """Get color for status indicator.
@@ -164,3 +168,45 @@ def get_status_emoji(status: str) -> str:
         'resolved': '✅'
     }
     return status_emojis.get(status.lower(), '⚪')
+
+
+def is_truncated(row, column: str) -> bool:
+    """Check whether a preview column was cut short.
+    
+    Args:
+        row: Row read with a preview, carrying a <column>_length value
+        column: Name of the long text column
+        
+    Returns:
+        True if the full text is longer than the preview
+    """
+    length = row[f'{column}_length']
+    text = row[column]
+    return length is not None and text is not None and length > len(text)
+
+
+def full_text(row, column: str, load_row: Callable[[int], Optional[dict]], key: str,
+              label: str = "Show full text") -> str:
+    """Get the text of a preview column, loading the rest only on request.
+    
+    A toggle is shown for truncated text; when it is on, the full row is
+    loaded by id.
+    
+    Args:
+        row: Row read with a preview
+        column: Name of the long text column
+        load_row: Method loading a full row by id, e.g. db.get_handover_log
+        key: Unique widget key for the toggle
+        label: Toggle label
+        
+    Returns:
+        Full text, or the preview followed by an ellipsis
+    """
+    text = row[column] or ''
+    if not is_truncated(row, column):
+        return text
+    if st.toggle(label, key=key):
+        full = load_row(int(row['id']))
+        if full is not None:
+            return full[column] or ''
+    return text + '...'